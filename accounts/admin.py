@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
-from .models import User, UserOTP, UserProfile, UserRole, MediaStorage, Interest, PreferredContributionPath, Affiliation, VerificationDocument
+from .models import User, UserOTP, UserProfile, UserRole, MediaStorage, Interest, PreferredContributionPath, Affiliation, VerificationDocument, DailyMetrics
 
 
 class CustomUserAdmin(BaseUserAdmin):
@@ -255,6 +255,15 @@ class VerificationDocumentAdmin(admin.ModelAdmin):
     document_url_preview.short_description = 'DOCUMENT URL'
 
 
+class DailyMetricsAdmin(admin.ModelAdmin):
+    list_display = ['date', 'signups', 'total_users', 'active_users', 'intel_created', 'exchanges_created',
+                    'follows_created', 'notifications_sent', 'notifications_read', 'donations_count', 'updated_at']
+    date_hierarchy = 'date'
+    ordering = ['-date']
+    readonly_fields = [field.name for field in DailyMetrics._meta.fields]
+    list_per_page = 31
+
+
 # Register your models here.
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(UserOTP)
@@ -264,4 +273,5 @@ admin.site.register(MediaStorage, MediaStorageAdmin)
 admin.site.register(Interest, InterestAdmin)
 admin.site.register(PreferredContributionPath, PreferredContributionPathAdmin)
 admin.site.register(Affiliation, AffiliationAdmin)
-admin.site.register(VerificationDocument, VerificationDocumentAdmin)
\ No newline at end of file
+admin.site.register(VerificationDocument, VerificationDocumentAdmin)
+admin.site.register(DailyMetrics, DailyMetricsAdmin)
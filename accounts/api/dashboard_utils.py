@@ -0,0 +1,258 @@
+"""
+Dashboard statistics engine shared by the dashboard stats API and the admin dashboard.
+
+Statistics are read from the ``DailyMetrics`` rollups (see ``metrics_utils``): sign-up
+series are bucketed from the daily rows and totals come from the latest snapshot, so
+the cost does not grow with the size of the source tables. Sign-ups on days without
+a rollup row (today, missed runs, history before the first run) are counted live. Before the first rollup
+has run they are computed live, with one ``GROUP BY`` per sign-up granularity and a
+single conditional aggregate per table. The whole payload is cached: fresh results
+are served directly, stale results are served while a background thread recomputes
+them.
+"""
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+from accounts.models import DailyMetrics, User
+from accounts.api.metrics_utils import compute_snapshot, latest_snapshot, unrolled_ranges
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_STATS_CACHE_KEY = 'accounts:dashboard_stats'
+DASHBOARD_STATS_REFRESH_LOCK_KEY = 'accounts:dashboard_stats:refreshing'
+# Served without recomputing for this long
+DASHBOARD_STATS_FRESH_SECONDS = 60
+# Stale stats are still served (while refreshing) until they are this old
+DASHBOARD_STATS_MAX_AGE_SECONDS = 15 * 60
+DASHBOARD_STATS_REFRESH_LOCK_SECONDS = 60
+
+DAILY_PERIODS = 7
+WEEKLY_PERIODS = 12
+MONTHLY_PERIODS = 7
+
+SIGNUP_GRANULARITIES = {
+    'day': TruncDay,
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+
+
+def _bucket_starts(granularity, periods, today):
+    """
+    Return the first day of the last ``periods`` buckets, oldest first, matching
+    the truncation done by the database.
+    """
+    if granularity == 'day':
+        return [today - timedelta(days=offset) for offset in range(periods - 1, -1, -1)]
+    if granularity == 'week':
+        this_week = today - timedelta(days=today.weekday())
+        return [this_week - timedelta(weeks=offset) for offset in range(periods - 1, -1, -1)]
+
+    starts = []
+    year, month = today.year, today.month
+    for _ in range(periods):
+        starts.append(date(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts[::-1]
+
+
+def _as_local_date(value):
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.date()
+    return value
+
+
+def signup_series(granularity, periods, now=None):
+    """
+    Count non-superuser sign-ups per day, week or month for the last ``periods`` buckets.
+
+    Runs one ``GROUP BY Trunc*(date_joined)`` query; buckets without sign-ups are
+    filled with zero.
+
+    Returns:
+        list: dicts with ``start`` (date) and ``count``, oldest first
+    """
+    now = now or timezone.now()
+    starts = _bucket_starts(granularity, periods, timezone.localtime(now).date())
+    since = timezone.make_aware(datetime.combine(starts[0], datetime.min.time()))
+
+    rows = (
+        User.objects
+        .filter(is_superuser=False, date_joined__gte=since)
+        .annotate(bucket=SIGNUP_GRANULARITIES[granularity]('date_joined'))
+        .values('bucket')
+        .annotate(count=Count('uuid'))
+        .order_by()
+    )
+    counts = {_as_local_date(row['bucket']): row['count'] for row in rows}
+    return [{'start': start, 'count': counts.get(start, 0)} for start in starts]
+
+
+def _bucket_start(granularity, day):
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def rollup_signup_series(granularity, periods, signups_by_day, today):
+    """
+    Bucket daily sign-up counts from the rollups into the last ``periods`` buckets.
+
+    Returns:
+        list: dicts with ``start`` (date) and ``count``, oldest first
+    """
+    starts = _bucket_starts(granularity, periods, today)
+    counts = dict.fromkeys(starts, 0)
+    for day, signups in signups_by_day.items():
+        start = _bucket_start(granularity, day)
+        if start in counts:
+            counts[start] += signups
+    return [{'start': start, 'count': counts[start]} for start in starts]
+
+
+def _build_stats(now, snapshot, signups, new_this_week, new_this_month, rolled_up_at):
+    return {
+        'computed_at': now,
+        'rolled_up_at': rolled_up_at,
+        'users': dict(snapshot['users'], new_this_week=new_this_week, new_this_month=new_this_month),
+        'signups': signups,
+        'intel': {
+            'total': sum(row['count'] for row in snapshot['intel_by_status']),
+            'by_status': snapshot['intel_by_status'],
+        },
+        'exchanges': {
+            'total': sum(row['count'] for row in snapshot['exchanges_by_status']),
+            'by_status': snapshot['exchanges_by_status'],
+        },
+        'notifications': snapshot['notifications'],
+        'total_follows': snapshot['total_follows'],
+        'distributions': snapshot['distributions'],
+    }
+
+
+def compute_rollup_stats(now=None):
+    """
+    Build the dashboard statistics from the daily metrics rollups.
+
+    Returns:
+        dict: same shape as ``compute_live_stats``, or None when nothing has been
+        rolled up yet
+    """
+    now = now or timezone.now()
+    metrics = latest_snapshot()
+    if metrics is None:
+        return None
+
+    today = timezone.localtime(now).date()
+    oldest = min(
+        _bucket_starts('day', DAILY_PERIODS, today)[0],
+        _bucket_starts('week', WEEKLY_PERIODS, today)[0],
+        _bucket_starts('month', MONTHLY_PERIODS, today)[0],
+        today - timedelta(days=29),
+    )
+    signups_by_day = dict(
+        DailyMetrics.objects
+        .filter(date__gte=oldest, date__lt=today)
+        .order_by('date')
+        .values_list('date', 'signups')
+    )
+    # Days the rollups do not cover, including today, are counted live per day
+    live = (
+        User.objects
+        .filter(is_superuser=False)
+        .filter(unrolled_ranges(list(signups_by_day), 'date_joined', oldest))
+        .annotate(day=TruncDay('date_joined'))
+        .values('day')
+        .annotate(count=Count('uuid'))
+        .order_by()
+    )
+    for row in live:
+        day = _as_local_date(row['day'])
+        signups_by_day[day] = signups_by_day.get(day, 0) + row['count']
+
+    def signups_since(days):
+        first_day = today - timedelta(days=days - 1)
+        return sum(count for day, count in signups_by_day.items() if day >= first_day)
+
+    signups = {
+        'daily': rollup_signup_series('day', DAILY_PERIODS, signups_by_day, today),
+        'weekly': rollup_signup_series('week', WEEKLY_PERIODS, signups_by_day, today),
+        'monthly': rollup_signup_series('month', MONTHLY_PERIODS, signups_by_day, today),
+    }
+    return _build_stats(
+        now, metrics.snapshot, signups, signups_since(7), signups_since(30), metrics.updated_at
+    )
+
+
+def compute_live_stats(now=None):
+    """
+    Compute every dashboard statistic directly from the source tables.
+    """
+    now = now or timezone.now()
+    recent = User.objects.filter(is_superuser=False).aggregate(
+        new_this_week=Count('uuid', filter=Q(date_joined__gte=now - timedelta(days=7))),
+        new_this_month=Count('uuid', filter=Q(date_joined__gte=now - timedelta(days=30))),
+    )
+    signups = {
+        'daily': signup_series('day', DAILY_PERIODS, now),
+        'weekly': signup_series('week', WEEKLY_PERIODS, now),
+        'monthly': signup_series('month', MONTHLY_PERIODS, now),
+    }
+    return _build_stats(
+        now, compute_snapshot(), signups, recent['new_this_week'], recent['new_this_month'], None
+    )
+
+
+def compute_dashboard_stats(now=None):
+    """
+    Compute every statistic used by the dashboard API and the admin dashboard,
+    from the rollups when available.
+    """
+    return compute_rollup_stats(now) or compute_live_stats(now)
+
+
+def refresh_dashboard_stats():
+    """
+    Recompute the dashboard statistics and store them in the cache.
+    """
+    stats = compute_dashboard_stats()
+    cache.set(DASHBOARD_STATS_CACHE_KEY, stats, DASHBOARD_STATS_MAX_AGE_SECONDS)
+    return stats
+
+
+def _refresh_in_background():
+    try:
+        refresh_dashboard_stats()
+    except Exception as e:
+        logger.error(f"Error refreshing dashboard statistics: {str(e)}", exc_info=True)
+    finally:
+        cache.delete(DASHBOARD_STATS_REFRESH_LOCK_KEY)
+        connection.close()
+
+
+def get_dashboard_stats():
+    """
+    Return cached dashboard statistics.
+
+    Computes them synchronously only when nothing usable is cached; stale results
+    trigger a single background refresh and are returned immediately.
+    """
+    stats = cache.get(DASHBOARD_STATS_CACHE_KEY)
+    if stats is None:
+        return refresh_dashboard_stats()
+
+    age = (timezone.now() - stats['computed_at']).total_seconds()
+    if age > DASHBOARD_STATS_FRESH_SECONDS and cache.add(
+        DASHBOARD_STATS_REFRESH_LOCK_KEY, True, DASHBOARD_STATS_REFRESH_LOCK_SECONDS
+    ):
+        threading.Thread(target=_refresh_in_background, name='dashboard-stats-refresh', daemon=True).start()
+    return stats
@@ -14,6 +14,8 @@ from accounts.api.serializers.verification_document import (
     VerificationDocumentRejectSerializer
 )
 from notification.api.notification_utils import NotificationService
+from core.api.serializers import ModerationClaimSerializer, ModerationReleaseSerializer
+from core.api.moderation_utils import claim_next, release_claims
 import logging
 
 logger = logging.getLogger(__name__)
@@ -130,6 +132,91 @@ class AdminVerificationDocumentViewSet(viewsets.ViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=['post'], url_path='claim')
+    def claim(self, request):
+        """
+        Claim the next pending verification documents from the moderation queue.
+        Claimed items are reserved for this admin until the lease expires, so
+        moderators working the queue concurrently get disjoint batches.
+        
+        POST /api/admin-verification-documents/claim/
+        Request body: { "limit": 20, "lease_seconds": 900 }
+        """
+        try:
+            serializer = ModerationClaimSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            claimed, expires_at = claim_next(
+                VerificationDocument,
+                'pending',
+                request.user,
+                limit=serializer.validated_data['limit'],
+                lease_seconds=serializer.validated_data['lease_seconds']
+            )
+            items = {item.pk: item for item in self.get_queryset().filter(pk__in=claimed)}
+            data = VerificationDocumentSerializer([items[pk] for pk in claimed if pk in items], many=True).data
+            
+            logger.info(f"Admin {request.user.email} claimed {len(claimed)} pending verification documents")
+            
+            return Response({
+                'success': True,
+                'message': f"{len(claimed)} verification documents claimed",
+                'data': {
+                    'lease_expires_at': expires_at.isoformat(),
+                    'count': len(data),
+                    'results': data
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error claiming verification documents: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to claim verification documents',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=False, methods=['post'], url_path='release')
+    def release(self, request):
+        """
+        Return claimed verification documents to the moderation queue.
+        Releases all of this admin's claims when no UUIDs are given.
+        
+        POST /api/admin-verification-documents/release/
+        Request body: { "uuids": ["uuid-1"] }
+        """
+        try:
+            serializer = ModerationReleaseSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            released = release_claims(VerificationDocument, request.user, serializer.validated_data.get('uuids'))
+            
+            return Response({
+                'success': True,
+                'message': f"{released} verification documents released",
+                'data': {
+                    'released': released
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error releasing verification documents: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to release verification documents',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         """
@@ -161,6 +248,8 @@ class AdminVerificationDocumentViewSet(viewsets.ViewSet):
                 document.rejection_reason = None
                 document.reviewed_by = request.user
                 document.reviewed_at = timezone.now()
+                document.claimed_by = None
+                document.claim_expires_at = None
                 document.save()
                 approved_count += 1
                 approved_documents.append({
@@ -256,6 +345,8 @@ class AdminVerificationDocumentViewSet(viewsets.ViewSet):
                 document.rejection_reason = rejection_reason
                 document.reviewed_by = request.user
                 document.reviewed_at = timezone.now()
+                document.claimed_by = None
+                document.claim_expires_at = None
                 document.save()
                 rejected_count += 1
                 rejected_documents.append({
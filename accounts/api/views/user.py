@@ -1,16 +1,38 @@
 from rest_framework import status, viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from accounts.models.user import User
 from accounts.api.serializers.user import UserSerializer
 from network.models.follow import Follow
+from core.api.export_utils import get_export_format, stream_export, EXPORT_FORMATS
 import logging
 
 logger = logging.getLogger(__name__)
 
+USER_EXPORT_COLUMNS = [
+    ('uuid', 'uuid'),
+    ('email', 'email'),
+    ('full_name', 'full_name'),
+    ('account_type', 'account_type'),
+    ('is_active', 'is_active'),
+    ('is_banned', 'is_banned'),
+    ('is_profile_completed', 'is_profile_completed'),
+    ('date_joined', 'date_joined'),
+    ('last_login', 'last_login'),
+    ('gender', 'profile__gender'),
+    ('birth_date', 'profile__birth_date'),
+    ('branch', 'profile__branch'),
+    ('rank', 'profile__rank'),
+    ('mos_afsc', 'profile__mos_afsc'),
+    ('location', 'profile__location'),
+    ('education', 'profile__education'),
+    ('degree', 'profile__degree'),
+    ('id_me_verified', 'profile__id_me_verified'),
+]
+
 
 class UserPagination(PageNumberPagination):
     """Pagination class for user listing."""
@@ -97,6 +119,35 @@ class UserViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['get'], url_path='export', permission_classes=[IsAuthenticated, IsAdminUser])
+    def export(self, request):
+        """
+        Stream users with their profile fields as CSV or NDJSON.
+        
+        Endpoint: GET /api/user/export/
+        
+        Accepts the same search, filter and ordering parameters as the list endpoint,
+        plus export_format (csv or ndjson, default csv). Superusers are excluded.
+        """
+        try:
+            export_format = get_export_format(request)
+            if export_format is None:
+                return Response({
+                    'success': False,
+                    'message': f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            queryset = self.filter_queryset(self.get_queryset()).exclude(is_superuser=True)
+            return stream_export(request, queryset, USER_EXPORT_COLUMNS, export_format, 'users')
+        
+        except Exception as e:
+            logger.error(f"Error exporting users: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to export users',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
     @action(detail=True, methods=['get'], url_path='profile', permission_classes=[IsAuthenticated])
     def view_profile(self, request, uuid=None):
         """
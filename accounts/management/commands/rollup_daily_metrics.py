@@ -0,0 +1,28 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from accounts.api.metrics_utils import rollup_range, rollup_recent, INCREMENTAL_ROLLUP_DAYS
+
+
+class Command(BaseCommand):
+    help = ('Roll up daily admin metrics (schedule every few minutes for today and yesterday, '
+            'and nightly), or backfill them from a date')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=INCREMENTAL_ROLLUP_DAYS,
+                            help=f'Number of days up to today to roll up (default: {INCREMENTAL_ROLLUP_DAYS})')
+        parser.add_argument('--since', type=str,
+                            help='Backfill every day from this date (YYYY-MM-DD) through today')
+
+    def handle(self, *args, **kwargs):
+        if kwargs['since']:
+            try:
+                first_day = datetime.strptime(kwargs['since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--since must be a date in YYYY-MM-DD format')
+            count = rollup_range(first_day)
+        else:
+            if kwargs['days'] < 1:
+                raise CommandError('--days must be at least 1')
+            count = rollup_recent(kwargs['days'])
+
+        self.stdout.write(self.style.SUCCESS(f'Rolled up daily metrics for {count} days'))
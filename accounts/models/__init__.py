@@ -6,4 +6,5 @@ from .verification_document import VerificationDocument
 from .role import UserRole
 from .interest import Interest
 from .preferred_contribution_path import PreferredContributionPath
-from .affiliation import Affiliation
\ No newline at end of file
+from .affiliation import Affiliation
+from .daily_metrics import DailyMetrics
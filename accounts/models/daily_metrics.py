@@ -0,0 +1,47 @@
+from django.db import models
+
+
+class DailyMetrics(models.Model):
+    """
+    Daily rollup of platform activity for admin analytics.
+
+    Activity counters (sign-ups, intel created, donations, ...) cover events on
+    ``date``. Snapshot fields (totals and status/distribution breakdowns) hold the
+    state when the day was last rolled up, so the latest row describes the platform
+    as of the last rollup run.
+    """
+    date = models.DateField(unique=True)
+
+    # Users
+    signups = models.IntegerField(default=0)
+    total_users = models.IntegerField(default=0, help_text="Non-superuser accounts at the end of the day")
+    active_users = models.IntegerField(default=0, help_text="Active non-superuser accounts (snapshot)")
+
+    # Content
+    intel_created = models.IntegerField(default=0)
+    exchanges_created = models.IntegerField(default=0)
+    follows_created = models.IntegerField(default=0)
+
+    # Notifications
+    notifications_sent = models.IntegerField(default=0)
+    notifications_read = models.IntegerField(default=0)
+
+    # Donations, one entry per currency and method:
+    # [{"currency": "USD", "method": "Card", "count": 3, "total": "150.00"}]
+    donations_count = models.IntegerField(default=0)
+    donations = models.JSONField(default=list, blank=True)
+
+    # Snapshots: user totals, intel/exchange status counts and user distributions
+    snapshot = models.JSONField(default=dict, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'daily_metrics'
+        ordering = ['-date']
+        verbose_name = 'Daily Metrics'
+        verbose_name_plural = 'Daily Metrics'
+
+    def __str__(self):
+        return f"Metrics for {self.date}"
@@ -54,6 +54,19 @@ class VerificationDocument(models.Model):
         blank=True,
         help_text="When the document was reviewed"
     )
+    claimed_by = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Admin currently reviewing this document from the moderation queue"
+    )
+    claim_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the moderation queue claim lapses"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -62,6 +75,10 @@ class VerificationDocument(models.Model):
         verbose_name = 'Verification Document'
         verbose_name_plural = 'Verification Documents'
         ordering = ['-created_at']
+        indexes = [
+            # Moderation queue: oldest pending first
+            models.Index(fields=['status', 'created_at']),
+        ]
     
     def __str__(self):
         return f"Verification Document for {self.profile.user.email} - {self.document_type or 'Unknown'}"
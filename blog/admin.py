@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 from blog.models import Blog
 
@@ -83,23 +84,24 @@ class BlogAdmin(admin.ModelAdmin):
         """Override save to handle Mission Genesis logic"""
         super().save_model(request, obj, form, change)
     
+    # Bulk updates bump updated_at so blog ETags and cached responses change too
     actions = ['make_published', 'make_draft', 'make_archived', 'set_mission_genesis']
     
     def make_published(self, request, queryset):
         """Bulk action to publish blogs"""
-        updated = queryset.update(status='Published')
+        updated = queryset.update(status='Published', updated_at=timezone.now())
         self.message_user(request, f'{updated} blog(s) marked as Published.')
     make_published.short_description = "Mark selected blogs as Published"
     
     def make_draft(self, request, queryset):
         """Bulk action to mark as draft"""
-        updated = queryset.update(status='Draft')
+        updated = queryset.update(status='Draft', updated_at=timezone.now())
         self.message_user(request, f'{updated} blog(s) marked as Draft.')
     make_draft.short_description = "Mark selected blogs as Draft"
     
     def make_archived(self, request, queryset):
         """Bulk action to archive blogs"""
-        updated = queryset.update(status='Archived')
+        updated = queryset.update(status='Archived', updated_at=timezone.now())
         self.message_user(request, f'{updated} blog(s) marked as Archived.')
     make_archived.short_description = "Mark selected blogs as Archived"
     
@@ -112,7 +114,9 @@ class BlogAdmin(admin.ModelAdmin):
         blog = queryset.first()
         if blog:
             # Remove Mission Genesis from all blogs
-            Blog.objects.filter(is_mission_genesis=True).update(is_mission_genesis=False)
+            Blog.objects.filter(is_mission_genesis=True).update(
+                is_mission_genesis=False, updated_at=timezone.now()
+            )
             # Set selected blog as Mission Genesis
             blog.is_mission_genesis = True
             blog.save()
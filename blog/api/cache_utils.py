@@ -0,0 +1,87 @@
+"""
+Response caching and conditional GET for blog reads.
+
+Validators come from one cheap query per request: the newest ``updated_at`` and
+the row count of the requested blogs. They are sent as an ``ETag`` (plus
+``Last-Modified`` for a single blog) so clients revalidate with ``If-None-Match``
+(or ``If-Modified-Since``) and get a 304 without any serialization. The ETag is also
+part of the cache key of the serialized payload, so saving, creating or deleting
+a blog invalidates its cached responses in every process without an explicit
+purge. Writes that bypass ``save`` must bump ``updated_at`` themselves.
+
+``views_count`` is not part of the validators: a cached payload shows the count
+from when it was built for up to the cache timeout, and a client revalidating
+with ``If-None-Match`` keeps the count it already has until the blog is edited.
+"""
+import hashlib
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+BLOG_RESPONSE_CACHE_PREFIX = 'blog:response'
+BLOG_RESPONSE_CACHE_TIMEOUT = 300
+
+
+def _digest(*parts):
+    return hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def queryset_validators(queryset):
+    """
+    Return the ``(etag, last_modified)`` of a blog queryset.
+
+    The count is included so deleting a blog (which leaves no newer
+    ``updated_at`` behind) still changes the ETag. ``last_modified`` is always
+    None: deleting or unpublishing the newest blog moves the collection's newest
+    ``updated_at`` backwards, so ``If-Modified-Since`` would wrongly answer 304.
+    """
+    summary = queryset.order_by().aggregate(last_modified=Max('updated_at'), count=Count('uuid'))
+    etag, _ = validators(summary['last_modified'], summary['count'])
+    return etag, None
+
+
+def validators(last_modified, count=1):
+    """
+    Return the ``(etag, last_modified)`` of ``count`` blogs last updated at ``last_modified``.
+    """
+    etag = f'"{_digest(last_modified.isoformat() if last_modified else "", count)}"'
+    return etag, last_modified
+
+
+def _set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def conditional_cached_response(request, action, etag, last_modified, build):
+    """
+    Answer a blog GET from its validators, the cache or ``build``.
+
+    Args:
+        request: DRF request being answered
+        action: Name of the view action, part of the cache key
+        etag, last_modified: Validators from ``queryset_validators``
+        build: Callable returning the uncached Response
+
+    Returns:
+        A 304 when the client's copy is current, otherwise the (cached) response
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if not_modified is not None:
+        return _set_validators(not_modified, etag, last_modified)
+
+    key = f'{BLOG_RESPONSE_CACHE_PREFIX}:{_digest(action, request.build_absolute_uri(), etag)}'
+    data = cache.get(key)
+    if data is None:
+        response = build()
+        if response.status_code != 200:
+            return response
+        cache.set(key, response.data, BLOG_RESPONSE_CACHE_TIMEOUT)
+    else:
+        response = Response(data)
+    return _set_validators(response, etag, last_modified)
@@ -3,11 +3,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import Q
 
 from blog.models import Blog
 from blog.api.serializers import BlogSerializer, BlogListSerializer, UserBlogListSerializer
 from blog.api.utils import success_response, error_response, paginated_response
+from blog.api.view_counter import blog_view_counter
+from blog.api.cache_utils import queryset_validators, validators, conditional_cached_response
+from core.api.bulk_delete_utils import delete_in_chunks
 
 
 class BlogViewSet(viewsets.ModelViewSet):
@@ -51,13 +55,17 @@ class BlogViewSet(viewsets.ModelViewSet):
         return queryset
     
     def list(self, request, *args, **kwargs):
-        """List all blogs with standardized response format"""
+        """List all blogs with standardized response format, cached and conditional"""
         queryset = self.filter_queryset(self.get_queryset())
-        return paginated_response(
-            queryset, 
-            self.get_serializer_class(), 
-            request,
-            "Blogs retrieved successfully"
+        etag, last_modified = queryset_validators(queryset)
+        return conditional_cached_response(
+            request, 'list', etag, last_modified,
+            lambda: paginated_response(
+                queryset, 
+                self.get_serializer_class(), 
+                request,
+                "Blogs retrieved successfully"
+            )
         )
     
     def create(self, request, *args, **kwargs):
@@ -77,15 +85,36 @@ class BlogViewSet(viewsets.ModelViewSet):
         )
     
     def retrieve(self, request, *args, **kwargs):
-        """Retrieve a blog with standardized response format"""
-        instance = self.get_object()
-        # Increment view count
-        instance.increment_views()
-        serializer = self.get_serializer(instance)
-        return success_response(
-            data=serializer.data,
-            message="Blog retrieved successfully"
-        )
+        """Retrieve a blog with standardized response format, cached and conditional"""
+        try:
+            row = (
+                self.filter_queryset(self.get_queryset())
+                .filter(uuid=kwargs[self.lookup_field])
+                .values_list('uuid', 'updated_at')
+                .first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            row = None
+        if row is None:
+            # Let get_object raise the usual 404
+            self.get_object()
+        pk, updated_at = row
+        
+        # Views are buffered and written in batches, and counted for 304s too
+        pending_views = blog_view_counter.record(pk)
+        
+        def build():
+            instance = self.get_object()
+            # Include this process's pending views
+            instance.views_count += pending_views
+            serializer = self.get_serializer(instance)
+            return success_response(
+                data=serializer.data,
+                message="Blog retrieved successfully"
+            )
+        
+        etag, last_modified = validators(updated_at)
+        return conditional_cached_response(request, 'retrieve', etag, last_modified, build)
     
     def update(self, request, *args, **kwargs):
         """Update a blog with standardized response format"""
@@ -116,13 +145,17 @@ class BlogViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def published(self, request):
-        """Get all published blogs"""
+        """Get all published blogs, cached and conditional"""
         blogs = self.get_queryset().filter(status='Published')
-        return paginated_response(
-            blogs,
-            self.get_serializer_class(),
-            request,
-            "Published blogs retrieved successfully"
+        etag, last_modified = queryset_validators(blogs)
+        return conditional_cached_response(
+            request, 'published', etag, last_modified,
+            lambda: paginated_response(
+                blogs,
+                self.get_serializer_class(),
+                request,
+                "Published blogs retrieved successfully"
+            )
         )
     
     @action(detail=False, methods=['get'])
@@ -192,7 +225,7 @@ class BlogViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['delete'])
     def bulk_delete(self, request):
         """
-        Bulk delete blogs by UUIDs.
+        Bulk delete blogs by UUIDs, in short chunked transactions.
         Body: {"uuids": ["uuid1", "uuid2", "uuid3"]}
         """
         uuids = request.data.get('uuids', [])
@@ -202,11 +235,15 @@ class BlogViewSet(viewsets.ModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
-        deleted_count = self.get_queryset().filter(uuid__in=uuids).delete()[0]
+        report = delete_in_chunks(self.get_queryset().filter(uuid__in=uuids))
+        deleted_count, remaining = report['deleted'], report['remaining']
         
+        message = f'Successfully deleted {deleted_count} blog(s)'
+        if remaining:
+            message = f'Deleted {deleted_count} blog(s); {remaining} are locked by other requests, retry later'
         return success_response(
-            data={'deleted_count': deleted_count},
-            message=f'Successfully deleted {deleted_count} blog(s)'
+            data={'deleted_count': deleted_count, 'remaining_count': remaining},
+            message=message
         )
     
     @action(detail=False, methods=['get'], url_path='user-list')
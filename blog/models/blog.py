@@ -1,7 +1,13 @@
 import uuid
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models.functions import Cast, Substr
+from django.utils import timezone
 from django.utils.text import slugify
 
+# Characters kept free at the end of a generated slug for a "-N" suffix
+SLUG_SUFFIX_ROOM = 10
+SLUG_SAVE_ATTEMPTS = 3
+
 
 class Blog(models.Model):
     """
@@ -51,27 +57,63 @@ class Blog(models.Model):
     def __str__(self):
         return self.title
     
+    def _next_free_slug(self, base):
+        """
+        Return ``base`` or ``base-N`` with the next free suffix, using one query.
+
+        The highest taken suffix is computed in the database over slugs shaped
+        exactly like ``base`` or ``base-<digits>``; an unused base counts as free.
+        The prefix filter lets the slug index narrow the rows before the regex, and
+        suffixes are capped at 18 digits so the cast always fits a bigint.
+        """
+        highest = (
+            Blog.objects
+            .filter(slug__startswith=base, slug__regex=rf'^{base}(-[0-9]{{1,18}})?$')
+            .exclude(uuid=self.uuid)
+            .aggregate(
+                suffix=models.Max(models.Case(
+                    models.When(slug=base, then=models.Value(0)),
+                    default=Cast(Substr('slug', len(base) + 2), models.BigIntegerField()),
+                    output_field=models.BigIntegerField(),
+                ))
+            )['suffix']
+        )
+        return base if highest is None else f"{base}-{highest + 1}"
+    
     def save(self, *args, **kwargs):
-        # Auto-generate slug from title if not provided
+        # Auto-generate a unique slug from the title if not provided
+        slug_base = None
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure slug is unique
-            original_slug = self.slug
-            counter = 1
-            while Blog.objects.filter(slug=self.slug).exclude(uuid=self.uuid).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            # Leave room for a numeric suffix within the column
+            slug_base = slugify(self.title)[:self._meta.get_field('slug').max_length - SLUG_SUFFIX_ROOM].strip('-')
+            self.slug = self._next_free_slug(slug_base)
         
         # Ensure only one Mission Genesis blog
         if self.is_mission_genesis:
-            Blog.objects.filter(is_mission_genesis=True).exclude(uuid=self.uuid).update(is_mission_genesis=False)
+            # updated_at is bumped so cached responses and ETags of the demoted blog change too
+            Blog.objects.filter(is_mission_genesis=True).exclude(uuid=self.uuid).update(
+                is_mission_genesis=False, updated_at=timezone.now()
+            )
+        
+        if slug_base is None:
+            super().save(*args, **kwargs)
+            return
         
-        super().save(*args, **kwargs)
+        # A concurrent save may take the same slug first; allocate again and retry
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                if attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    raise
+                self.slug = self._next_free_slug(slug_base)
     
-    def increment_views(self):
-        """Increment the view count"""
-        self.views_count += 1
-        self.save(update_fields=['views_count'])
+    def increment_views(self, count=1):
+        """Atomically increment the view count"""
+        Blog.objects.filter(uuid=self.uuid).update(views_count=models.F('views_count') + count)
+        self.views_count += count
     
     @property
     def excerpt(self):
@@ -1,3 +1,105 @@
-from django.test import TestCase
+import threading
+import time
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from blog.models import Blog
+from blog.api.view_counter import BufferedViewCounter
 
-# Create your tests here.
+
+class FakeClock:
+    """Monotonic clock the tests move by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_blog(title='Counted'):
+    return Blog.objects.create(title=title, content='Content', author='Author')
+
+
+class BufferedViewCounterTests(TestCase):
+
+    def setUp(self):
+        self.blog = create_blog()
+        self.clock = FakeClock()
+
+    def views_count(self):
+        self.blog.refresh_from_db()
+        return self.blog.views_count
+
+    def test_flushes_once_interval_has_passed(self):
+        counter = BufferedViewCounter(flush_interval=10, max_pending=1000, clock=self.clock, background=False)
+        for _ in range(5):
+            counter.record(self.blog.pk)
+        self.assertEqual(self.views_count(), 0)
+        self.assertEqual(counter.pending(self.blog.pk), 5)
+
+        self.clock.now = 10
+        self.assertEqual(counter.record(self.blog.pk), 6)
+        self.assertEqual(self.views_count(), 6)
+        self.assertEqual(counter.pending(self.blog.pk), 0)
+
+    def test_flushes_once_max_pending_is_reached(self):
+        counter = BufferedViewCounter(flush_interval=3600, max_pending=3, clock=self.clock, background=False)
+        counter.record(self.blog.pk)
+        counter.record(self.blog.pk)
+        self.assertEqual(self.views_count(), 0)
+
+        counter.record(self.blog.pk)
+        self.assertEqual(self.views_count(), 3)
+        self.assertEqual(counter.pending(self.blog.pk), 0)
+
+    def test_flush_groups_blogs_by_increment(self):
+        other = create_blog('Other')
+        counter = BufferedViewCounter(flush_interval=3600, max_pending=1000, clock=self.clock, background=False)
+        counter.record(self.blog.pk)
+        counter.record(self.blog.pk)
+        counter.record(other.pk)
+
+        self.assertEqual(counter.flush(), 3)
+        self.assertEqual(self.views_count(), 2)
+        other.refresh_from_db()
+        self.assertEqual(other.views_count, 1)
+        self.assertEqual(counter.flush(), 0)
+
+
+class BufferedViewCounterConcurrencyTests(TransactionTestCase):
+
+    def test_concurrent_views_are_all_counted(self):
+        blogs = [create_blog(f'Blog {i}') for i in range(5)]
+        counter = BufferedViewCounter(flush_interval=0.01, max_pending=50, background=False)
+        threads_count, views_per_thread = 8, 2000
+
+        def record_views(offset):
+            try:
+                for i in range(views_per_thread):
+                    counter.record(blogs[(i + offset) % len(blogs)].pk)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=record_views, args=(n,)) for n in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.flush()
+
+        total = sum(Blog.objects.values_list('views_count', flat=True))
+        self.assertEqual(total, threads_count * views_per_thread)
+
+    def test_background_thread_flushes_without_further_views(self):
+        blog = create_blog()
+        counter = BufferedViewCounter(flush_interval=0.05, max_pending=1000)
+        counter.record(blog.pk)
+        counter.record(blog.pk)
+
+        deadline = time.monotonic() + 5
+        blog.refresh_from_db()
+        while blog.views_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            blog.refresh_from_db()
+        self.assertEqual(blog.views_count, 2)
+        self.assertEqual(counter.pending(blog.pk), 0)
@@ -0,0 +1,135 @@
+"""
+Chunked, set-based deletes.
+
+``delete_in_chunks`` deletes everything a queryset matches in short transactions
+instead of one long ``DELETE``. Each batch locks its rows with ``SKIP LOCKED`` (so
+it never waits on user requests holding the same rows), copies them elsewhere if
+asked, and deletes them through Django's collector so cascades and signals still
+run. Skipped rows are retried once the unlocked ones are gone; rows still locked
+after ``lock_retries`` short waits are reported as ``remaining``, never as done. Batch sizes adapt to the work each batch really did: rows removed by
+cascades count towards the batch, and a batch that ran longer than
+``max_batch_seconds`` shrinks the next one, which keeps every lock short.
+"""
+import time
+import logging
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_BATCH_SECONDS = 0.5
+DEFAULT_LOCK_RETRIES = 5
+DEFAULT_LOCK_RETRY_SECONDS = 0.2
+
+
+def _next_batch_size(size, selected, deleted_total, duration, batch_size, max_batch_seconds):
+    """
+    Size the next batch from the last one's cascade fan-out and duration.
+
+    ``batch_size`` bounds the rows deleted per transaction including cascades, so
+    a batch of parents with many children shrinks; fast, cascade-free batches grow
+    back by doubling.
+    """
+    fanout = max(deleted_total / selected, 1)
+    candidates = [batch_size / fanout, size * 2]
+    if max_batch_seconds and duration > 0:
+        candidates.append(size * max_batch_seconds / duration)
+    return max(1, min(batch_size, int(min(candidates))))
+
+
+def _add_batch(report, deleted_total, by_model, label, size, started, progress):
+    report['batches'] += 1
+    report['deleted'] += by_model.get(label, 0)
+    report['deleted_total'] += deleted_total
+    for model_label, count in by_model.items():
+        report['by_model'][model_label] = report['by_model'].get(model_label, 0) + count
+    report['batch_size'] = size
+    report['elapsed_seconds'] = round(time.monotonic() - started, 3)
+    if progress:
+        progress(report)
+
+
+def delete_in_chunks(queryset, batch_size=DEFAULT_BATCH_SIZE, max_batch_seconds=DEFAULT_MAX_BATCH_SECONDS,
+                     sleep_seconds=0, max_batches=None, before_delete=None, progress=None,
+                     lock_retries=DEFAULT_LOCK_RETRIES, lock_retry_seconds=DEFAULT_LOCK_RETRY_SECONDS) -> dict:
+    """
+    Delete all rows matched by ``queryset`` in short, throttled transactions.
+
+    Args:
+        queryset: Rows to delete; re-evaluated for every batch
+        batch_size: Most rows (counting cascades) to delete per transaction
+        max_batch_seconds: Target duration of a batch; slower batches shrink the next one
+        sleep_seconds: Pause between batches to bound the write rate
+        max_batches: Stop after this many batches (default: run until done)
+        before_delete: Optional callable given the batch's primary keys inside the
+            transaction, before they are deleted (e.g. to archive the rows)
+        progress: Optional callable given the running report after each batch
+        lock_retries: Times to wait for rows locked by other transactions once
+            nothing else is left to delete
+        lock_retry_seconds: Pause before each of those retries
+
+    Returns:
+        dict: rows deleted from the queryset's model and in total (with cascades),
+        per-model counts, batches, timing, whether the queryset was exhausted, and
+        how many rows were left ``remaining`` because they stayed locked
+    """
+    model = queryset.model
+    label = model._meta.label
+    report = {
+        'deleted': 0,
+        'deleted_total': 0,
+        'by_model': {},
+        'batches': 0,
+        'batch_size': batch_size,
+        'elapsed_seconds': 0.0,
+        'rows_per_second': 0.0,
+        'complete': False,
+        'remaining': 0,
+    }
+    size = batch_size
+    retries = 0
+    started = time.monotonic()
+
+    while max_batches is None or report['batches'] < max_batches:
+        batch_started = time.monotonic()
+        with transaction.atomic():
+            pks = list(
+                queryset.select_for_update(skip_locked=True)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:size]
+            )
+            if pks:
+                if before_delete:
+                    before_delete(pks)
+                deleted_total, by_model = model._base_manager.filter(pk__in=pks).delete()
+        duration = time.monotonic() - batch_started
+
+        if len(pks) < size:
+            if pks:
+                retries = 0
+                _add_batch(report, deleted_total, by_model, label, size, started, progress)
+            # A short batch means every unlocked row is gone; wait for the rest
+            if not queryset.exists():
+                report['complete'] = True
+                break
+            if retries >= lock_retries:
+                report['remaining'] = queryset.count()
+                logger.warning(f"Chunked delete of {label} left {report['remaining']} locked rows")
+                break
+            retries += 1
+            time.sleep(lock_retry_seconds)
+            continue
+
+        retries = 0
+        _add_batch(report, deleted_total, by_model, label, size, started, progress)
+        size = _next_batch_size(size, len(pks), deleted_total, duration, batch_size, max_batch_seconds)
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    elapsed = time.monotonic() - started
+    report['elapsed_seconds'] = round(elapsed, 3)
+    report['rows_per_second'] = (
+        round(report['deleted_total'] / elapsed, 1) if elapsed > 0 else float(report['deleted_total'])
+    )
+    logger.info(f"Chunked delete of {label} finished: {report}")
+    return report
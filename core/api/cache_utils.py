@@ -0,0 +1,28 @@
+"""
+Helpers for data kept in the default cache and invalidated on writes.
+
+Invalidation (a ``cache.delete`` or a version bump) only reaches every worker
+through a shared backend such as Redis (``REDIS_URL``, see ``CACHES`` in
+settings). With the per-process local-memory fallback, entries are kept only
+briefly instead, so workers that missed an invalidation converge quickly.
+"""
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+# Longest time an invalidated entry is kept when each process has its own cache
+LOCAL_CACHE_MAX_TIMEOUT = 30
+
+
+def cache_is_shared(alias='default') -> bool:
+    """Return whether a cache alias is shared between worker processes"""
+    return not isinstance(caches[alias], LocMemCache)
+
+
+def invalidated_timeout(timeout, alias='default'):
+    """
+    Return the timeout for an entry that is invalidated on writes: ``timeout``
+    with a shared cache, capped at ``LOCAL_CACHE_MAX_TIMEOUT`` otherwise.
+    """
+    if cache_is_shared(alias):
+        return timeout
+    return min(timeout, LOCAL_CACHE_MAX_TIMEOUT)
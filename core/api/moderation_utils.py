@@ -0,0 +1,168 @@
+"""
+Moderation helpers shared by the intel, exchange and verification document
+admin endpoints.
+
+Any model with uuid, status, rejection_reason, moderated_by, moderated_at,
+claimed_by and claim_expires_at fields can be approved or rejected in bulk.
+
+Pending items form a work queue: a moderator claims the next batch for a lease
+period and other moderators skip claimed rows until the lease expires or the items
+are moderated or released.
+"""
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+MAX_BULK_MODERATION_ITEMS = 5000
+
+DEFAULT_CLAIM_SIZE = 20
+MAX_CLAIM_SIZE = 100
+DEFAULT_LEASE_SECONDS = 15 * 60
+MAX_LEASE_SECONDS = 2 * 60 * 60
+
+MODERATION_ACTIONS = {
+    'approve': 'approved',
+    'reject': 'rejected',
+}
+
+RESULT_UPDATED = 'updated'
+RESULT_UNCHANGED = 'unchanged'
+RESULT_NOT_FOUND = 'not_found'
+
+
+def bulk_moderate(model, uuids, action, moderator, rejection_reason=None, notify=None, notify_fields=()):
+    """
+    Approve or reject many objects with a single ``UPDATE``.
+
+    Target rows are locked and read once to learn their current status; rows that are
+    not already in the target status are updated together and recorded against the
+    moderator. ``notify`` is then called once with all changed rows, inside the same
+    transaction, so notifications can be inserted in bulk and pushed after commit.
+
+    Args:
+        model: Intel or Exchange (any model with uuid, status, rejection_reason,
+            moderated_by and moderated_at fields)
+        uuids: UUIDs to moderate; duplicates are ignored
+        action: 'approve' or 'reject'
+        moderator: Admin user performing the action
+        rejection_reason: Reason stored on rejected objects
+        notify: Optional callable receiving (changed rows, new status)
+        notify_fields: Extra fields loaded into the rows passed to ``notify``
+
+    Returns:
+        list: per-item result dicts in request order
+    """
+    new_status = MODERATION_ACTIONS[action]
+    uuids = list(dict.fromkeys(uuids))
+    status_labels = dict(model.STATUS_CHOICES)
+    now = timezone.now()
+
+    with transaction.atomic():
+        rows = {
+            row['uuid']: row
+            for row in (
+                model.objects
+                .select_for_update()
+                .filter(pk__in=uuids)
+                .values('uuid', 'status', 'user_id', *notify_fields)
+            )
+        }
+        changed = [uuid for uuid in uuids if uuid in rows and rows[uuid]['status'] != new_status]
+
+        if changed:
+            model.objects.filter(pk__in=changed).update(
+                status=new_status,
+                rejection_reason=rejection_reason if new_status == 'rejected' else None,
+                moderated_by=moderator,
+                moderated_at=now,
+                claimed_by=None,
+                claim_expires_at=None,
+                updated_at=now
+            )
+            if notify:
+                notify([rows[uuid] for uuid in changed], new_status)
+
+    changed = set(changed)
+    results = []
+    for uuid in uuids:
+        row = rows.get(uuid)
+        if row is None:
+            results.append({'uuid': str(uuid), 'result': RESULT_NOT_FOUND})
+            continue
+        results.append({
+            'uuid': str(uuid),
+            'result': RESULT_UPDATED if uuid in changed else RESULT_UNCHANGED,
+            'old_status': row['status'],
+            'status': new_status,
+            'status_display': status_labels.get(new_status, new_status),
+        })
+    return results
+
+
+def summarize_results(results):
+    """
+    Count per-item moderation results by outcome.
+    """
+    summary = {RESULT_UPDATED: 0, RESULT_UNCHANGED: 0, RESULT_NOT_FOUND: 0}
+    for item in results:
+        summary[item['result']] += 1
+    return summary
+
+
+def claimable_filter(moderator, now=None):
+    """
+    Match items that are unclaimed, whose lease expired, or that the moderator holds.
+    """
+    now = now or timezone.now()
+    return Q(claimed_by__isnull=True) | Q(claim_expires_at__lte=now) | Q(claimed_by=moderator)
+
+
+def claim_next(model, pending_status, moderator, limit=DEFAULT_CLAIM_SIZE, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    Claim the oldest ``limit`` pending items for a moderator.
+
+    Candidates are selected with ``FOR UPDATE SKIP LOCKED`` so concurrent claims never
+    wait on each other or pick the same rows, and are leased to the moderator until
+    ``lease_seconds`` from now. Items the moderator already holds are included and
+    their lease renewed, so claiming again is safe.
+
+    Args:
+        model: Intel, Exchange or VerificationDocument (any model with status,
+            created_at, claimed_by and claim_expires_at fields)
+        pending_status: Status value of items waiting for review
+        moderator: Admin user claiming the items
+        limit: Maximum number of items to claim
+        lease_seconds: How long the claim is held
+
+    Returns:
+        tuple: (claimed primary keys oldest first, lease expiry time)
+    """
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=lease_seconds)
+
+    with transaction.atomic():
+        claimed = list(
+            model.objects
+            .filter(claimable_filter(moderator, now), status=pending_status)
+            .order_by('created_at', 'pk')
+            .select_for_update(skip_locked=True)
+            .values_list('pk', flat=True)[:limit]
+        )
+        if claimed:
+            model.objects.filter(pk__in=claimed).update(claimed_by=moderator, claim_expires_at=expires_at)
+
+    return claimed, expires_at
+
+
+def release_claims(model, moderator, pks=None):
+    """
+    Return a moderator's claimed items to the queue, optionally only ``pks``.
+
+    Returns:
+        int: number of items released
+    """
+    claims = model.objects.filter(claimed_by=moderator)
+    if pks is not None:
+        claims = claims.filter(pk__in=pks)
+    return claims.update(claimed_by=None, claim_expires_at=None)
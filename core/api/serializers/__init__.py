@@ -0,0 +1,14 @@
+"""
+Serializers shared across apps.
+"""
+from core.api.serializers.moderation import (
+    BulkModerationSerializer,
+    ModerationClaimSerializer,
+    ModerationReleaseSerializer
+)
+
+__all__ = [
+    'BulkModerationSerializer',
+    'ModerationClaimSerializer',
+    'ModerationReleaseSerializer',
+]
@@ -0,0 +1,71 @@
+from rest_framework import serializers
+from core.api.moderation_utils import (
+    DEFAULT_CLAIM_SIZE,
+    MAX_CLAIM_SIZE,
+    DEFAULT_LEASE_SECONDS,
+    MAX_LEASE_SECONDS,
+    MAX_BULK_MODERATION_ITEMS
+)
+
+
+class BulkModerationSerializer(serializers.Serializer):
+    """
+    Serializer for approving or rejecting many items of a moderation queue at once.
+    Shared by the intel and exchange admin endpoints.
+    A rejection reason is required when rejecting.
+    """
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_BULK_MODERATION_ITEMS,
+        help_text="UUIDs of the items to moderate"
+    )
+    action = serializers.ChoiceField(choices=['approve', 'reject'])
+    rejection_reason = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=1000,
+        help_text="Reason for rejecting the items"
+    )
+
+    def validate(self, attrs):
+        """Require a non-empty rejection reason for rejections."""
+        reason = (attrs.get('rejection_reason') or '').strip()
+        if attrs['action'] == 'reject' and not reason:
+            raise serializers.ValidationError({'rejection_reason': "Rejection reason is required when rejecting"})
+        attrs['rejection_reason'] = reason or None
+        return attrs
+
+
+class ModerationClaimSerializer(serializers.Serializer):
+    """
+    Serializer for claiming the next items of a moderation queue.
+    Shared by the intel, exchange and verification document admin endpoints.
+    """
+    limit = serializers.IntegerField(
+        required=False,
+        default=DEFAULT_CLAIM_SIZE,
+        min_value=1,
+        max_value=MAX_CLAIM_SIZE,
+        help_text="Number of items to claim"
+    )
+    lease_seconds = serializers.IntegerField(
+        required=False,
+        default=DEFAULT_LEASE_SECONDS,
+        min_value=60,
+        max_value=MAX_LEASE_SECONDS,
+        help_text="How long the items stay reserved for the moderator"
+    )
+
+
+class ModerationReleaseSerializer(serializers.Serializer):
+    """
+    Serializer for releasing claimed moderation items.
+    Releases every claim held by the moderator when no UUIDs are given.
+    """
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        max_length=MAX_CLAIM_SIZE,
+        help_text="UUIDs of the claimed items to release"
+    )
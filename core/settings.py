@@ -179,6 +179,25 @@ DATABASES = {
 }
 
 
+# Cache shared by all worker processes. Cached counters, statistics and registry
+# versions are invalidated through it, so every deployment running more than one
+# process must set REDIS_URL; the local-memory fallback is for development only.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -267,6 +286,48 @@ FCM_DJANGO_SETTINGS = {
     "FCM_DEVICE_MODEL": "notification.FCMDeviceCustom",
 }
 
+# Notification retention settings
+NOTIFICATION_RETENTION = {
+    # Read or deleted notifications older than this are moved to the archive table
+    "NOTIFICATION_DAYS": int(os.environ.get('NOTIFICATION_RETENTION_DAYS', 90)),
+    # Notification logs older than this are moved to the archive table
+    "LOG_DAYS": int(os.environ.get('NOTIFICATION_LOG_RETENTION_DAYS', 30)),
+    # Rows moved per transaction
+    "BATCH_SIZE": 1000,
+    # Pause between batches to keep lock time and replication lag bounded
+    "BATCH_SLEEP_SECONDS": 0.1,
+}
+
+# Live notification stream (server-sent events) settings
+NOTIFICATION_STREAM = {
+    # In-process fan-out works for a single ASGI worker; use
+    # 'notification.api.notification_stream.PostgresNotifyBroker' when running several
+    "BROKER": os.environ.get(
+        'NOTIFICATION_STREAM_BROKER',
+        'notification.api.notification_stream.InProcessBroker'
+    ),
+    "KEEPALIVE_SECONDS": 15,
+    "MAX_CONNECTION_SECONDS": 300,
+}
+
+INTEL_GEO = {
+    # Offline gazetteer (CSV: name,latitude,longitude) used to geocode intel posted
+    # without coordinates
+    "GAZETTEER_PATH": os.environ.get('INTEL_GAZETTEER_PATH') or None,
+    "DEFAULT_RADIUS_KM": 10,
+    "MAX_RADIUS_KM": 100,
+}
+
+# Blog view counts are buffered per process and written in batches
+BLOG_VIEW_COUNTER = {
+    # Pending views are flushed with atomic F() updates at most this often
+    "FLUSH_INTERVAL_SECONDS": 10,
+    # Flush early once this many views are pending
+    "MAX_PENDING_VIEWS": 1000,
+    # Flush on the interval from a background thread, even when traffic stops
+    "BACKGROUND_FLUSH": True,
+}
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.db.models import Sum
 from donation.models import Donation, DonationTarget
+from donation.api.target_utils import annotate_collected
 
 
 @admin.register(Donation)
@@ -28,6 +29,7 @@ class DonationAdmin(admin.ModelAdmin):
         'donor_name',
         'donor_email',
         'notes',
+        'external_id',
     ]
     readonly_fields = [
         'formatted_amount',
@@ -45,7 +47,7 @@ class DonationAdmin(admin.ModelAdmin):
             'fields': ('month', 'year', 'created_at', 'updated_at')
         }),
         ('Additional Information', {
-            'fields': ('notes',),
+            'fields': ('notes', 'external_id'),
             'classes': ('collapse',)
         }),
     )
@@ -145,6 +147,10 @@ class DonationTargetAdmin(admin.ModelAdmin):
     ordering = ['-year', '-month']
     list_per_page = 25
     
+    def get_queryset(self, request):
+        """Load collected amounts with the targets"""
+        return annotate_collected(super().get_queryset(request))
+    
     def get_period(self, obj):
         """Display formatted period"""
         return f"{obj.get_month_name()} {obj.year}"
@@ -0,0 +1,53 @@
+"""
+Bulk deletion of donations by filter.
+
+Matching donations are deleted with ``delete_in_chunks`` in short transactions, so
+deleting years of data never holds long locks. Donation signals defer their rollup
+and cache work to each batch's commit, re-rolling every affected day once per batch.
+"""
+from core.api.bulk_delete_utils import delete_in_chunks, DEFAULT_BATCH_SIZE
+from accounts.api.metrics_utils import day_bounds
+from donation.models import Donation
+
+
+def filter_donations(filters, queryset=None):
+    """
+    Apply validated ``DonationDeleteFilterSerializer`` data to a donation queryset.
+
+    Dates are local calendar days of ``created_at``, both ends inclusive.
+    """
+    queryset = Donation.objects.all() if queryset is None else queryset
+    if 'uuids' in filters:
+        queryset = queryset.filter(uuid__in=filters['uuids'])
+    if 'start_date' in filters:
+        queryset = queryset.filter(created_at__gte=day_bounds(filters['start_date'])[0])
+    if 'end_date' in filters:
+        queryset = queryset.filter(created_at__lt=day_bounds(filters['end_date'])[1])
+    if 'donor_email' in filters:
+        queryset = queryset.filter(donor_email__iexact=filters['donor_email'])
+    for field in ('currency', 'method', 'year', 'month'):
+        if field in filters:
+            queryset = queryset.filter(**{field: filters[field]})
+    return queryset
+
+
+def delete_donations(filters, dry_run=False, batch_size=DEFAULT_BATCH_SIZE, max_batches=None,
+                     progress=None, queryset=None):
+    """
+    Delete the donations matching ``filters`` in chunks.
+
+    Returns:
+        dict: ``matched`` count, plus the ``delete_in_chunks`` report unless a dry run
+    """
+    donations = filter_donations(filters, queryset)
+    report = {'dry_run': dry_run, 'matched': donations.count()}
+    if dry_run:
+        return report
+
+    report.update(delete_in_chunks(
+        donations,
+        batch_size=batch_size,
+        max_batches=max_batches,
+        progress=progress
+    ))
+    return report
@@ -0,0 +1,212 @@
+"""
+Bulk donation import from payment processor batch files.
+
+Rows are read one at a time from CSV, NDJSON or JSON files, validated with
+``DonationImportSerializer`` and written in batches with a single
+``INSERT ... ON CONFLICT (external_id) DO UPDATE`` each, so re-importing the same
+file is idempotent for rows that carry an ``external_id``. Invalid rows are skipped
+and reported with their row number; a dry run validates and counts without writing.
+"""
+import csv
+import io
+import json
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from donation.models import Donation
+from donation.api.serializers import DonationImportSerializer
+from donation.api.stats_utils import invalidate_donation_stats
+from accounts.api.metrics_utils import rollup_donations
+
+IMPORT_FORMATS = ('csv', 'ndjson', 'json')
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 500
+
+UPSERT_UPDATE_FIELDS = [
+    'donor_name', 'donor_email', 'amount', 'currency', 'method', 'month', 'year', 'notes', 'updated_at',
+]
+
+
+def detect_import_format(filename, default='csv'):
+    """
+    Guess the import format from a file name's extension.
+    """
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'jsonl':
+        return 'ndjson'
+    return extension if extension in IMPORT_FORMATS else default
+
+
+def read_rows(stream, import_format):
+    """
+    Yield ``(row number, data, parse error)`` for each row of a binary file.
+
+    CSV and NDJSON files are read incrementally; a JSON file must hold a list of
+    objects and is parsed as a whole. Empty CSV cells are read as null. A file that
+    cannot be parsed, including malformed CSV, raises ``ValueError`` when the bad
+    part is reached.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='' if import_format == 'csv' else None)
+    try:
+        if import_format == 'csv':
+            reader = csv.DictReader(text)
+            try:
+                for row_number, row in enumerate(reader, start=2):
+                    yield row_number, {
+                        (key or '').strip(): (value if value != '' else None) for key, value in row.items()
+                    }, None
+            except csv.Error as e:
+                # e.g. NUL bytes or an oversized field; reported like other unparseable files
+                raise ValueError(f'Invalid CSV: {e}') from e
+        elif import_format == 'ndjson':
+            for row_number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield row_number, json.loads(line), None
+                except ValueError as e:
+                    yield row_number, None, f'Invalid JSON: {e}'
+        else:
+            rows = json.load(text)
+            if not isinstance(rows, list):
+                raise ValueError('A JSON import file must contain a list of donations')
+            for row_number, row in enumerate(rows, start=1):
+                yield row_number, row, None
+    finally:
+        text.detach()
+
+
+class DonationImport:
+    """
+    Validates and loads donation rows in batches, collecting a report.
+    """
+
+    def __init__(self, dry_run=False, batch_size=IMPORT_BATCH_SIZE):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.serializer = DonationImportSerializer()
+        self.batch = []
+        # Keys seen in earlier batches; only needed when nothing is written
+        self.seen_keys = set()
+        self.updated_days = set()
+        self.report = {
+            'dry_run': dry_run,
+            'total_rows': 0,
+            'valid_rows': 0,
+            'invalid_rows': 0,
+            'created': 0,
+            'updated': 0,
+            'duplicates': 0,
+            'errors': [],
+            'errors_truncated': False,
+            'parse_error': None,
+        }
+
+    def _error(self, row_number, errors):
+        self.report['invalid_rows'] += 1
+        if len(self.report['errors']) < MAX_REPORTED_ERRORS:
+            self.report['errors'].append({'row': row_number, 'errors': errors})
+        else:
+            self.report['errors_truncated'] = True
+
+    def add(self, row_number, data, parse_error=None):
+        """
+        Validate one row and queue it for the next batch.
+        """
+        self.report['total_rows'] += 1
+        if parse_error:
+            self._error(row_number, {'non_field_errors': [parse_error]})
+            return
+        if not isinstance(data, dict):
+            self._error(row_number, {'non_field_errors': ['Each row must be an object.']})
+            return
+
+        try:
+            validated = self.serializer.run_validation(data)
+        except ValidationError as e:
+            self._error(row_number, e.detail)
+            return
+
+        self.report['valid_rows'] += 1
+        self.batch.append(validated)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Upsert the queued rows with one statement.
+        """
+        if not self.batch:
+            return
+
+        # Rows sharing an external_id within a batch: the last one wins
+        keyed, unkeyed = {}, []
+        for validated in self.batch:
+            key = validated.get('external_id')
+            if key is None:
+                unkeyed.append(validated)
+            else:
+                if key in keyed:
+                    self.report['duplicates'] += 1
+                keyed[key] = validated
+        self.batch = []
+
+        existing = dict(
+            Donation.objects.filter(external_id__in=list(keyed)).values_list('external_id', 'created_at')
+        )
+        if self.dry_run:
+            # Nothing was written, so rows from earlier batches would be updated too
+            for key in keyed:
+                if key in self.seen_keys and key not in existing:
+                    existing[key] = None
+            self.seen_keys.update(keyed)
+
+        self.report['updated'] += len(existing)
+        self.report['created'] += len(keyed) - len(existing) + len(unkeyed)
+        self.updated_days.update(
+            timezone.localtime(created_at).date() for created_at in existing.values() if created_at
+        )
+
+        if not self.dry_run:
+            Donation.objects.bulk_create(
+                [Donation(**validated) for validated in [*keyed.values(), *unkeyed]],
+                update_conflicts=True,
+                unique_fields=['external_id'],
+                update_fields=UPSERT_UPDATE_FIELDS,
+            )
+
+    def finish(self):
+        """
+        Load the last batch, refresh affected statistics and return the report.
+
+        ``bulk_create`` skips model signals, so rollups of past days touched by
+        updates are recomputed and cached statistics invalidated here.
+        """
+        self.flush()
+        if not self.dry_run and (self.report['created'] or self.report['updated']):
+            today = timezone.localdate()
+            for day in sorted(self.updated_days):
+                if day < today:
+                    rollup_donations(day)
+            invalidate_donation_stats()
+        return self.report
+
+
+def import_donations(stream, import_format, dry_run=False, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import donations from a binary file-like object.
+
+    A file that stops parsing part way (malformed CSV, bad encoding) keeps the rows
+    read before the error: they are written, statistics are refreshed, and the
+    error is returned as ``parse_error`` in the report.
+
+    Returns:
+        dict: counts of total, valid, invalid, created, updated and duplicate rows,
+        per-row validation errors (up to ``MAX_REPORTED_ERRORS``) and ``parse_error``
+    """
+    donation_import = DonationImport(dry_run=dry_run, batch_size=batch_size)
+    try:
+        for row_number, data, parse_error in read_rows(stream, import_format):
+            donation_import.add(row_number, data, parse_error)
+    except ValueError as e:
+        donation_import.report['parse_error'] = str(e)
+    return donation_import.finish()
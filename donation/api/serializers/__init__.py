@@ -1,8 +1,10 @@
-from .donation_serializer import DonationSerializer, DonationListSerializer
+from .donation_serializer import DonationSerializer, DonationListSerializer, DonationImportSerializer, DonationDeleteFilterSerializer
 from .donation_target_serializer import DonationTargetSerializer
 
 __all__ = [
     'DonationSerializer',
     'DonationListSerializer',
+    'DonationImportSerializer',
+    'DonationDeleteFilterSerializer',
     'DonationTargetSerializer',
 ]
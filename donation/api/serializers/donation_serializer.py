@@ -19,6 +19,7 @@ class DonationSerializer(serializers.ModelSerializer):
             'month',
             'year',
             'notes',
+            'external_id',
             'formatted_amount',
             'created_at',
             'updated_at',
@@ -61,3 +62,41 @@ class DonationListSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = fields
+
+
+class DonationImportSerializer(DonationSerializer):
+    """
+    Validates one row of a bulk donation import.
+    
+    external_id uniqueness is not checked per row; imports upsert on it instead.
+    """
+    
+    class Meta(DonationSerializer.Meta):
+        extra_kwargs = {
+            'external_id': {'validators': []},
+        }
+
+
+class DonationDeleteFilterSerializer(serializers.Serializer):
+    """
+    Validates the filters selecting donations for a bulk delete.
+    
+    At least one filter is required so a request can never match every donation by accident.
+    """
+    
+    uuids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    currency = serializers.ChoiceField(choices=Donation.CURRENCY_CHOICES, required=False)
+    method = serializers.ChoiceField(choices=Donation.METHOD_CHOICES, required=False)
+    donor_email = serializers.EmailField(required=False)
+    year = serializers.IntegerField(required=False, min_value=2000, max_value=2100)
+    month = serializers.IntegerField(required=False, min_value=1, max_value=12)
+    
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("At least one filter is required.")
+        start_date, end_date = attrs.get('start_date'), attrs.get('end_date')
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError("start_date must be before end_date.")
+        return attrs
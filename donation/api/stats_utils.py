@@ -0,0 +1,190 @@
+"""
+Donation analytics engine.
+
+Overview, per-currency and per-method statistics come from one grouped query:
+``GROUP BY GROUPING SETS ((currency), (method), ())`` on PostgreSQL, and a single
+``GROUP BY currency, method`` folded in Python elsewhere. Statistics without a date
+filter are read from the daily metrics rollups instead. Results are cached per
+filter combination under a version that is bumped whenever a donation is written;
+the bump reaches every worker through the shared cache, and without one entries
+expire after ``LOCAL_CACHE_MAX_TIMEOUT`` seconds.
+"""
+import hashlib
+from datetime import timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from core.api.cache_utils import invalidated_timeout
+from donation.models import Donation
+from accounts.api.metrics_utils import donation_totals
+
+CURRENCIES = [code for code, _ in Donation.CURRENCY_CHOICES]
+METHODS = [code for code, _ in Donation.METHOD_CHOICES]
+
+STATS_VERSION_CACHE_KEY = 'donation:stats:version'
+STATS_CACHE_TIMEOUT = 10 * 60
+RECENT_DAYS = 7
+TOP_DONORS_LIMIT = 10
+
+GROUPING_SETS_SQL = """
+    SELECT GROUPING(currency), GROUPING(method), currency, method,
+           COUNT(*), SUM(amount), COUNT(*) FILTER (WHERE created_at >= %s)
+    FROM ({donations}) AS donations
+    GROUP BY GROUPING SETS ((currency), (method), ())
+"""
+
+
+def invalidate_donation_stats():
+    """Bump the stats version so every cached filter combination is recomputed"""
+    try:
+        cache.incr(STATS_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(STATS_VERSION_CACHE_KEY, 1, None)
+
+
+def _empty_totals():
+    return {'count': 0, 'total': Decimal('0'), 'recent': 0}
+
+
+def _add(totals, count, total, recent):
+    totals['count'] += count
+    totals['total'] += total or Decimal('0')
+    totals['recent'] += recent
+
+
+def _grouping_sets_totals(queryset, recent_since):
+    """
+    Overall, per-currency and per-method totals with ``GROUPING SETS`` (PostgreSQL).
+    """
+    donations_sql, params = (
+        queryset.order_by().values('currency', 'method', 'amount', 'created_at').query.sql_with_params()
+    )
+    overall, by_currency, by_method = _empty_totals(), {}, {}
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(GROUPING_SETS_SQL.format(donations=donations_sql), [recent_since, *params])
+        for currency_grouped, method_grouped, currency, method, count, total, recent in cursor.fetchall():
+            if currency_grouped and method_grouped:
+                target = overall
+            elif method_grouped:
+                target = by_currency.setdefault(currency, _empty_totals())
+            else:
+                target = by_method.setdefault(method, _empty_totals())
+            _add(target, count, total, recent)
+    return overall, by_currency, by_method
+
+
+def _grouped_totals(queryset, recent_since):
+    """
+    Overall, per-currency and per-method totals from one ``GROUP BY currency, method``.
+    """
+    rows = (
+        queryset.order_by()
+        .values('currency', 'method')
+        .annotate(
+            count=Count('uuid'),
+            total=Sum('amount'),
+            recent=Count('uuid', filter=Q(created_at__gte=recent_since))
+        )
+    )
+    overall, by_currency, by_method = _empty_totals(), {}, {}
+    for row in rows:
+        for target in (
+            overall,
+            by_currency.setdefault(row['currency'], _empty_totals()),
+            by_method.setdefault(row['method'], _empty_totals()),
+        ):
+            _add(target, row['count'], row['total'], row['recent'])
+    return overall, by_currency, by_method
+
+
+def _rollup_totals(currency=None):
+    """
+    All-time totals from the daily metrics rollups, with today's donations live.
+    """
+    recent_since = timezone.localdate() - timedelta(days=RECENT_DAYS - 1)
+    overall, by_currency, by_method = _empty_totals(), {}, {}
+    for row in donation_totals(currency):
+        recent = row['count'] if row['date'] is None or row['date'] >= recent_since else 0
+        for target in (
+            overall,
+            by_currency.setdefault(row['currency'], _empty_totals()),
+            by_method.setdefault(row['method'], _empty_totals()),
+        ):
+            _add(target, row['count'], row['total'], recent)
+    return overall, by_currency, by_method
+
+
+def _breakdown(totals, keys):
+    breakdown = {}
+    for key in keys:
+        entry = totals.get(key, _empty_totals())
+        breakdown[key] = {'count': entry['count'], 'total': float(entry['total'])}
+    return breakdown
+
+
+def compute_donation_stats(currency=None, start_date=None, end_date=None):
+    """
+    Compute donation statistics for a filter combination.
+
+    Args:
+        currency: Only include donations in this currency
+        start_date: Only include donations created at or after this date
+        end_date: Only include donations created at or before this date
+
+    Returns:
+        dict: ``overview``, ``by_currency``, ``by_method`` and ``top_donors``
+    """
+    queryset = Donation.objects.all()
+    if currency:
+        queryset = queryset.filter(currency=currency)
+    if start_date:
+        queryset = queryset.filter(created_at__gte=start_date)
+    if end_date:
+        queryset = queryset.filter(created_at__lte=end_date)
+
+    if start_date or end_date:
+        recent_since = timezone.now() - timedelta(days=RECENT_DAYS)
+        if connections[queryset.db].vendor == 'postgresql':
+            overall, by_currency, by_method = _grouping_sets_totals(queryset, recent_since)
+        else:
+            overall, by_currency, by_method = _grouped_totals(queryset, recent_since)
+    else:
+        overall, by_currency, by_method = _rollup_totals(currency or None)
+
+    top_donors = (
+        queryset.values('donor_name', 'donor_email')
+        .annotate(
+            total_donated=Sum('amount'),
+            donation_count=Count('uuid')
+        )
+        .order_by('-total_donated')[:TOP_DONORS_LIMIT]
+    )
+
+    count, total = overall['count'], overall['total']
+    return {
+        'overview': {
+            'total_donations': count,
+            'total_amount': float(total),
+            'average_donation': float(total / count) if count else 0.0,
+            'recent_donations_7_days': overall['recent'],
+        },
+        'by_currency': _breakdown(by_currency, CURRENCIES),
+        'by_method': _breakdown(by_method, METHODS),
+        'top_donors': list(top_donors),
+    }
+
+
+def get_donation_stats(currency=None, start_date=None, end_date=None):
+    """
+    Return cached donation statistics for a filter combination, computing them on a miss.
+    """
+    version = cache.get(STATS_VERSION_CACHE_KEY, 0)
+    filters = hashlib.md5(f'{currency or ""}|{start_date or ""}|{end_date or ""}'.encode()).hexdigest()
+    key = f'donation:stats:{version}:{filters}'
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_donation_stats(currency, start_date, end_date)
+        cache.set(key, stats, invalidated_timeout(STATS_CACHE_TIMEOUT))
+    return stats
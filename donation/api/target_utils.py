@@ -0,0 +1,72 @@
+"""
+Utility functions for donation target progress.
+
+Collected amounts are attached to targets with a correlated ``SUM`` subquery over
+donations of the same month, year and currency, so any number of targets (across
+any range of years) is loaded with their progress in a single query.
+"""
+from collections import defaultdict
+from decimal import Decimal
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from donation.models import Donation
+
+
+def annotate_collected(queryset):
+    """
+    Annotate donation targets with ``collected_total``: the sum of donations made in
+    the target's currency for its month and year.
+    """
+    monthly_sum = (
+        Donation.objects
+        .filter(month=OuterRef('month'), year=OuterRef('year'), currency=OuterRef('currency'))
+        .order_by()
+        .values('year', 'month', 'currency')
+        .annotate(total=Sum('amount'))
+        .values('total')
+    )
+    return queryset.annotate(
+        collected_total=Coalesce(
+            Subquery(monthly_sum, output_field=DecimalField(max_digits=14, decimal_places=2)),
+            Value(Decimal('0')),
+            output_field=DecimalField(max_digits=14, decimal_places=2)
+        )
+    )
+
+
+def _totals(target, collected):
+    # Unlike a single target's progress, totals are not capped at 100
+    return {
+        'total_target': float(target),
+        'total_collected': float(collected),
+        'progress_percentage': round(float(collected / target * 100), 2) if target > 0 else 0,
+    }
+
+
+def summarize_progress(targets):
+    """
+    Summarize annotated targets overall, per currency and per year and currency.
+
+    Amounts are only added up within a currency in the per-currency and per-year
+    breakdowns; ``overall`` keeps the historical behaviour of summing raw amounts.
+
+    Returns:
+        dict: ``overall``, ``by_currency`` and ``by_year`` totals
+    """
+    overall = [Decimal('0'), Decimal('0')]
+    by_currency = defaultdict(lambda: [Decimal('0'), Decimal('0')])
+    by_year = defaultdict(lambda: defaultdict(lambda: [Decimal('0'), Decimal('0')]))
+
+    for target in targets:
+        for totals in (overall, by_currency[target.currency], by_year[target.year][target.currency]):
+            totals[0] += target.target_amount
+            totals[1] += target.collected_total
+
+    return {
+        'overall': _totals(*overall),
+        'by_currency': {currency: _totals(*totals) for currency, totals in sorted(by_currency.items())},
+        'by_year': {
+            year: {currency: _totals(*totals) for currency, totals in sorted(currencies.items())}
+            for year, currencies in sorted(by_year.items())
+        },
+    }
@@ -7,6 +7,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from donation.models import DonationTarget
 from donation.api.serializers import DonationTargetSerializer
 from donation.api.utils import success_response, error_response, paginated_response
+from donation.api.target_utils import annotate_collected, summarize_progress
 
 
 class DonationTargetViewSet(viewsets.ModelViewSet):
@@ -23,6 +24,10 @@ class DonationTargetViewSet(viewsets.ModelViewSet):
     ordering_fields = ['year', 'month', 'target_amount']
     ordering = ['-year', '-month']
     
+    def get_queryset(self):
+        """Load targets with their collected amounts in the same query"""
+        return annotate_collected(super().get_queryset())
+    
     def list(self, request, *args, **kwargs):
         """List all targets with standardized response format"""
         queryset = self.filter_queryset(self.get_queryset())
@@ -64,9 +69,11 @@ class DonationTargetViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         if serializer.is_valid():
-            serializer.save()
+            instance = serializer.save()
+            # The loaded collected_total belongs to the old month, year and currency
+            instance = self.get_queryset().get(pk=instance.pk)
             return success_response(
-                data=serializer.data,
+                data=self.get_serializer(instance).data,
                 message="Donation target updated successfully"
             )
         return error_response(
@@ -110,7 +117,7 @@ class DonationTargetViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            target = DonationTarget.objects.get(month=month, year=year)
+            target = self.get_queryset().get(month=month, year=year)
             serializer = self.get_serializer(target)
             return success_response(
                 data=serializer.data,
@@ -138,45 +145,60 @@ class DonationTargetViewSet(viewsets.ModelViewSet):
     def progress_tracker(self, request):
         """
         Get progress tracker data for multiple months.
-        Query params: months (comma-separated), year
-        Example: ?months=1,2,3&year=2024
+        Query params:
+        - year: Single year, or start_year and end_year for a range
+        - months: Comma-separated months (optional, defaults to all months)
+        - currency: Only include targets in this currency (optional)
+        Example: ?months=1,2,3&year=2024 or ?start_year=2023&end_year=2025&currency=USD
         """
         months_param = request.query_params.get('months')
         year = request.query_params.get('year')
+        start_year = request.query_params.get('start_year', year)
+        end_year = request.query_params.get('end_year', year)
+        currency = request.query_params.get('currency')
         
-        if not months_param or not year:
+        if not start_year or not end_year:
             return error_response(
-                message='Both months and year parameters are required',
+                message='Either year or both start_year and end_year parameters are required',
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
         try:
-            months = [int(m.strip()) for m in months_param.split(',')]
-            year = int(year)
+            months = [int(m.strip()) for m in months_param.split(',')] if months_param else None
+            start_year = int(start_year)
+            end_year = int(end_year)
         except ValueError:
             return error_response(
                 message='Invalid months or year format',
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
-        targets = self.get_queryset().filter(month__in=months, year=year)
-        serializer = self.get_serializer(targets, many=True)
+        if start_year > end_year:
+            return error_response(
+                message='start_year must not be after end_year',
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Calculate overall progress
-        total_target = sum(t.target_amount for t in targets)
-        total_collected = sum(t.get_collected_amount() for t in targets)
-        overall_progress = (total_collected / total_target * 100) if total_target > 0 else 0
+        targets = self.get_queryset().filter(year__gte=start_year, year__lte=end_year)
+        if months:
+            targets = targets.filter(month__in=months)
+        if currency:
+            targets = targets.filter(currency=currency)
+        targets = list(targets)
+        serializer = self.get_serializer(targets, many=True)
+        summary = summarize_progress(targets)
         
         return success_response(
             data={
-                'year': year,
+                'year': start_year if start_year == end_year else None,
+                'start_year': start_year,
+                'end_year': end_year,
                 'months': months,
+                'currency': currency,
                 'targets': serializer.data,
-                'overall': {
-                    'total_target': float(total_target),
-                    'total_collected': float(total_collected),
-                    'progress_percentage': round(overall_progress, 2)
-                }
+                'overall': summary['overall'],
+                'by_currency': summary['by_currency'],
+                'by_year': summary['by_year'],
             },
             message="Progress tracker data retrieved successfully"
         )
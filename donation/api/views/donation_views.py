@@ -1,13 +1,30 @@
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models import Q
 
 from donation.models import Donation
-from donation.api.serializers import DonationSerializer, DonationListSerializer
+from donation.api.serializers import DonationSerializer, DonationListSerializer, DonationDeleteFilterSerializer
 from donation.api.utils import success_response, error_response, paginated_response
+from donation.api.delete_utils import delete_donations
+from donation.api.import_utils import import_donations, detect_import_format, IMPORT_FORMATS
+from core.api.export_utils import get_export_format, stream_export, EXPORT_FORMATS
+
+DONATION_EXPORT_COLUMNS = [
+    ('uuid', 'uuid'),
+    ('donor_name', 'donor_name'),
+    ('donor_email', 'donor_email'),
+    ('amount', 'amount'),
+    ('currency', 'currency'),
+    ('method', 'method'),
+    ('month', 'month'),
+    ('year', 'year'),
+    ('notes', 'notes'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
 
 
 class DonationViewSet(viewsets.ModelViewSet):
@@ -110,6 +127,71 @@ class DonationViewSet(viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK
         )
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated, IsAdminUser])
+    def export(self, request):
+        """
+        Stream all donations matching the list filters as CSV or NDJSON.
+        Query params: the list filters, plus export_format (csv or ndjson, default csv)
+        """
+        export_format = get_export_format(request)
+        if export_format is None:
+            return error_response(
+                message=f"export_format must be one of: {', '.join(EXPORT_FORMATS)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_export(request, queryset, DONATION_EXPORT_COLUMNS, export_format, 'donations')
+    
+    @action(detail=False, methods=['post'], url_path='import', permission_classes=[IsAuthenticated, IsAdminUser])
+    def import_file(self, request):
+        """
+        Bulk import donations from an uploaded CSV, NDJSON or JSON file.
+        Multipart body:
+        - file: The batch file (required)
+        - import_format: csv, ndjson or json (optional, defaults to the file extension)
+        - dry_run: true to validate and count rows without writing (optional)
+        
+        Rows with an external_id are upserted on it, so re-importing them is safe; rows
+        without one are inserted again. Invalid rows are skipped and reported with their
+        row number. If parsing fails part way, the rows before the error are kept and
+        the error is reported in parse_error.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return error_response(
+                message='A file upload is required',
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        
+        import_format = request.data.get('import_format') or detect_import_format(upload.name)
+        if import_format not in IMPORT_FORMATS:
+            return error_response(
+                message=f"import_format must be one of: {', '.join(IMPORT_FORMATS)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+        
+        report = import_donations(upload.file, import_format, dry_run=dry_run)
+        written = report['created'] + report['updated']
+        if report['parse_error'] and (dry_run or not written):
+            return error_response(
+                message=f"Could not parse the import file: {report['parse_error']}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if report['parse_error']:
+            # Rows before the error are already saved; report them rather than fail
+            return success_response(
+                data=report,
+                message=f"Import stopped at a parse error after {written} donation(s) were imported: "
+                        f"{report['parse_error']}"
+            )
+        
+        action_text = 'validated' if dry_run else 'imported'
+        return success_response(
+            data=report,
+            message=f"{report['valid_rows']} of {report['total_rows']} donation(s) {action_text}"
+        )
+    
     @action(detail=False, methods=['get'])
     def by_month(self, request):
         """
@@ -175,19 +257,40 @@ class DonationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['delete'])
     def bulk_delete(self, request):
         """
-        Bulk delete donations by UUIDs.
-        Body: {"uuids": ["uuid1", "uuid2", "uuid3"]}
+        Bulk delete donations by UUIDs or by filter, in short chunked transactions.
+        Body (at least one filter is required):
+        - uuids: ["uuid1", "uuid2", "uuid3"]
+        - start_date, end_date: YYYY-MM-DD, inclusive (admin only)
+        - currency, method, donor_email, year, month (admin only)
+        - dry_run: true to only count the matching donations (optional)
         """
-        uuids = request.data.get('uuids', [])
-        if not uuids:
+        serializer = DonationDeleteFilterSerializer(data=request.data)
+        if not serializer.is_valid():
             return error_response(
-                message='UUIDs array is required',
+                message='Validation failed',
+                errors=serializer.errors,
                 status_code=status.HTTP_400_BAD_REQUEST
             )
+        filters = serializer.validated_data
+        if set(filters) - {'uuids'} and not request.user.is_staff:
+            return error_response(
+                message='Only admins can bulk delete donations by filter',
+                status_code=status.HTTP_403_FORBIDDEN
+            )
+        dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
         
-        deleted_count = self.get_queryset().filter(uuid__in=uuids).delete()[0]
+        report = delete_donations(filters, dry_run=dry_run, queryset=self.get_queryset())
+        if dry_run:
+            return success_response(
+                data=report,
+                message=f"{report['matched']} donation(s) match the filters"
+            )
         
-        return success_response(
-            data={'deleted_count': deleted_count},
-            message=f'Successfully deleted {deleted_count} donation(s)'
-        )
+        report['deleted_count'] = report['deleted']
+        message = f"Successfully deleted {report['deleted']} donation(s)"
+        if report['remaining']:
+            message = (
+                f"Deleted {report['deleted']} donation(s); {report['remaining']} are locked "
+                f"by other requests, retry later"
+            )
+        return success_response(data=report, message=message)
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.api.bulk_delete_utils import DEFAULT_BATCH_SIZE
+from donation.api.delete_utils import delete_donations
+from donation.api.serializers import DonationDeleteFilterSerializer
+
+
+class Command(BaseCommand):
+    help = 'Delete donations matching filters in short, chunked transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-date', help='Delete donations created on or after this date (YYYY-MM-DD)')
+        parser.add_argument('--end-date', help='Delete donations created on or before this date (YYYY-MM-DD)')
+        parser.add_argument('--currency', help='Only delete donations in this currency')
+        parser.add_argument('--method', help='Only delete donations made with this method')
+        parser.add_argument('--donor-email', help="Only delete this donor's donations")
+        parser.add_argument('--year', type=int, help='Only delete donations for this year')
+        parser.add_argument('--month', type=int, help='Only delete donations for this month')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'Most rows deleted per transaction (default: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help='Stop after this many batches (default: run until done)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many donations match')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        data = {
+            field: options[field]
+            for field in ('start_date', 'end_date', 'currency', 'method', 'donor_email', 'year', 'month')
+            if options[field] is not None
+        }
+        serializer = DonationDeleteFilterSerializer(data=data)
+        if not serializer.is_valid():
+            raise CommandError(f'Invalid filters: {serializer.errors}')
+
+        def progress(report):
+            self.stdout.write(
+                f"Batch {report['batches']}: {report['deleted']} deleted so far "
+                f"(batch size {report['batch_size']}, {report['elapsed_seconds']}s)"
+            )
+
+        report = delete_donations(
+            serializer.validated_data,
+            dry_run=options['dry_run'],
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            progress=progress
+        )
+
+        if report['dry_run']:
+            self.stdout.write(f"Dry run: {report['matched']} donations match the filters")
+            return
+
+        status = 'Deleted' if report['complete'] else 'Stopped early after deleting'
+        self.stdout.write(self.style.SUCCESS(
+            f"{status} {report['deleted']} of {report['matched']} donations in {report['batches']} batches "
+            f"({report['elapsed_seconds']}s, {report['rows_per_second']} rows/s)"
+        ))
+        if report['remaining']:
+            self.stdout.write(self.style.WARNING(
+                f"{report['remaining']} matching donations stayed locked by other transactions; run again to delete them"
+            ))
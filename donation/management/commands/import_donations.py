@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from donation.api.import_utils import (
+    import_donations, detect_import_format, IMPORT_FORMATS, IMPORT_BATCH_SIZE
+)
+
+
+class Command(BaseCommand):
+    help = 'Bulk import donations from a CSV, NDJSON or JSON file, upserting on external_id'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='File to import')
+        parser.add_argument('--format', dest='import_format', choices=IMPORT_FORMATS,
+                            help='File format (default: from the file extension, else csv)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Validate and count rows without writing anything')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+                            help=f'Rows written per statement (default: {IMPORT_BATCH_SIZE})')
+        parser.add_argument('--show-errors', type=int, default=20,
+                            help='Number of row errors to print (default: 20)')
+
+    def handle(self, *args, **kwargs):
+        path = kwargs['path']
+        import_format = kwargs['import_format'] or detect_import_format(path)
+        if kwargs['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        try:
+            with open(path, 'rb') as stream:
+                report = import_donations(
+                    stream, import_format, dry_run=kwargs['dry_run'], batch_size=kwargs['batch_size']
+                )
+        except OSError as e:
+            raise CommandError(f'Cannot read {path}: {e}')
+
+        for error in report['errors'][:kwargs['show_errors']]:
+            self.stdout.write(self.style.WARNING(f"Row {error['row']}: {error['errors']}"))
+
+        prefix = 'Dry run: would import' if report['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix} {report['valid_rows']} of {report['total_rows']} rows "
+            f"({report['created']} created, {report['updated']} updated, "
+            f"{report['duplicates']} duplicates), {report['invalid_rows']} invalid"
+        ))
+        if report['parse_error']:
+            written = 'were not written' if report['dry_run'] else 'are already saved'
+            raise CommandError(
+                f"Stopped at a parse error in {path}: {report['parse_error']} "
+                f"(rows before it {written})"
+            )
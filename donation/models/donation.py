@@ -60,6 +60,13 @@ class Donation(models.Model):
         help_text="Year of donation"
     )
     notes = models.TextField(blank=True, null=True, help_text="Additional notes")
+    external_id = models.CharField(
+        max_length=100,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text="Payment processor reference; bulk imports upsert on it"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -61,13 +61,15 @@ class DonationTarget(models.Model):
     
     def get_collected_amount(self):
         """Calculate total collected donations for this target period"""
+        # Targets loaded with annotate_collected() already carry the sum
+        if hasattr(self, 'collected_total'):
+            return self.collected_total
         from .donation import Donation
-        donations = Donation.objects.filter(
+        return Donation.objects.filter(
             month=self.month,
             year=self.year,
             currency=self.currency
-        )
-        return sum(d.amount for d in donations)
+        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0')
     
     def get_progress_percentage(self):
         """Calculate progress percentage"""
@@ -0,0 +1,48 @@
+import threading
+import weakref
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from donation.models import Donation
+from donation.api.stats_utils import invalidate_donation_stats
+from accounts.api.metrics_utils import rollup_donations
+
+# Days changed in the current transaction, refreshed once when it commits
+_pending = threading.local()
+
+
+def _refresh_changed_days():
+    _pending.registered = None
+    days = getattr(_pending, 'days', None)
+    if not days:
+        return
+    _pending.days = set()
+    today = timezone.localdate()
+    for day in sorted(days):
+        if day < today:
+            rollup_donations(day)
+    invalidate_donation_stats()
+
+
+@receiver(post_save, sender=Donation)
+@receiver(post_delete, sender=Donation)
+def donation_changed(sender, instance, **kwargs):
+    """
+    Keep past days' donation rollups in sync and drop cached donation statistics.
+
+    The work is deferred to the end of the transaction, so a bulk delete of many
+    donations re-rolls each affected day once rather than once per row.
+    """
+    if getattr(_pending, 'days', None) is None:
+        _pending.days = set()
+    _pending.days.add(timezone.localtime(instance.created_at).date())
+    # Register the refresh once per transaction. The flag is a weak reference to
+    # the registered callback: a rollback discards (and frees) the callback, which
+    # clears the flag, so the next change registers it again
+    registered = getattr(_pending, 'registered', None)
+    if registered is None or registered() is None:
+        def refresh():
+            _refresh_changed_days()
+        _pending.registered = weakref.ref(refresh)
+        transaction.on_commit(refresh)
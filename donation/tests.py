@@ -1,3 +1,74 @@
-from django.test import TestCase
+import os
+import time
+import tracemalloc
+from decimal import Decimal
+from unittest import skipUnless
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from core.api.export_utils import stream_export
+from donation.models import Donation
+from donation.api.views.donation_views import DONATION_EXPORT_COLUMNS
 
-# Create your tests here.
+# Benchmarks build large fixtures and only run with RUN_BENCHMARKS=1, e.g.
+# RUN_BENCHMARKS=1 python manage.py test donation.tests.DonationExportBenchmark
+RUN_BENCHMARKS = bool(os.environ.get('RUN_BENCHMARKS'))
+
+
+@skipUnless(RUN_BENCHMARKS, 'Set RUN_BENCHMARKS=1 to run benchmarks')
+class DonationExportBenchmark(TestCase):
+    """
+    Throughput and peak Python memory of a streamed donation export.
+    """
+
+    rows_count = int(os.environ.get('BENCHMARK_EXPORT_ROWS', 1000000))
+
+    @classmethod
+    def setUpTestData(cls):
+        batch_size = 10000
+        for start in range(0, cls.rows_count, batch_size):
+            Donation.objects.bulk_create([
+                Donation(
+                    donor_name=f'Donor {i}',
+                    donor_email=f'donor{i}@example.com',
+                    amount=Decimal(i % 1000 + 1),
+                    currency='USD',
+                    method='Card',
+                    month=i % 12 + 1,
+                    year=2024,
+                )
+                for i in range(start, min(start + batch_size, cls.rows_count))
+            ])
+
+    def consume(self, export_format):
+        request = RequestFactory().get('/')
+        response = stream_export(request, Donation.objects.all(), DONATION_EXPORT_COLUMNS, export_format, 'donations')
+        size = lines = 0
+        for chunk in response.streaming_content:
+            size += len(chunk)
+            lines += chunk.count(b'\n')
+        return size, lines
+
+    def export(self, export_format):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            size, lines = self.consume(export_format)
+            elapsed = time.perf_counter() - started
+        # Memory is traced in a second pass; tracing slows the export several times over
+        tracemalloc.start()
+        self.consume(export_format)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f'{export_format}: {self.rows_count} rows in {elapsed:.1f}s '
+            f'({self.rows_count / elapsed:,.0f} rows/s), {size / 1e6:.0f} MB written, '
+            f'peak {peak / 1e6:.1f} MB, {len(queries)} queries'
+        )
+        return lines
+
+    def test_csv_export(self):
+        # Header row plus one line per donation
+        self.assertEqual(self.export('csv'), self.rows_count + 1)
+
+    def test_ndjson_export(self):
+        self.assertEqual(self.export('ndjson'), self.rows_count)
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db import models
+from django.utils import timezone
 import logging
 
 from exchange.models import Exchange
@@ -14,6 +15,9 @@ from exchange.api.serializers.admin import (
     ExchangeRejectSerializer,
     AdminExchangeListSerializer
 )
+from core.api.serializers import BulkModerationSerializer, ModerationClaimSerializer, ModerationReleaseSerializer
+from core.api.moderation_utils import bulk_moderate, summarize_results, claim_next, release_claims
+from notification.api.exchange_notifications import send_bulk_exchange_moderation_notifications
 
 logger = logging.getLogger(__name__)
 
@@ -194,6 +198,91 @@ class AdminExchangeViewSet(viewsets.ViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=['post'], url_path='claim')
+    def claim(self, request):
+        """
+        Claim the next pending exchange applications from the moderation queue.
+        Claimed items are reserved for this admin until the lease expires, so
+        moderators working the queue concurrently get disjoint batches.
+        
+        POST /api/admin-exchange/claim/
+        Request body: { "limit": 20, "lease_seconds": 900 }
+        """
+        try:
+            serializer = ModerationClaimSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            claimed, expires_at = claim_next(
+                Exchange,
+                'under_review',
+                request.user,
+                limit=serializer.validated_data['limit'],
+                lease_seconds=serializer.validated_data['lease_seconds']
+            )
+            items = {item.pk: item for item in self.get_queryset().filter(pk__in=claimed)}
+            data = AdminExchangeListSerializer([items[pk] for pk in claimed if pk in items], many=True).data
+            
+            logger.info(f"Admin {request.user.email} claimed {len(claimed)} pending exchange applications")
+            
+            return Response({
+                'success': True,
+                'message': f"{len(claimed)} exchange applications claimed",
+                'data': {
+                    'lease_expires_at': expires_at.isoformat(),
+                    'count': len(data),
+                    'results': data
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error claiming exchange applications: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to claim exchange applications',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=False, methods=['post'], url_path='release')
+    def release(self, request):
+        """
+        Return claimed exchange applications to the moderation queue.
+        Releases all of this admin's claims when no UUIDs are given.
+        
+        POST /api/admin-exchange/release/
+        Request body: { "uuids": ["uuid-1"] }
+        """
+        try:
+            serializer = ModerationReleaseSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            released = release_claims(Exchange, request.user, serializer.validated_data.get('uuids'))
+            
+            return Response({
+                'success': True,
+                'message': f"{released} exchange applications released",
+                'data': {
+                    'released': released
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error releasing exchange applications: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to release exchange applications',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     @action(detail=False, methods=['get'], url_path='approved')
     def approved(self, request):
         """
@@ -278,6 +367,18 @@ class AdminExchangeViewSet(viewsets.ViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @staticmethod
+    def _notify_owner(exchange, approved, reason=None):
+        """Notify an exchange's owner that it was approved or rejected."""
+        try:
+            send_bulk_exchange_moderation_notifications(
+                [(exchange.uuid, exchange.user_id, exchange.business_name, exchange.seller_type)],
+                approved=approved,
+                reason=reason
+            )
+        except Exception as notify_err:
+            logger.warning(f"Failed to send exchange moderation notification for {exchange.uuid}: {notify_err}")
+
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         """
@@ -294,10 +395,19 @@ class AdminExchangeViewSet(viewsets.ViewSet):
             serializer.is_valid(raise_exception=True)
             
             # Update exchange status
+            changed = exchange.status != 'approved'
             exchange.status = 'approved'
             exchange.rejection_reason = None  # Clear rejection reason if any
+            exchange.moderated_by = request.user
+            exchange.moderated_at = timezone.now()
+            exchange.claimed_by = None
+            exchange.claim_expires_at = None
             exchange.save()
             
+            # Notify the owner the same way bulk moderation does
+            if changed:
+                self._notify_owner(exchange, approved=True)
+            
             logger.info(f"Exchange {exchange.uuid} approved by admin {request.user.email}")
             
             return Response({
@@ -340,10 +450,19 @@ class AdminExchangeViewSet(viewsets.ViewSet):
             serializer.is_valid(raise_exception=True)
             
             # Update exchange status and rejection reason
+            changed = exchange.status != 'rejected'
             exchange.status = 'rejected'
             exchange.rejection_reason = serializer.validated_data['rejection_reason']
+            exchange.moderated_by = request.user
+            exchange.moderated_at = timezone.now()
+            exchange.claimed_by = None
+            exchange.claim_expires_at = None
             exchange.save()
             
+            # Notify the owner the same way bulk moderation does
+            if changed:
+                self._notify_owner(exchange, approved=False, reason=exchange.rejection_reason)
+            
             logger.info(f"Exchange {exchange.uuid} rejected by admin {request.user.email}: {exchange.rejection_reason}")
             
             return Response({
@@ -369,3 +488,72 @@ class AdminExchangeViewSet(viewsets.ViewSet):
                 'message': 'Failed to reject exchange',
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=False, methods=['post'], url_path='bulk-moderate')
+    def bulk_moderate(self, request):
+        """
+        Approve or reject many exchange applications in one request.
+        Statuses are changed with a single UPDATE and owners are notified in bulk.
+        
+        POST /api/admin-exchange/bulk-moderate/
+        Request body: {
+            "uuids": ["uuid-1", "uuid-2"],
+            "action": "approve" | "reject",
+            "rejection_reason": "Required when rejecting"
+        }
+        """
+        try:
+            serializer = BulkModerationSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            action_name = serializer.validated_data['action']
+            rejection_reason = serializer.validated_data['rejection_reason']
+            
+            def notify(rows, new_status):
+                send_bulk_exchange_moderation_notifications(
+                    [
+                        (row['uuid'], row['user_id'], row['business_name'], row['seller_type'])
+                        for row in rows
+                    ],
+                    approved=new_status == 'approved',
+                    reason=rejection_reason
+                )
+            
+            results = bulk_moderate(
+                Exchange,
+                serializer.validated_data['uuids'],
+                action_name,
+                request.user,
+                rejection_reason=rejection_reason,
+                notify=notify,
+                notify_fields=('business_name', 'seller_type')
+            )
+            summary = summarize_results(results)
+            
+            logger.info(
+                f"Admin {request.user.email} bulk {action_name}d exchanges: "
+                f"{summary['updated']} updated, {summary['unchanged']} unchanged, {summary['not_found']} not found"
+            )
+            
+            return Response({
+                'success': True,
+                'message': f"Bulk {action_name} completed",
+                'data': {
+                    'action': action_name,
+                    'summary': summary,
+                    'results': results
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error bulk moderating exchanges: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to moderate exchanges',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
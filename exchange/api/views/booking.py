@@ -1,7 +1,7 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.utils import timezone
@@ -18,6 +18,26 @@ from exchange.api.serializers import (
     CancelBookingSerializer,
     BookingStatusUpdateSerializer
 )
+from core.api.export_utils import get_export_format, stream_export, EXPORT_FORMATS
+
+BOOKING_EXPORT_COLUMNS = [
+    ('uuid', 'uuid'),
+    ('status', 'status'),
+    ('customer_name', 'customer_name'),
+    ('customer_email', 'customer_email'),
+    ('customer_phone', 'customer_phone'),
+    ('user_email', 'user__email'),
+    ('exchange_uuid', 'exchange_id'),
+    ('exchange_name', 'exchange__business_name'),
+    ('date', 'time_slot__date'),
+    ('start_time', 'time_slot__start_time'),
+    ('end_time', 'time_slot__end_time'),
+    ('notes', 'notes'),
+    ('cancelled_at', 'cancelled_at'),
+    ('cancellation_reason', 'cancellation_reason'),
+    ('admin_notes', 'admin_notes'),
+    ('created_at', 'created_at'),
+]
 
 
 class BusinessHoursViewSet(viewsets.ModelViewSet):
@@ -578,6 +598,26 @@ class BookingViewSet(viewsets.ModelViewSet):
             status=status.HTTP_400_BAD_REQUEST
         )
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated, IsAdminUser])
+    def export(self, request):
+        """
+        Stream bookings as CSV or NDJSON.
+        
+        Query params: the list filters (view, exchange, status), plus export_format
+        (csv or ndjson, default csv). Use view=exchange_bookings without an exchange
+        to export every booking.
+        """
+        export_format = get_export_format(request)
+        if export_format is None:
+            return Response(
+                {
+                    'success': False,
+                    'message': f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return stream_export(request, self.get_queryset(), BOOKING_EXPORT_COLUMNS, export_format, 'bookings')
+    
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def upcoming(self, request):
         """Get user's upcoming bookings."""
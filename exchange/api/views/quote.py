@@ -1,7 +1,7 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from exchange.models import ExchangeQuote, Exchange
 from exchange.api.serializers.quote import (
     ExchangeQuoteSerializer,
@@ -10,6 +10,22 @@ from exchange.api.serializers.quote import (
 )
 from exchange.api.pagination import StandardPagination
 from django.db.models import Q
+from core.api.export_utils import get_export_format, stream_export, EXPORT_FORMATS
+
+QUOTE_EXPORT_COLUMNS = [
+    ('uuid', 'uuid'),
+    ('status', 'status'),
+    ('exchange_uuid', 'exchange_id'),
+    ('exchange_name', 'exchange__business_name'),
+    ('user_email', 'user__email'),
+    ('name', 'name'),
+    ('email', 'email'),
+    ('description', 'description'),
+    ('mini_range', 'mini_range'),
+    ('maxi_range', 'maxi_range'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
 
 
 class ExchangeQuoteViewSet(viewsets.ModelViewSet):
@@ -66,6 +82,23 @@ class ExchangeQuoteViewSet(viewsets.ModelViewSet):
             'data': ExchangeQuoteSerializer(quote).data
         }, status=status.HTTP_201_CREATED)
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated, IsAdminUser])
+    def export(self, request):
+        """
+        Stream quote requests as CSV or NDJSON.
+        
+        Query params: the list filters (status, exchange), plus export_format
+        (csv or ndjson, default csv)
+        """
+        export_format = get_export_format(request)
+        if export_format is None:
+            return Response({
+                'success': False,
+                'message': f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        queryset = self.get_queryset().order_by('-created_at')
+        return stream_export(request, queryset, QUOTE_EXPORT_COLUMNS, export_format, 'exchange-quotes')
+    
     @action(detail=False, methods=['get'])
     def my_quotes(self, request):
         """
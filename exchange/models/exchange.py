@@ -70,6 +70,28 @@ class Exchange(models.Model):
         blank=True,
         help_text="Reason provided by admin if exchange is rejected"
     )
+    moderated_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='moderated_exchanges',
+        null=True,
+        blank=True,
+        help_text="Admin who last approved or rejected the exchange"
+    )
+    moderated_at = models.DateTimeField(null=True, blank=True, help_text="When the exchange was last approved or rejected")
+    claimed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Admin currently reviewing this exchange from the moderation queue"
+    )
+    claim_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the moderation queue claim lapses"
+    )
 
     is_active = models.BooleanField(default=True)
 
@@ -85,6 +107,8 @@ class Exchange(models.Model):
             models.Index(fields=['category']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
+            # Moderation queue: oldest pending first
+            models.Index(fields=['status', 'created_at']),
         ]
     
     def __str__(self):
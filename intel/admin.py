@@ -1,5 +1,5 @@
 from django.contrib import admin
-from intel.models import Intel, IntelMedia, IntelLike, IntelComment, CommentLike, IntelCategory
+from intel.models import Intel, IntelMedia, IntelLike, IntelComment, CommentLike, IntelCategory, IntelTrendingScore
 
 
 @admin.register(IntelCategory)
@@ -126,3 +126,11 @@ class CommentLikeAdmin(admin.ModelAdmin):
     ordering = ['-created_at']
 
 
+@admin.register(IntelTrendingScore)
+class IntelTrendingScoreAdmin(admin.ModelAdmin):
+    """Admin interface for Intel trending scores."""
+    list_display = ['intel', 'score', 'category', 'urgency', 'updated_at']
+    list_filter = ['urgency', 'category']
+    search_fields = ['intel__uuid']
+    readonly_fields = ['intel', 'score', 'category', 'urgency', 'updated_at']
+    ordering = ['-score']
@@ -0,0 +1,168 @@
+"""
+Utility functions for maintaining intel comment and reply counters.
+"""
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value, Window
+from django.db.models.functions import Coalesce, Greatest, RowNumber
+from intel.models import Intel, IntelComment, IntelLike, CommentLike
+
+
+def increment_comment_counters(comment):
+    """
+    Count a newly created comment on its intel and, for replies, on the parent comment.
+
+    Uses ``F()`` updates so the cost does not grow with the size of the thread.
+    """
+    with transaction.atomic():
+        Intel.objects.filter(pk=comment.intel_id).update(comments_count=F('comments_count') + 1)
+        if comment.parent_comment_id:
+            IntelComment.objects.filter(pk=comment.parent_comment_id).update(
+                replies_count=F('replies_count') + 1
+            )
+
+
+def delete_comment(comment):
+    """
+    Delete a comment and uncount it (plus its cascaded replies) from the intel and parent.
+    """
+    with transaction.atomic():
+        removed = 1
+        if not comment.parent_comment_id:
+            # Replies are removed by the cascade and were counted on the intel too
+            removed += IntelComment.objects.filter(parent_comment_id=comment.pk).count()
+
+        comment.delete()
+
+        Intel.objects.filter(pk=comment.intel_id).update(
+            comments_count=Greatest(F('comments_count') - removed, 0)
+        )
+        if comment.parent_comment_id:
+            IntelComment.objects.filter(pk=comment.parent_comment_id).update(
+                replies_count=Greatest(F('replies_count') - 1, 0)
+            )
+    return removed
+
+
+REPLY_PREVIEW_LIMIT = 5
+
+
+def get_liked_comment_ids(comment_ids, user):
+    """
+    Return the subset of ``comment_ids`` the user has liked, in one query.
+    """
+    if not user or not user.is_authenticated or not comment_ids:
+        return set()
+    return set(
+        CommentLike.objects.filter(user=user, comment_id__in=comment_ids).values_list('comment_id', flat=True)
+    )
+
+
+def load_comment_threads(comments, user, replies_per_comment=REPLY_PREVIEW_LIMIT):
+    """
+    Load reply previews and viewer like-state for a page of top-level comments.
+
+    The first ``replies_per_comment`` replies of every comment are fetched with a single
+    ``ROW_NUMBER() OVER (PARTITION BY parent_comment)`` query, and likes for all comments
+    and replies with one more query, instead of one query per comment and per reply.
+
+    Returns:
+        dict: serializer context entries ``reply_previews`` (parent uuid -> replies)
+        and ``liked_comment_ids`` (set of liked comment uuids)
+    """
+    comment_ids = [comment.pk for comment in comments]
+    reply_previews = {comment_id: [] for comment_id in comment_ids}
+
+    if comment_ids:
+        replies = (
+            IntelComment.objects
+            .filter(parent_comment_id__in=comment_ids)
+            .select_related('user', 'user__profile')
+            .annotate(
+                preview_position=Window(
+                    expression=RowNumber(),
+                    partition_by=[F('parent_comment_id')],
+                    order_by=F('created_at').desc()
+                )
+            )
+            .filter(preview_position__lte=replies_per_comment)
+            .order_by('parent_comment_id', 'preview_position')
+        )
+        for reply in replies:
+            reply_previews[reply.parent_comment_id].append(reply)
+
+    reply_ids = [reply.pk for previews in reply_previews.values() for reply in previews]
+    return {
+        'reply_previews': reply_previews,
+        'liked_comment_ids': get_liked_comment_ids(comment_ids + reply_ids, user),
+    }
+
+
+def _count_subquery(model, field, **filters):
+    counts = (
+        model.objects
+        .filter(**{field: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def _reconcile(queryset, counters, batch_size):
+    """
+    Rewrite denormalized counters that drifted from the real row counts.
+
+    Drifted rows are found first, then fixed in chunks with an ``UPDATE ... SET
+    counter = (SELECT COUNT ...)`` so the written value is computed at write time and
+    likes or comments arriving during the run are not overwritten.
+
+    Args:
+        queryset: Intel or IntelComment queryset to check
+        counters: dict of counter field name -> count expression
+        batch_size: rows updated per statement
+
+    Returns:
+        int: number of rows fixed
+    """
+    annotations = {f'actual_{field}': expression for field, expression in counters.items()}
+    drifted = Q()
+    for field in counters:
+        drifted |= ~Q(**{field: F(f'actual_{field}')})
+
+    drifted_pks = list(
+        queryset.annotate(**annotations).filter(drifted).values_list('pk', flat=True)
+    )
+    for start in range(0, len(drifted_pks), batch_size):
+        queryset.model.objects.filter(pk__in=drifted_pks[start:start + batch_size]).update(**counters)
+    return len(drifted_pks)
+
+
+def reconcile_counters(batch_size=1000):
+    """
+    Fix drift in intel ``comments_count``/``likes_count`` and comment
+    ``replies_count``/``likes_count``, e.g. after deletes done from the Django admin.
+
+    Returns:
+        dict: number of intel posts and comments corrected
+    """
+    intels_fixed = _reconcile(
+        Intel.objects.all(),
+        {
+            'comments_count': _count_subquery(IntelComment, 'intel'),
+            'likes_count': _count_subquery(IntelLike, 'intel'),
+        },
+        batch_size
+    )
+    comments_fixed = _reconcile(
+        IntelComment.objects.all(),
+        {
+            'replies_count': _count_subquery(IntelComment, 'parent_comment'),
+            'likes_count': _count_subquery(CommentLike, 'comment'),
+        },
+        batch_size
+    )
+    return {
+        'intels_fixed': intels_fixed,
+        'comments_fixed': comments_fixed,
+    }
@@ -0,0 +1,97 @@
+"""
+Utility functions for building the personalized intel feed.
+
+The feed is built fan-out-on-read with a bounded candidate set: the most recent
+approved intel from followed users plus the most engaging approved intel overall,
+both limited to a recent window. Candidates are scored by recency-decayed engagement
+and the ranked list of UUIDs is cached per user so paging through it is stable and
+only the requested page is loaded from the database.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+from network.models import Follow
+from intel.models import Intel
+
+FEED_WINDOW_DAYS = 14
+FOLLOWED_CANDIDATE_LIMIT = 500
+TRENDING_CANDIDATE_LIMIT = 200
+FEED_CACHE_TIMEOUT = 120
+FEED_CACHE_KEY = 'intel:feed:{user_id}'
+
+# Score = (1 + likes + 2 * comments) / (age_hours + 2) ^ GRAVITY, boosted for followed authors
+COMMENT_WEIGHT = 2
+GRAVITY = 1.5
+FOLLOWED_BOOST = 3.0
+
+CANDIDATE_FIELDS = ('uuid', 'user_id', 'likes_count', 'comments_count', 'created_at')
+
+
+def score_intel(likes_count, comments_count, created_at, now, followed=False):
+    """
+    Recency-decayed engagement score for an intel post.
+    """
+    age_hours = max((now - created_at).total_seconds() / 3600, 0)
+    engagement = 1 + likes_count + COMMENT_WEIGHT * comments_count
+    score = engagement / (age_hours + 2) ** GRAVITY
+    return score * FOLLOWED_BOOST if followed else score
+
+
+def build_feed(user):
+    """
+    Rank feed candidates for a user.
+
+    Runs two bounded queries (followed authors and global trending) regardless of how
+    many users or posts exist.
+
+    Returns:
+        list: intel UUIDs ordered by score, highest first
+    """
+    now = timezone.now()
+    since = now - timezone.timedelta(days=FEED_WINDOW_DAYS)
+    recent = Intel.objects.filter(status='approved', created_at__gte=since)
+
+    followed_authors = Follow.objects.filter(follower=user).values('following')
+    followed = (
+        recent
+        .filter(user__in=followed_authors)
+        .order_by('-created_at')
+        .values(*CANDIDATE_FIELDS)[:FOLLOWED_CANDIDATE_LIMIT]
+    )
+    trending = (
+        recent
+        .order_by('-likes_count', '-comments_count', '-created_at')
+        .values(*CANDIDATE_FIELDS)[:TRENDING_CANDIDATE_LIMIT]
+    )
+
+    scores = {}
+    for row in followed:
+        scores[row['uuid']] = score_intel(
+            row['likes_count'], row['comments_count'], row['created_at'], now, followed=True
+        )
+    for row in trending:
+        if row['uuid'] not in scores:
+            scores[row['uuid']] = score_intel(
+                row['likes_count'], row['comments_count'], row['created_at'], now
+            )
+
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+def get_feed(user, refresh=False):
+    """
+    Return the user's ranked feed UUIDs, served from cache when possible.
+    """
+    key = FEED_CACHE_KEY.format(user_id=user.pk)
+    feed = None if refresh else cache.get(key)
+    if feed is None:
+        feed = build_feed(user)
+        cache.set(key, feed, FEED_CACHE_TIMEOUT)
+    return feed
+
+
+def load_feed_page(uuids, queryset):
+    """
+    Load intel objects for a page of feed UUIDs, preserving feed order.
+    """
+    intels = {intel.pk: intel for intel in queryset.filter(uuid__in=uuids)}
+    return [intels[uuid] for uuid in uuids if uuid in intels]
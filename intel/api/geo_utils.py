@@ -0,0 +1,267 @@
+"""
+Utility functions for intel geolocation.
+
+Coordinates are stored as plain latitude/longitude floats plus a geohash string, so
+"near me" lookups run on any database: the search circle is covered by a few geohash
+cells, matched with ``geohash LIKE 'cell%'`` against a B-tree index, narrowed by the
+bounding box and finally ranked by exact great-circle distance. Coordinates come from
+the client or, failing that, from an optional offline gazetteer of place names.
+"""
+import csv
+import logging
+import math
+from functools import lru_cache
+from django.conf import settings
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Q, Value, When
+
+logger = logging.getLogger(__name__)
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+# Upper bound on geohash cells used to cover a search circle
+MAX_COVER_CELLS = 16
+
+DEFAULT_GEO_SETTINGS = {
+    # CSV with name,latitude,longitude rows (e.g. a GeoNames cities extract)
+    'GAZETTEER_PATH': None,
+    'DEFAULT_RADIUS_KM': 10,
+    'MAX_RADIUS_KM': 100,
+    # Upper bound on intel ranked per nearby request
+    'MAX_CANDIDATES': 2000,
+}
+
+
+def get_geo_settings():
+    """Return geo settings merged over the defaults"""
+    return {**DEFAULT_GEO_SETTINGS, **getattr(settings, 'INTEL_GEO', {})}
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """
+    Encode a coordinate as a geohash of ``precision`` characters.
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        value, value_range = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            value_range[0] = mid
+        else:
+            value_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def geohash_cell_size(precision):
+    """
+    Return the (latitude, longitude) size in degrees of a geohash cell.
+    """
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """
+    Great-circle distance between two coordinates in kilometres.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    Return (min_lat, max_lat, min_lng, max_lng) enclosing a circle.
+
+    Longitudes may fall outside [-180, 180] when the box crosses the antimeridian;
+    the box spans all longitudes when it reaches a pole.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    min_lat = max(latitude - lat_delta, -90.0)
+    max_lat = min(latitude + lat_delta, 90.0)
+
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if min_lat <= -90.0 or max_lat >= 90.0 or cos_lat <= 0:
+        return min_lat, max_lat, -180.0, 180.0
+
+    lng_delta = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if lng_delta >= 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, longitude - lng_delta, longitude + lng_delta
+
+
+def _wrap_longitude(longitude):
+    return (longitude + 180.0) % 360.0 - 180.0
+
+
+def geohash_cover(min_lat, max_lat, min_lng, max_lng):
+    """
+    Return the geohash prefixes of the cells covering a bounding box.
+
+    Uses the longest prefix for which the box needs at most ``MAX_COVER_CELLS`` cells,
+    so each prefix maps to one narrow range scan on the geohash index.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        cell_lat, cell_lng = geohash_cell_size(precision)
+        lat_cells = math.floor(max_lat / cell_lat) - math.floor(min_lat / cell_lat) + 1
+        lng_cells = math.floor(max_lng / cell_lng) - math.floor(min_lng / cell_lng) + 1
+        if lat_cells * lng_cells <= MAX_COVER_CELLS:
+            break
+    else:
+        return ['']
+
+    cells = set()
+    for lat_index in range(lat_cells):
+        cell_center_lat = (math.floor(min_lat / cell_lat) + lat_index + 0.5) * cell_lat
+        for lng_index in range(lng_cells):
+            cell_center_lng = (math.floor(min_lng / cell_lng) + lng_index + 0.5) * cell_lng
+            cells.add(encode_geohash(
+                min(max(cell_center_lat, -90.0), 90.0),
+                _wrap_longitude(cell_center_lng),
+                precision
+            ))
+    return sorted(cells)
+
+
+def normalize_place_name(name):
+    """Lowercase and collapse whitespace for gazetteer lookups"""
+    return ' '.join(name.lower().split())
+
+
+@lru_cache(maxsize=1)
+def _load_gazetteer(path):
+    gazetteer = {}
+    if not path:
+        return gazetteer
+    try:
+        with open(path, newline='', encoding='utf-8') as gazetteer_file:
+            for row in csv.DictReader(gazetteer_file):
+                try:
+                    gazetteer.setdefault(
+                        normalize_place_name(row['name']),
+                        (float(row['latitude']), float(row['longitude']))
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+    except OSError as e:
+        logger.error(f"Failed to load intel gazetteer from {path}: {str(e)}")
+    else:
+        logger.info(f"Loaded {len(gazetteer)} gazetteer places from {path}")
+    return gazetteer
+
+
+def resolve_location(location):
+    """
+    Look up coordinates for a free-text location in the offline gazetteer.
+
+    The full text is tried first, then each comma-separated part from the most
+    specific ("Main Street, Springfield, USA" -> "springfield" -> "usa").
+
+    Returns:
+        tuple: (latitude, longitude), or None if the place is unknown
+    """
+    if not location:
+        return None
+    gazetteer = _load_gazetteer(get_geo_settings()['GAZETTEER_PATH'])
+    if not gazetteer:
+        return None
+
+    candidates = [location] + location.split(',')
+    for candidate in candidates:
+        coordinates = gazetteer.get(normalize_place_name(candidate))
+        if coordinates:
+            return coordinates
+    return None
+
+
+def nearby_filter(latitude, longitude, radius_km):
+    """
+    Build a filter matching intel inside the bounding box of a search circle.
+
+    The geohash prefixes drive the index scan; the latitude/longitude ranges drop
+    the parts of the covering cells that lie outside the box.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+
+    cells = Q()
+    for prefix in geohash_cover(min_lat, max_lat, min_lng, max_lng):
+        cells |= Q(geohash__startswith=prefix)
+
+    if min_lng < -180.0:
+        longitudes = Q(longitude__gte=min_lng + 360.0) | Q(longitude__lte=max_lng)
+    elif max_lng > 180.0:
+        longitudes = Q(longitude__gte=min_lng) | Q(longitude__lte=max_lng - 360.0)
+    else:
+        longitudes = Q(longitude__gte=min_lng, longitude__lte=max_lng)
+
+    return cells & Q(latitude__gte=min_lat, latitude__lte=max_lat) & longitudes
+
+
+def approximate_distance(latitude, longitude):
+    """
+    Build an expression ordering rows like their distance from a point.
+
+    Squared equirectangular distance in degrees of latitude, with longitude
+    differences wrapped across the antimeridian; accurate enough to pick the
+    nearest candidates in SQL before exact ranking.
+    """
+    lng_scale = math.cos(math.radians(latitude))
+    d_lat = F('latitude') - Value(latitude)
+    d_lng = Case(
+        When(longitude__gt=longitude + 180.0, then=F('longitude') - Value(longitude + 360.0)),
+        When(longitude__lt=longitude - 180.0, then=F('longitude') - Value(longitude - 360.0)),
+        default=F('longitude') - Value(longitude),
+        output_field=FloatField(),
+    ) * Value(lng_scale)
+    return ExpressionWrapper(d_lat * d_lat + d_lng * d_lng, output_field=FloatField())
+
+
+def rank_nearby(queryset, latitude, longitude, radius_km, max_candidates=None):
+    """
+    Return intel UUIDs within ``radius_km`` ordered by distance, nearest first.
+
+    Candidates are ordered by approximate distance in SQL before ``max_candidates``
+    is applied, so a dense area keeps its nearest intel; only the UUID and
+    coordinates are fetched, and the page being served is loaded separately.
+
+    Returns:
+        tuple: list of (uuid, distance_km) tuples, and whether the candidate limit
+        was reached (farther intel inside the radius may be missing)
+    """
+    if max_candidates is None:
+        max_candidates = get_geo_settings()['MAX_CANDIDATES']
+
+    candidates = list(
+        queryset
+        .filter(nearby_filter(latitude, longitude, radius_km))
+        .annotate(approximate_distance=approximate_distance(latitude, longitude))
+        .order_by('approximate_distance')
+        .values_list('uuid', 'latitude', 'longitude')[:max_candidates]
+    )
+    ranked = []
+    for uuid, intel_lat, intel_lng in candidates:
+        distance = haversine_km(latitude, longitude, intel_lat, intel_lng)
+        if distance <= radius_km:
+            ranked.append((uuid, distance))
+    ranked.sort(key=lambda item: item[1])
+    return ranked, len(candidates) >= max_candidates
@@ -0,0 +1,65 @@
+"""
+Utility functions for toggling likes on intel posts and comments.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef, Value
+from django.db.models.functions import Greatest
+from intel.models import IntelLike
+
+
+def toggle_like(like_model, target, user, target_field):
+    """
+    Atomically toggle a user's like on a target and adjust its ``likes_count``.
+
+    The unlike path is a single ``DELETE`` whose row count decides whether the like
+    existed, and the like path relies on the ``(user, target)`` unique constraint, so
+    concurrent toggles can never double-count. The counter is changed with an
+    ``F()`` expression instead of a Python read-modify-write.
+
+    Args:
+        like_model: IntelLike or CommentLike
+        target: Intel or IntelComment instance being liked
+        user: User toggling the like
+        target_field: Name of the foreign key on ``like_model`` pointing at the target
+
+    Returns:
+        tuple: (is_liked, likes_count, like) where ``like`` is the created like or None
+    """
+    target_model = type(target)
+    counter = target_model.objects.filter(pk=target.pk)
+    like = None
+
+    with transaction.atomic():
+        deleted, _ = like_model.objects.filter(user=user, **{target_field: target}).delete()
+
+        if deleted:
+            counter.update(likes_count=Greatest(F('likes_count') - 1, 0))
+            is_liked = False
+        else:
+            try:
+                with transaction.atomic():
+                    like = like_model.objects.create(user=user, **{target_field: target})
+            except IntegrityError:
+                # A concurrent request from the same user liked it first; already counted
+                pass
+            else:
+                counter.update(likes_count=F('likes_count') + 1)
+            is_liked = True
+
+        target.likes_count = counter.values_list('likes_count', flat=True).get()
+
+    return is_liked, target.likes_count, like
+
+
+def annotate_viewer_like(queryset, user):
+    """
+    Annotate an intel queryset with ``viewer_has_liked`` for the given user.
+
+    Uses a correlated ``EXISTS`` on the (user, intel) unique index, so answering
+    ``is_liked_by_user`` costs nothing extra per row and no like rows are loaded.
+    """
+    if user is None or not user.is_authenticated:
+        return queryset.annotate(viewer_has_liked=Value(False))
+    return queryset.annotate(
+        viewer_has_liked=Exists(IntelLike.objects.filter(intel=OuterRef('pk'), user=user))
+    )
@@ -0,0 +1,81 @@
+"""
+Utility functions for attaching media files to intel posts.
+"""
+from collections import Counter
+from django.db import transaction
+from intel.models import IntelMedia
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.webm')
+
+
+def classify_media_url(url):
+    """
+    Determine the media file type from a URL's extension.
+    """
+    lowered = url.lower()
+    if any(ext in lowered for ext in VIDEO_EXTENSIONS):
+        return 'video'
+    return 'photo'
+
+
+def _build_media(intel, urls):
+    types = {url: classify_media_url(url) for url in set(urls)}
+    return [IntelMedia(intel=intel, file_url=url, file_type=types[url]) for url in urls]
+
+
+def create_intel_media(intel, media_urls):
+    """
+    Attach media files to a new intel post with a single bulk insert.
+    """
+    if media_urls:
+        IntelMedia.objects.bulk_create(_build_media(intel, media_urls))
+
+
+def sync_intel_media(intel, media_urls):
+    """
+    Make an intel post's media match ``media_urls``.
+
+    Existing rows are diffed against the incoming list (duplicates included), so
+    unchanged media keep their rows and only additions are bulk-inserted and
+    removals bulk-deleted, in one transaction. Media are ordered by ``created_at``,
+    so when the list also changes the order of kept media they are all replaced.
+
+    Returns:
+        tuple: (number of media added, number of media removed)
+    """
+    with transaction.atomic():
+        existing = list(
+            IntelMedia.objects.filter(intel=intel).order_by('created_at').values_list('uuid', 'file_url')
+        )
+
+        wanted = Counter(media_urls)
+        remove_ids = []
+        for media_id, url in existing:
+            if wanted[url]:
+                wanted[url] -= 1
+            else:
+                remove_ids.append(media_id)
+
+        # Keep the client's order for the new media
+        additions = []
+        for url in media_urls:
+            if wanted[url]:
+                wanted[url] -= 1
+                additions.append(url)
+
+        # Kept rows stay in front of the new ones; a different order needs new rows
+        removed = set(remove_ids)
+        kept = [url for media_id, url in existing if media_id not in removed]
+        if kept + additions != list(media_urls):
+            remove_ids = [media_id for media_id, _ in existing]
+            additions = list(media_urls)
+
+        if remove_ids:
+            IntelMedia.objects.filter(pk__in=remove_ids).delete()
+        if additions:
+            IntelMedia.objects.bulk_create(_build_media(intel, additions))
+
+    if remove_ids or additions:
+        # Drop stale media prefetched with the instance
+        getattr(intel, '_prefetched_objects_cache', {}).pop('media_files', None)
+    return len(additions), len(remove_ids)
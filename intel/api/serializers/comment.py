@@ -58,6 +58,9 @@ class IntelCommentSerializer(serializers.ModelSerializer):
     
     def get_is_liked_by_user(self, obj):
         """Check if the current user has liked this comment."""
+        liked_comment_ids = self.context.get('liked_comment_ids')
+        if liked_comment_ids is not None:
+            return obj.pk in liked_comment_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
@@ -68,8 +71,12 @@ class IntelCommentSerializer(serializers.ModelSerializer):
         if obj.is_reply():
             return None
         
-        # Get replies for this comment
-        replies = obj.replies.all()[:5]  # Limit to 5 replies initially
+        # Use previews batch-loaded by the view when available
+        reply_previews = self.context.get('reply_previews')
+        if reply_previews is not None and obj.pk in reply_previews:
+            replies = reply_previews[obj.pk]
+        else:
+            replies = obj.replies.all()[:5]  # Limit to 5 replies initially
         return IntelCommentListSerializer(replies, many=True, context=self.context).data
     
     def validate(self, attrs):
@@ -123,6 +130,9 @@ class IntelCommentListSerializer(serializers.ModelSerializer):
     
     def get_is_liked_by_user(self, obj):
         """Check if the current user has liked this comment."""
+        liked_comment_ids = self.context.get('liked_comment_ids')
+        if liked_comment_ids is not None:
+            return obj.pk in liked_comment_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
@@ -3,6 +3,8 @@ from django.core.validators import URLValidator
 from intel.models import Intel, IntelMedia
 from accounts.api.serializers.user import UserSerializer
 from intel.api.serializers.category import IntelCategoryDetailSerializer
+from intel.api.geo_utils import resolve_location
+from intel.api.media_utils import create_intel_media, sync_intel_media
 
 
 class IntelMediaSerializer(serializers.ModelSerializer):
@@ -39,6 +41,8 @@ class IntelSerializer(serializers.ModelSerializer):
             'description',
             'category',
             'location',
+            'latitude',
+            'longitude',
             'urgency',
             'status',
             'status_display',
@@ -62,11 +66,42 @@ class IntelSerializer(serializers.ModelSerializer):
     
     def get_is_liked_by_user(self, obj):
         """Check if the current user has liked this intel."""
+        # Precomputed by annotate_viewer_like on view querysets
+        if hasattr(obj, 'viewer_has_liked'):
+            return obj.viewer_has_liked
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
         return False
     
+    def validate_latitude(self, value):
+        if value is not None and not -90 <= value <= 90:
+            raise serializers.ValidationError("Latitude must be between -90 and 90.")
+        return value
+    
+    def validate_longitude(self, value):
+        if value is not None and not -180 <= value <= 180:
+            raise serializers.ValidationError("Longitude must be between -180 and 180.")
+        return value
+    
+    def validate(self, attrs):
+        """
+        Require coordinates in pairs and fall back to the gazetteer for the location text.
+        """
+        has_latitude = attrs.get('latitude') is not None
+        has_longitude = attrs.get('longitude') is not None
+        if has_latitude != has_longitude:
+            raise serializers.ValidationError("latitude and longitude must be provided together.")
+        
+        location_changed = 'location' in attrs and (
+            self.instance is None or attrs['location'] != self.instance.location
+        )
+        if not has_latitude and 'latitude' not in attrs and location_changed:
+            # Coordinates of the old location text no longer apply
+            coordinates = resolve_location(attrs['location'])
+            attrs['latitude'], attrs['longitude'] = coordinates or (None, None)
+        return attrs
+    
     def validate_media_urls(self, value):
         """Validate that all media URLs are valid."""
         validator = URLValidator()
@@ -88,18 +123,8 @@ class IntelSerializer(serializers.ModelSerializer):
         # Create the Intel post
         intel = Intel.objects.create(**validated_data)
         
-        # Create IntelMedia entries for each URL
-        for url in media_urls:
-            # Determine file type based on URL extension
-            file_type = 'photo'  # default
-            if any(ext in url.lower() for ext in ['.mp4', '.mov', '.avi', '.webm']):
-                file_type = 'video'
-            
-            IntelMedia.objects.create(
-                intel=intel,
-                file_url=url,
-                file_type=file_type
-            )
+        # Create IntelMedia entries for all URLs in one insert
+        create_intel_media(intel, media_urls)
         return intel
     
     def update(self, instance, validated_data):
@@ -111,23 +136,9 @@ class IntelSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
         
-        # If media_urls are provided, replace all media files
+        # If media_urls are provided, add and remove only the media that changed
         if media_urls is not None:
-            # Delete all existing media files for this intel
-            instance.media_files.all().delete()
-            
-            # Create new IntelMedia entries for each URL
-            for url in media_urls:
-                # Determine file type based on URL extension
-                file_type = 'photo'  # default
-                if any(ext in url.lower() for ext in ['.mp4', '.mov', '.avi', '.webm']):
-                    file_type = 'video'
-                
-                IntelMedia.objects.create(
-                    intel=instance,
-                    file_url=url,
-                    file_type=file_type
-                )
+            sync_intel_media(instance, media_urls)
         
         return instance
 
@@ -149,6 +160,8 @@ class IntelListSerializer(serializers.ModelSerializer):
             'description',
             'category',
             'location',
+            'latitude',
+            'longitude',
             'urgency',
             'status',
             'status_display',
@@ -170,6 +183,9 @@ class IntelListSerializer(serializers.ModelSerializer):
     
     def get_is_liked_by_user(self, obj):
         """Check if the current user has liked this intel."""
+        # Precomputed by annotate_viewer_like on view querysets
+        if hasattr(obj, 'viewer_has_liked'):
+            return obj.viewer_has_liked
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
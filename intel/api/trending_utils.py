@@ -0,0 +1,145 @@
+"""
+Utility functions for maintaining materialized intel trending scores.
+
+Every like or comment adds its weight to the intel's row in IntelTrendingScore.
+An hourly job multiplies all scores by HOURLY_DECAY and drops rows that decayed
+to nothing, so the table only holds intel with recent engagement and the score
+is an exponentially time-decayed engagement count.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest, TruncHour
+from django.utils import timezone
+from intel.models import Intel, IntelLike, IntelComment, IntelTrendingScore
+from intel.api.like_utils import annotate_viewer_like
+
+LIKE_WEIGHT = 1.0
+COMMENT_WEIGHT = 2.0
+# Scores lose ~5% per hour (half-life ~13.5 hours)
+HOURLY_DECAY = 0.95
+# Rows below this score are removed by the decay job
+MIN_SCORE = 0.05
+REBUILD_WINDOW_HOURS = 72
+TRENDING_DEFAULT_LIMIT = 20
+TRENDING_MAX_LIMIT = 100
+
+
+def record_engagement(intel, weight):
+    """
+    Add ``weight`` (negative for unlikes and deleted comments) to an intel's trending score.
+
+    Only approved intel trends. The denormalized category and urgency are refreshed on
+    every event so filtered lookups stay accurate after edits. A negative weight never
+    takes the score below zero: the like or comment it undoes may already have decayed,
+    so subtracting its full weight would leave the intel with a negative score.
+    """
+    if intel.status != 'approved':
+        return
+
+    fields = {'category_id': intel.category_id, 'urgency': intel.urgency}
+    updated = IntelTrendingScore.objects.filter(intel_id=intel.pk).update(
+        score=Greatest(F('score') + weight, 0.0), **fields
+    )
+    if updated or weight <= 0:
+        return
+
+    try:
+        with transaction.atomic():
+            IntelTrendingScore.objects.create(intel_id=intel.pk, score=weight, **fields)
+    except IntegrityError:
+        # Created concurrently by another event; add to it instead
+        IntelTrendingScore.objects.filter(intel_id=intel.pk).update(score=F('score') + weight, **fields)
+
+
+def record_like(intel, is_liked):
+    """Update trending score for a like toggle."""
+    record_engagement(intel, LIKE_WEIGHT if is_liked else -LIKE_WEIGHT)
+
+
+def record_comment(intel, count=1):
+    """Update trending score for created (positive count) or deleted (negative count) comments."""
+    record_engagement(intel, COMMENT_WEIGHT * count)
+
+
+def decay_scores():
+    """
+    Apply one hour of decay to every score and drop rows that no longer trend.
+
+    Returns:
+        dict: rows decayed and rows removed
+    """
+    with transaction.atomic():
+        decayed = IntelTrendingScore.objects.update(score=F('score') * HOURLY_DECAY)
+        removed, _ = IntelTrendingScore.objects.filter(score__lt=MIN_SCORE).delete()
+    return {'decayed': decayed, 'removed': removed}
+
+
+def rebuild_scores(window_hours=REBUILD_WINDOW_HOURS):
+    """
+    Recompute all trending scores from likes and comments in the last ``window_hours``.
+
+    Used to backfill the table or recover from drift; events are grouped per intel and
+    hour so the work is proportional to recent activity.
+
+    Returns:
+        int: number of intel posts with a trending score
+    """
+    now = timezone.now()
+    since = now - timezone.timedelta(hours=window_hours)
+    scores = {}
+
+    for model, weight in ((IntelLike, LIKE_WEIGHT), (IntelComment, COMMENT_WEIGHT)):
+        buckets = (
+            model.objects
+            .filter(created_at__gte=since, intel__status='approved')
+            .annotate(hour=TruncHour('created_at'))
+            .values('intel_id', 'hour')
+            .annotate(total=Count('pk'))
+            .order_by()
+        )
+        for bucket in buckets:
+            age_hours = int((now - bucket['hour']).total_seconds() // 3600)
+            scores[bucket['intel_id']] = (
+                scores.get(bucket['intel_id'], 0) + weight * bucket['total'] * HOURLY_DECAY ** age_hours
+            )
+
+    intels = Intel.objects.filter(pk__in=scores.keys()).only('pk', 'category_id', 'urgency')
+    rows = [
+        IntelTrendingScore(
+            intel_id=intel.pk,
+            score=scores[intel.pk],
+            category_id=intel.category_id,
+            urgency=intel.urgency
+        )
+        for intel in intels
+        if scores[intel.pk] >= MIN_SCORE
+    ]
+
+    with transaction.atomic():
+        IntelTrendingScore.objects.all().delete()
+        IntelTrendingScore.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def get_trending(category=None, urgency=None, limit=TRENDING_DEFAULT_LIMIT, viewer=None):
+    """
+    Return the top trending approved intel, optionally filtered by category UUID and urgency.
+
+    Reads the top-K from the (category|urgency, -score) indexes. When ``viewer`` is
+    given the intel are annotated with their like state for that user.
+    """
+    scores = IntelTrendingScore.objects.filter(score__gte=MIN_SCORE)
+    if category:
+        scores = scores.filter(category_id=category)
+    if urgency:
+        scores = scores.filter(urgency=urgency)
+
+    top = list(scores.order_by('-score').values_list('intel_id', 'score')[:limit])
+    queryset = Intel.objects.filter(
+        pk__in=[intel_id for intel_id, _ in top],
+        status='approved'
+    ).select_related('user', 'category').prefetch_related('media_files')
+    if viewer is not None:
+        queryset = annotate_viewer_like(queryset, viewer)
+    intels = {intel.pk: intel for intel in queryset}
+    return [(intels[intel_id], score) for intel_id, score in top if intel_id in intels]
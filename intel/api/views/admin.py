@@ -5,6 +5,7 @@ from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from django.db import models
+from django.utils import timezone
 import logging
 
 from intel.models import Intel
@@ -14,9 +15,12 @@ from intel.api.serializers.admin import (
     IntelRejectSerializer,
     AdminIntelListSerializer
 )
+from core.api.serializers import BulkModerationSerializer, ModerationClaimSerializer, ModerationReleaseSerializer
+from core.api.moderation_utils import bulk_moderate, summarize_results, claim_next, release_claims
 from intel.api.serializers import IntelSerializer
 from notification.api.intel_notifications import (
     send_intel_status_update_notification,
+    send_bulk_intel_status_update_notifications,
 )
 
 logger = logging.getLogger(__name__)
@@ -154,6 +158,10 @@ class AdminIntelViewSet(viewsets.ViewSet):
             # Update intel status
             intel.status = 'approved'
             intel.rejection_reason = None  # Clear rejection reason if any
+            intel.moderated_by = request.user
+            intel.moderated_at = timezone.now()
+            intel.claimed_by = None
+            intel.claim_expires_at = None
             intel.save()
             
             # Notify intel owner about status change
@@ -211,6 +219,10 @@ class AdminIntelViewSet(viewsets.ViewSet):
             # Update intel status and rejection reason
             intel.status = 'rejected'
             intel.rejection_reason = serializer.validated_data['rejection_reason']
+            intel.moderated_by = request.user
+            intel.moderated_at = timezone.now()
+            intel.claimed_by = None
+            intel.claim_expires_at = None
             intel.save()
             
             # Notify intel owner about status change
@@ -249,6 +261,155 @@ class AdminIntelViewSet(viewsets.ViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=['post'], url_path='bulk-moderate')
+    def bulk_moderate(self, request):
+        """
+        Approve or reject many intel posts in one request.
+        Statuses are changed with a single UPDATE and owners are notified in bulk.
+        
+        POST /api/admin-intel/bulk-moderate/
+        Request body: {
+            "uuids": ["uuid-1", "uuid-2"],
+            "action": "approve" | "reject",
+            "rejection_reason": "Required when rejecting"
+        }
+        """
+        try:
+            serializer = BulkModerationSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            action_name = serializer.validated_data['action']
+            status_labels = dict(Intel.STATUS_CHOICES)
+            
+            def notify(rows, new_status):
+                send_bulk_intel_status_update_notifications(
+                    (row['uuid'], row['user_id'], status_labels[row['status']], status_labels[new_status])
+                    for row in rows
+                )
+            
+            results = bulk_moderate(
+                Intel,
+                serializer.validated_data['uuids'],
+                action_name,
+                request.user,
+                rejection_reason=serializer.validated_data['rejection_reason'],
+                notify=notify
+            )
+            summary = summarize_results(results)
+            
+            logger.info(
+                f"Admin {request.user.email} bulk {action_name}d intel: "
+                f"{summary['updated']} updated, {summary['unchanged']} unchanged, {summary['not_found']} not found"
+            )
+            
+            return Response({
+                'success': True,
+                'message': f"Bulk {action_name} completed",
+                'data': {
+                    'action': action_name,
+                    'summary': summary,
+                    'results': results
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error bulk moderating intel posts: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to moderate intel posts',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=False, methods=['post'], url_path='claim')
+    def claim(self, request):
+        """
+        Claim the next pending intel posts from the moderation queue.
+        Claimed items are reserved for this admin until the lease expires, so
+        moderators working the queue concurrently get disjoint batches.
+        
+        POST /api/admin-intel/claim/
+        Request body: { "limit": 20, "lease_seconds": 900 }
+        """
+        try:
+            serializer = ModerationClaimSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            claimed, expires_at = claim_next(
+                Intel,
+                'under_review',
+                request.user,
+                limit=serializer.validated_data['limit'],
+                lease_seconds=serializer.validated_data['lease_seconds']
+            )
+            items = {item.pk: item for item in self.get_queryset().filter(pk__in=claimed)}
+            data = AdminIntelListSerializer([items[pk] for pk in claimed if pk in items], many=True).data
+            
+            logger.info(f"Admin {request.user.email} claimed {len(claimed)} pending intel posts")
+            
+            return Response({
+                'success': True,
+                'message': f"{len(claimed)} intel posts claimed",
+                'data': {
+                    'lease_expires_at': expires_at.isoformat(),
+                    'count': len(data),
+                    'results': data
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error claiming intel posts: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to claim intel posts',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=False, methods=['post'], url_path='release')
+    def release(self, request):
+        """
+        Return claimed intel posts to the moderation queue.
+        Releases all of this admin's claims when no UUIDs are given.
+        
+        POST /api/admin-intel/release/
+        Request body: { "uuids": ["uuid-1"] }
+        """
+        try:
+            serializer = ModerationReleaseSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response({
+                    'success': False,
+                    'message': 'Validation error',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            released = release_claims(Intel, request.user, serializer.validated_data.get('uuids'))
+            
+            return Response({
+                'success': True,
+                'message': f"{released} intel posts released",
+                'data': {
+                    'released': released
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Admin: Error releasing intel posts: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to release intel posts',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     @action(detail=False, methods=['get'], url_path='pending')
     def pending_review(self, request):
         """
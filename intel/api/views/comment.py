@@ -7,6 +7,14 @@ import logging
 
 from intel.models import Intel, IntelComment, CommentLike
 from intel.api.serializers import IntelCommentSerializer, IntelCommentListSerializer, CommentLikeSerializer
+from intel.api.like_utils import toggle_like
+from intel.api.comment_utils import (
+    increment_comment_counters,
+    delete_comment,
+    get_liked_comment_ids,
+    load_comment_threads,
+)
+from intel.api.trending_utils import record_comment
 from notification.api.intel_notifications import (
     send_intel_comment_notification,
     send_comment_reply_notification,
@@ -55,16 +63,10 @@ class IntelCommentViewSet(viewsets.ModelViewSet):
             # Set the user
             comment = serializer.save(user=request.user)
             
-            # Update comment count on intel
+            # Update comment count on intel and reply count on parent comment if it's a reply
             intel = comment.intel
-            intel.comments_count = intel.comments.count()
-            intel.save(update_fields=['comments_count'])
-            
-            # Update reply count on parent comment if it's a reply
-            if comment.parent_comment:
-                parent = comment.parent_comment
-                parent.replies_count = parent.replies.count()
-                parent.save(update_fields=['replies_count'])
+            increment_comment_counters(comment)
+            record_comment(intel)
 
             # Send notifications:
             # - If top-level comment: notify intel owner
@@ -114,11 +116,12 @@ class IntelCommentViewSet(viewsets.ModelViewSet):
             comments = IntelComment.objects.filter(
                 intel=intel,
                 parent_comment__isnull=True
-            ).select_related('user').prefetch_related('replies').order_by('-created_at')
+            ).select_related('user', 'user__profile').order_by('-created_at')
             
             page = self.paginate_queryset(comments)
             if page is not None:
-                serializer = IntelCommentSerializer(page, many=True, context={'request': request})
+                context = {'request': request, **load_comment_threads(page, request.user)}
+                serializer = IntelCommentSerializer(page, many=True, context=context)
                 response = self.get_paginated_response(serializer.data)
                 
                 return Response({
@@ -130,7 +133,9 @@ class IntelCommentViewSet(viewsets.ModelViewSet):
                     'results': response.data.get('results')
                 }, status=status.HTTP_200_OK)
             
-            serializer = IntelCommentSerializer(comments, many=True, context={'request': request})
+            comments = list(comments)
+            context = {'request': request, **load_comment_threads(comments, request.user)}
+            serializer = IntelCommentSerializer(comments, many=True, context=context)
             return Response({
                 'success': True,
                 'message': 'Comments retrieved successfully',
@@ -153,16 +158,20 @@ class IntelCommentViewSet(viewsets.ModelViewSet):
         try:
             comment = self.get_object()
             
-            replies = IntelComment.objects.filter(
+            replies = list(IntelComment.objects.filter(
                 parent_comment=comment
-            ).select_related('user').order_by('created_at')
+            ).select_related('user', 'user__profile').order_by('created_at'))
             
-            serializer = IntelCommentListSerializer(replies, many=True, context={'request': request})
+            context = {
+                'request': request,
+                'liked_comment_ids': get_liked_comment_ids([reply.pk for reply in replies], request.user)
+            }
+            serializer = IntelCommentListSerializer(replies, many=True, context=context)
             
             return Response({
                 'success': True,
                 'message': 'Replies retrieved successfully',
-                'count': replies.count(),
+                'count': len(replies),
                 'data': serializer.data
             }, status=status.HTTP_200_OK)
         
@@ -219,18 +228,9 @@ class IntelCommentViewSet(viewsets.ModelViewSet):
                     'message': 'You do not have permission to delete this comment'
                 }, status=status.HTTP_403_FORBIDDEN)
             
-            intel = instance.intel
-            parent_comment = instance.parent_comment
-            
-            self.perform_destroy(instance)
-            
-            # Update counts
-            intel.comments_count = intel.comments.count()
-            intel.save(update_fields=['comments_count'])
-            
-            if parent_comment:
-                parent_comment.replies_count = parent_comment.replies.count()
-                parent_comment.save(update_fields=['replies_count'])
+            # Delete and update counts
+            removed = delete_comment(instance)
+            record_comment(instance.intel, -removed)
             
             logger.info(f"Comment deleted: {instance.uuid}")
             
@@ -282,15 +282,9 @@ class CommentLikeViewSet(viewsets.ViewSet):
                     'message': 'Comment not found'
                 }, status=status.HTTP_404_NOT_FOUND)
             
-            # Check if user already liked this comment
-            existing_like = CommentLike.objects.filter(user=request.user, comment=comment).first()
+            is_liked, likes_count, like = toggle_like(CommentLike, comment, request.user, 'comment')
             
-            if existing_like:
-                # Unlike
-                existing_like.delete()
-                comment.likes_count = max(0, comment.likes_count - 1)
-                comment.save(update_fields=['likes_count'])
-                
+            if not is_liked:
                 logger.info(f"User {request.user.email} unliked comment {comment.uuid}")
                 
                 return Response({
@@ -298,15 +292,10 @@ class CommentLikeViewSet(viewsets.ViewSet):
                     'message': 'Comment unliked successfully',
                     'data': {
                         'is_liked': False,
-                        'likes_count': comment.likes_count
+                        'likes_count': likes_count
                     }
                 }, status=status.HTTP_200_OK)
             else:
-                # Like
-                like = CommentLike.objects.create(user=request.user, comment=comment)
-                comment.likes_count += 1
-                comment.save(update_fields=['likes_count'])
-                
                 logger.info(f"User {request.user.email} liked comment {comment.uuid}")
                 
                 return Response({
@@ -314,8 +303,8 @@ class CommentLikeViewSet(viewsets.ViewSet):
                     'message': 'Comment liked successfully',
                     'data': {
                         'is_liked': True,
-                        'likes_count': comment.likes_count,
-                        'like_uuid': str(like.uuid)
+                        'likes_count': likes_count,
+                        'like_uuid': str(like.uuid) if like else None
                     }
                 }, status=status.HTTP_201_CREATED)
         
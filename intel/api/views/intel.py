@@ -8,9 +8,14 @@ from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import FilterSet
 from django.db.models import Q
 import logging
+import uuid
 
 from intel.models import Intel, IntelMedia
 from intel.api.serializers import IntelSerializer, IntelListSerializer
+from intel.api.feed_utils import get_feed, load_feed_page
+from intel.api.trending_utils import get_trending, TRENDING_DEFAULT_LIMIT, TRENDING_MAX_LIMIT
+from intel.api.geo_utils import get_geo_settings, rank_nearby
+from intel.api.like_utils import annotate_viewer_like
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +42,7 @@ class IntelViewSet(viewsets.ModelViewSet):
     Supports creating intel with multiple media URLs, listing with filters,
     and retrieving individual intel posts.
     """
-    queryset = Intel.objects.select_related('user', 'category').prefetch_related('media_files', 'likes').all()
+    queryset = Intel.objects.select_related('user', 'category').prefetch_related('media_files').all()
     serializer_class = IntelSerializer
     permission_classes = [IsAuthenticated]
     parser_classes = [JSONParser]
@@ -50,7 +55,7 @@ class IntelViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter queryset with manual handling for category UUID and date formats."""
-        queryset = super().get_queryset()
+        queryset = annotate_viewer_like(super().get_queryset(), self.request.user)
         
         # Manual filtering for category UUID
         category = self.request.query_params.get('category')
@@ -267,7 +272,8 @@ class IntelViewSet(viewsets.ModelViewSet):
         try:
             queryset = Intel.objects.filter(
                 user=request.user
-            ).select_related('user', 'category').prefetch_related('media_files', 'likes').order_by('-created_at')
+            ).select_related('user', 'category').prefetch_related('media_files').order_by('-created_at')
+            queryset = annotate_viewer_like(queryset, request.user)
             
             queryset = self.filter_queryset(queryset)
             
@@ -300,6 +306,221 @@ class IntelViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['get'], url_path='feed')
+    def feed(self, request):
+        """
+        Get the personalized intel feed for the authenticated user.
+        
+        Merges recent approved intel from followed users with globally trending intel,
+        ranked by recency-decayed likes and comments. The ranking is cached briefly so
+        pages stay consistent while scrolling.
+        
+        Query parameters:
+        - page: Page number (default: 1)
+        - page_size: Items per page (default: 20, max: 100)
+        - refresh: Set to true to rebuild the ranking (e.g. pull-to-refresh)
+        
+        Returns paginated list of ranked intel posts.
+        """
+        try:
+            refresh = request.query_params.get('refresh', '').lower() in ('1', 'true', 'yes')
+            feed_uuids = get_feed(request.user, refresh=refresh)
+            
+            queryset = annotate_viewer_like(
+                Intel.objects.select_related('user', 'category').prefetch_related('media_files'),
+                request.user
+            )
+            
+            page = self.paginate_queryset(feed_uuids)
+            if page is not None:
+                intels = load_feed_page(page, queryset)
+                serializer = IntelListSerializer(intels, many=True, context={'request': request})
+                response = self.get_paginated_response(serializer.data)
+                
+                return Response({
+                    'success': True,
+                    'message': 'Intel feed retrieved successfully',
+                    'count': response.data.get('count'),
+                    'next': response.data.get('next'),
+                    'previous': response.data.get('previous'),
+                    'results': response.data.get('results')
+                }, status=status.HTTP_200_OK)
+            
+            intels = load_feed_page(feed_uuids, queryset)
+            serializer = IntelListSerializer(intels, many=True, context={'request': request})
+            return Response({
+                'success': True,
+                'message': 'Intel feed retrieved successfully',
+                'data': serializer.data
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Error retrieving intel feed: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to retrieve intel feed',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @action(detail=False, methods=['get'], url_path='nearby')
+    def nearby(self, request):
+        """
+        Get approved intel posts near a location, nearest first.
+        
+        Query parameters:
+        - lat: Latitude of the search center (required)
+        - lng: Longitude of the search center (required)
+        - radius: Search radius in km (default: 10, max: 100)
+        - category: Filter by category UUID
+        - urgency: Filter by urgency (low, medium, high)
+        - page: Page number (default: 1)
+        - page_size: Items per page (default: 20, max: 100)
+        
+        Returns paginated list of intel posts, each with distance_km.
+        """
+        try:
+            geo_settings = get_geo_settings()
+            try:
+                latitude = float(request.query_params['lat'])
+                longitude = float(request.query_params['lng'])
+                radius = float(request.query_params.get('radius', geo_settings['DEFAULT_RADIUS_KM']))
+            except (KeyError, ValueError):
+                return Response({
+                    'success': False,
+                    'message': 'lat and lng are required and lat, lng and radius must be numbers'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            if not -90 <= latitude <= 90 or not -180 <= longitude <= 180 or radius <= 0:
+                return Response({
+                    'success': False,
+                    'message': 'lat must be between -90 and 90, lng between -180 and 180 and radius positive'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            radius = min(radius, geo_settings['MAX_RADIUS_KM'])
+            
+            candidates = Intel.objects.filter(status='approved')
+            category = request.query_params.get('category')
+            if category:
+                try:
+                    category = uuid.UUID(category)
+                except ValueError:
+                    return Response({
+                        'success': False,
+                        'message': 'category must be a valid UUID'
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                candidates = candidates.filter(category__uuid=category)
+            urgency = request.query_params.get('urgency')
+            if urgency:
+                candidates = candidates.filter(urgency=urgency)
+            
+            ranked, truncated = rank_nearby(candidates, latitude, longitude, radius)
+            
+            queryset = annotate_viewer_like(
+                Intel.objects.select_related('user', 'category').prefetch_related('media_files'),
+                request.user
+            )
+            
+            page = self.paginate_queryset(ranked)
+            paginated = page is not None
+            if not paginated:
+                page = ranked
+            
+            distances = dict(page)
+            intels = load_feed_page([uuid for uuid, _ in page], queryset)
+            serializer = IntelListSerializer(intels, many=True, context={'request': request})
+            data = serializer.data
+            for item, intel in zip(data, intels):
+                item['distance_km'] = round(distances[intel.pk], 3)
+            
+            if paginated:
+                response = self.get_paginated_response(data)
+                return Response({
+                    'success': True,
+                    'message': 'Nearby intel posts retrieved successfully',
+                    'truncated': truncated,
+                    'count': response.data.get('count'),
+                    'next': response.data.get('next'),
+                    'previous': response.data.get('previous'),
+                    'results': response.data.get('results')
+                }, status=status.HTTP_200_OK)
+            
+            return Response({
+                'success': True,
+                'message': 'Nearby intel posts retrieved successfully',
+                'truncated': truncated,
+                'data': data
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Error retrieving nearby intel posts: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to retrieve nearby intel posts',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    @action(detail=False, methods=['get'], url_path='trending')
+    def trending(self, request):
+        """
+        Get currently trending approved intel posts.
+        
+        Served from the materialized trending score table, which is updated on every
+        like and comment and decayed hourly.
+        
+        Query parameters:
+        - category: Filter by category UUID
+        - urgency: Filter by urgency (low, medium, high)
+        - limit: Number of posts (default: 20, max: 100)
+        
+        Returns list of intel posts ordered by trending score.
+        """
+        try:
+            try:
+                limit = int(request.query_params.get('limit', TRENDING_DEFAULT_LIMIT))
+            except ValueError:
+                return Response({
+                    'success': False,
+                    'message': 'limit must be an integer'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            limit = max(1, min(limit, TRENDING_MAX_LIMIT))
+            
+            category = request.query_params.get('category')
+            if category:
+                try:
+                    category = uuid.UUID(category)
+                except ValueError:
+                    return Response({
+                        'success': False,
+                        'message': 'category must be a valid UUID'
+                    }, status=status.HTTP_400_BAD_REQUEST)
+            
+            trending = get_trending(
+                category=category,
+                urgency=request.query_params.get('urgency'),
+                limit=limit,
+                viewer=request.user
+            )
+            
+            serializer = IntelListSerializer(
+                [intel for intel, _ in trending], many=True, context={'request': request}
+            )
+            data = serializer.data
+            for item, (_, score) in zip(data, trending):
+                item['trending_score'] = round(score, 4)
+            
+            return Response({
+                'success': True,
+                'message': 'Trending intel posts retrieved successfully',
+                'data': data
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            logger.error(f"Error retrieving trending intel posts: {str(e)}", exc_info=True)
+            return Response({
+                'success': False,
+                'message': 'Failed to retrieve trending intel posts',
+                'error': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
     @action(detail=False, methods=['get'], url_path='user/(?P<user_uuid>[^/.]+)')
     def user_intels(self, request, user_uuid=None):
         """
@@ -331,7 +552,8 @@ class IntelViewSet(viewsets.ModelViewSet):
             
             queryset = Intel.objects.filter(
                 user=user
-            ).select_related('user', 'category').prefetch_related('media_files', 'likes').order_by('-created_at')
+            ).select_related('user', 'category').prefetch_related('media_files').order_by('-created_at')
+            queryset = annotate_viewer_like(queryset, request.user)
             
             queryset = self.filter_queryset(queryset)
             
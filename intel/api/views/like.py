@@ -2,11 +2,12 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db import IntegrityError
 import logging
 
 from intel.models import Intel, IntelLike
 from intel.api.serializers import IntelLikeSerializer
+from intel.api.like_utils import toggle_like
+from intel.api.trending_utils import record_like
 from notification.api.intel_notifications import send_intel_like_notification
 
 logger = logging.getLogger(__name__)
@@ -46,15 +47,11 @@ class IntelLikeViewSet(viewsets.ViewSet):
                     'message': 'Intel post not found'
                 }, status=status.HTTP_404_NOT_FOUND)
             
-            # Check if user already liked this post
-            existing_like = IntelLike.objects.filter(user=request.user, intel=intel).first()
+            is_liked, likes_count, like = toggle_like(IntelLike, intel, request.user, 'intel')
+            if like is not None or not is_liked:
+                record_like(intel, is_liked)
             
-            if existing_like:
-                # Unlike
-                existing_like.delete()
-                intel.likes_count = max(0, intel.likes_count - 1)
-                intel.save(update_fields=['likes_count'])
-                
+            if not is_liked:
                 logger.info(f"User {request.user.email} unliked intel {intel.uuid}")
                 
                 return Response({
@@ -62,20 +59,16 @@ class IntelLikeViewSet(viewsets.ViewSet):
                     'message': 'Intel post unliked successfully',
                     'data': {
                         'is_liked': False,
-                        'likes_count': intel.likes_count
+                        'likes_count': likes_count
                     }
                 }, status=status.HTTP_200_OK)
             else:
-                # Like
-                like = IntelLike.objects.create(user=request.user, intel=intel)
-                intel.likes_count += 1
-                intel.save(update_fields=['likes_count'])
-                
                 # Notify intel owner about the like (skips if liker is author inside helper)
-                try:
-                    send_intel_like_notification(intel=intel, liker=request.user)
-                except Exception as notify_err:
-                    logger.warning(f"Failed to send intel like notification for {intel.uuid}: {notify_err}")
+                if like is not None:
+                    try:
+                        send_intel_like_notification(intel=intel, liker=request.user)
+                    except Exception as notify_err:
+                        logger.warning(f"Failed to send intel like notification for {intel.uuid}: {notify_err}")
                 
                 logger.info(f"User {request.user.email} liked intel {intel.uuid}")
                 
@@ -84,8 +77,8 @@ class IntelLikeViewSet(viewsets.ViewSet):
                     'message': 'Intel post liked successfully',
                     'data': {
                         'is_liked': True,
-                        'likes_count': intel.likes_count,
-                        'like_uuid': str(like.uuid)
+                        'likes_count': likes_count,
+                        'like_uuid': str(like.uuid) if like else None
                     }
                 }, status=status.HTTP_201_CREATED)
         
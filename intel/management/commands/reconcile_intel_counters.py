@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from intel.api.comment_utils import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = 'Fix drift in denormalized intel and comment like/comment/reply counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows updated per statement (default: 1000)')
+
+    def handle(self, *args, **kwargs):
+        result = reconcile_counters(batch_size=kwargs['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled counters: {result['intels_fixed']} intel posts and "
+            f"{result['comments_fixed']} comments corrected"
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from intel.api.trending_utils import decay_scores, rebuild_scores, REBUILD_WINDOW_HOURS
+
+
+class Command(BaseCommand):
+    help = 'Apply hourly decay to intel trending scores (schedule hourly), or rebuild them from recent activity'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true',
+                            help='Recompute all scores from recent likes and comments instead of decaying')
+        parser.add_argument('--window-hours', type=int, default=REBUILD_WINDOW_HOURS,
+                            help=f'Activity window used by --rebuild (default: {REBUILD_WINDOW_HOURS})')
+
+    def handle(self, *args, **kwargs):
+        if kwargs['rebuild']:
+            count = rebuild_scores(window_hours=kwargs['window_hours'])
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt trending scores for {count} intel posts'))
+            return
+
+        result = decay_scores()
+        self.stdout.write(self.style.SUCCESS(
+            f"Decayed {result['decayed']} trending scores, removed {result['removed']}"
+        ))
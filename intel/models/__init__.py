@@ -5,5 +5,6 @@ from intel.models.intel import Intel, IntelMedia
 from intel.models.like import IntelLike
 from intel.models.comment import IntelComment, CommentLike
 from intel.models.category import IntelCategory
+from intel.models.trending import IntelTrendingScore
 
-__all__ = ['Intel', 'IntelMedia', 'IntelLike', 'IntelComment', 'CommentLike', 'IntelCategory']
+__all__ = ['Intel', 'IntelMedia', 'IntelLike', 'IntelComment', 'CommentLike', 'IntelCategory', 'IntelTrendingScore']
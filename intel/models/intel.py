@@ -40,6 +40,23 @@ class Intel(models.Model):
         max_length=255,
         help_text="Location where the intel was observed"
     )
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Latitude of the location, from the client or the gazetteer"
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Longitude of the location, from the client or the gazetteer"
+    )
+    geohash = models.CharField(
+        max_length=12,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Geohash of the coordinates, used for proximity lookups"
+    )
     urgency = models.CharField(
         max_length=10,
         choices=URGENCY_CHOICES,
@@ -57,6 +74,32 @@ class Intel(models.Model):
         blank=True,
         help_text="Reason provided by admin if intel is rejected"
     )
+    moderated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='moderated_intels',
+        help_text="Admin who last approved or rejected the intel"
+    )
+    moderated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the intel was last approved or rejected"
+    )
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Admin currently reviewing this intel from the moderation queue"
+    )
+    claim_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the moderation queue claim lapses"
+    )
     
     # Counts for performance
     likes_count = models.IntegerField(default=0)
@@ -69,13 +112,31 @@ class Intel(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
+            models.Index(fields=['user', '-created_at']),
             models.Index(fields=['category']),
             models.Index(fields=['status']),
+            # Moderation queue: oldest pending first
+            models.Index(fields=['status', 'created_at']),
             models.Index(fields=['urgency']),
+            # Pattern ops so geohash prefix (LIKE 'abc%') lookups use the B-tree
+            models.Index(fields=['geohash'], name='intel_geohash_idx', opclasses=['varchar_pattern_ops']),
         ]
         verbose_name = 'Intel'
         verbose_name_plural = 'Intels'
     
+    def save(self, *args, **kwargs):
+        from intel.api.geo_utils import encode_geohash
+
+        # Keep the geohash in sync with the coordinates
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+        else:
+            self.geohash = None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return f"Intel by {self.user.email} - {self.category.name if self.category else 'No Category'}"
 
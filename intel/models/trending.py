@@ -0,0 +1,40 @@
+from django.db import models
+from intel.models.intel import Intel
+
+
+class IntelTrendingScore(models.Model):
+    """
+    Materialized trending score for Intel posts.
+    Updated incrementally from like and comment events and decayed hourly, so the
+    trending endpoint reads the top-K straight from an index instead of sorting all intel.
+    Category and urgency are denormalized from Intel to keep filtered top-K lookups indexed.
+    """
+    intel = models.OneToOneField(
+        Intel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trending_score'
+    )
+    score = models.FloatField(default=0)
+    category = models.ForeignKey(
+        'IntelCategory',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    urgency = models.CharField(max_length=10, choices=Intel.URGENCY_CHOICES, default='low')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-score']
+        indexes = [
+            models.Index(fields=['-score']),
+            models.Index(fields=['category', '-score']),
+            models.Index(fields=['urgency', '-score']),
+        ]
+        verbose_name = 'Intel Trending Score'
+        verbose_name_plural = 'Intel Trending Scores'
+    
+    def __str__(self):
+        return f"Trending score {self.score:.2f} for Intel {self.intel_id}"
@@ -1,3 +1,271 @@
-from django.test import TestCase
+import os
+import random
+import threading
+import time
+from datetime import timedelta
+from unittest import skipUnless
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from network.models import Follow
+from intel.models import Intel, IntelLike, IntelComment, CommentLike
+from intel.api.comment_utils import increment_comment_counters, reconcile_counters
+from core.api.moderation_utils import MAX_BULK_MODERATION_ITEMS
+from intel.api.feed_utils import build_feed
+from intel.api.like_utils import toggle_like
 
-# Create your tests here.
+# Benchmarks build large fixtures and only run with RUN_BENCHMARKS=1, e.g.
+# RUN_BENCHMARKS=1 python manage.py test intel.tests.CommentCounterBenchmark
+RUN_BENCHMARKS = bool(os.environ.get('RUN_BENCHMARKS'))
+
+
+def benchmark(label, func, repeat=1):
+    """
+    Run ``func`` ``repeat`` times and print the mean duration and query count per run.
+
+    Returns:
+        tuple: (seconds per run, queries per run)
+    """
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        elapsed = (time.perf_counter() - started) / repeat
+    per_run = len(queries) / repeat
+    print(f'{label}: {elapsed * 1000:.2f} ms, {per_run:.1f} queries per run')
+    return elapsed, per_run
+
+
+class ToggleLikeConcurrencyTests(TransactionTestCase):
+
+    threads_count = 8
+    toggles_per_thread = 25
+
+    def setUp(self):
+        self.author = User.objects.create(username='author', email='author@example.com')
+        self.intel = Intel.objects.create(user=self.author, description='Description', location='Location')
+        self.comment = IntelComment.objects.create(user=self.author, intel=self.intel, content='Comment')
+        # Two threads share each user, so the same like is toggled concurrently
+        self.users = [
+            User.objects.create(username=f'user{i}', email=f'user{i}@example.com')
+            for i in range(self.threads_count // 2)
+        ]
+
+    def run_toggles(self, like_model, target, target_field):
+        errors = []
+
+        def toggle(user):
+            try:
+                done = 0
+                while done < self.toggles_per_thread:
+                    try:
+                        toggle_like(like_model, target, user, target_field)
+                    except OperationalError:
+                        # SQLite allows a single writer and fails instead of waiting;
+                        # the toggle rolled back as a whole, so try it again
+                        if connection.vendor != 'sqlite':
+                            raise
+                        continue
+                    done += 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=toggle, args=(self.users[n % len(self.users)],))
+            for n in range(self.threads_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_intel_likes_count_matches_rows(self):
+        self.run_toggles(IntelLike, self.intel, 'intel')
+
+        self.intel.refresh_from_db()
+        self.assertEqual(self.intel.likes_count, IntelLike.objects.filter(intel=self.intel).count())
+
+    def test_comment_likes_count_matches_rows(self):
+        self.run_toggles(CommentLike, self.comment, 'comment')
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, CommentLike.objects.filter(comment=self.comment).count())
+
+
+@skipUnless(RUN_BENCHMARKS, 'Set RUN_BENCHMARKS=1 to run benchmarks')
+class CommentCounterBenchmark(TestCase):
+    """
+    Recounting a large thread on every new comment vs incremental ``F()`` counters.
+    """
+
+    thread_size = int(os.environ.get('BENCHMARK_THREAD_SIZE', 10000))
+    new_comments = 200
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='author', email='author@example.com')
+        cls.intel = Intel.objects.create(user=cls.user, description='Description', location='Location')
+        cls.parent = IntelComment.objects.create(user=cls.user, intel=cls.intel, content='Comment')
+        # Half of the thread replies to one comment, so both counters cover thousands of rows
+        IntelComment.objects.bulk_create([
+            IntelComment(
+                user=cls.user,
+                intel=cls.intel,
+                parent_comment=cls.parent if i % 2 else None,
+                content='Comment'
+            )
+            for i in range(cls.thread_size - 1)
+        ], batch_size=1000)
+        reconcile_counters()
+
+    @staticmethod
+    def recount(comment):
+        """The previous approach: recount the whole thread and the parent's replies"""
+        intel = comment.intel
+        intel.comments_count = intel.comments.count()
+        intel.save(update_fields=['comments_count'])
+        parent = comment.parent_comment
+        parent.replies_count = parent.replies.count()
+        parent.save(update_fields=['replies_count'])
+
+    def add_reply(self, update_counters):
+        def run():
+            reply = IntelComment.objects.create(
+                user=self.user, intel=self.intel, parent_comment=self.parent, content='Reply'
+            )
+            update_counters(reply)
+        return run
+
+    def test_recount_vs_incremental(self):
+        recount, _ = benchmark(
+            f'Recount per comment ({self.thread_size} comments)', self.add_reply(self.recount), self.new_comments
+        )
+        incremental, _ = benchmark(
+            f'F() increment per comment ({self.thread_size} comments)',
+            self.add_reply(increment_comment_counters),
+            self.new_comments
+        )
+        print(f'Speed-up: {recount / incremental:.1f}x')
+        benchmark('reconcile_counters', reconcile_counters)
+
+        self.intel.refresh_from_db()
+        self.parent.refresh_from_db()
+        self.assertEqual(self.intel.comments_count, self.intel.comments.count())
+        self.assertEqual(self.parent.replies_count, self.parent.replies.count())
+
+
+@skipUnless(RUN_BENCHMARKS, 'Set RUN_BENCHMARKS=1 to run benchmarks')
+class FeedBenchmark(TestCase):
+    """
+    Feed build cost on a synthetic follow graph with a few heavily followed users.
+    """
+
+    users_count = int(os.environ.get('BENCHMARK_USERS', 100000))
+    follows_per_user = int(os.environ.get('BENCHMARK_FOLLOWS_PER_USER', 10))
+    intel_per_user = 0.5
+    days = 30
+    sample_size = 50
+
+    @classmethod
+    def skewed_index(cls, rng):
+        # Low indexes are picked far more often, giving a few "celebrity" accounts
+        return int(cls.users_count * rng.random() ** 3)
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(34)
+        User.objects.bulk_create([
+            User(username=f'bench{i}@example.com', email=f'bench{i}@example.com')
+            for i in range(cls.users_count)
+        ], batch_size=5000)
+        cls.user_pks = list(User.objects.order_by('username').values_list('pk', flat=True))
+
+        follows = []
+        for follower in cls.user_pks:
+            following = {cls.user_pks[cls.skewed_index(rng)] for _ in range(cls.follows_per_user)}
+            following.discard(follower)
+            follows.extend(Follow(follower_id=follower, following_id=pk) for pk in following)
+        Follow.objects.bulk_create(follows, batch_size=5000)
+
+        Intel.objects.bulk_create([
+            Intel(
+                user_id=cls.user_pks[cls.skewed_index(rng)],
+                description='Description',
+                location='Location',
+                status='approved' if rng.random() < 0.9 else 'under_review',
+                likes_count=int(rng.paretovariate(1.5)) - 1,
+                comments_count=int(rng.paretovariate(2)) - 1,
+            )
+            for _ in range(int(cls.users_count * cls.intel_per_user))
+        ], batch_size=5000)
+        # created_at is set on insert, so spread the posts over the last days afterwards
+        intel_pks = list(Intel.objects.values_list('pk', flat=True))
+        now = timezone.now()
+        per_day = len(intel_pks) // cls.days + 1
+        for day in range(cls.days):
+            chunk = intel_pks[day * per_day:(day + 1) * per_day]
+            for start in range(0, len(chunk), 900):
+                Intel.objects.filter(pk__in=chunk[start:start + 900]).update(
+                    created_at=now - timedelta(days=day, seconds=rng.randrange(86400))
+                )
+        print(f'Seeded {cls.users_count} users, {len(follows)} follows, {len(intel_pks)} intel posts')
+
+    def test_build_feed(self):
+        rng = random.Random(7)
+        # Some heavily followed accounts, the rest random users
+        pks = self.user_pks[:self.sample_size // 5]
+        pks += rng.sample(self.user_pks, self.sample_size - len(pks))
+
+        timings = []
+        for viewer in User.objects.filter(pk__in=pks):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                build_feed(viewer)
+                timings.append(time.perf_counter() - started)
+            self.assertLessEqual(len(queries), 2)
+        timings.sort()
+        print(
+            f'build_feed over {len(timings)} users: median {timings[len(timings) // 2] * 1000:.1f} ms, '
+            f'max {timings[-1] * 1000:.1f} ms, 2 queries each'
+        )
+
+
+@skipUnless(RUN_BENCHMARKS, 'Set RUN_BENCHMARKS=1 to run benchmarks')
+class BulkModerationBenchmark(TestCase):
+    """
+    One bulk-moderate request approving the largest allowed batch of intel.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create(username='admin@example.com', email='admin@example.com', is_staff=True)
+        authors = User.objects.bulk_create([
+            User(username=f'author{i}@example.com', email=f'author{i}@example.com') for i in range(50)
+        ])
+        Intel.objects.bulk_create([
+            Intel(user=authors[i % len(authors)], description='Description', location='Location', status='under_review')
+            for i in range(MAX_BULK_MODERATION_ITEMS)
+        ], batch_size=1000)
+
+    def test_bulk_approve(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        uuids = [str(pk) for pk in Intel.objects.values_list('uuid', flat=True)]
+
+        response = None
+
+        def approve():
+            nonlocal response
+            response = client.post(
+                '/api/admin-intel/bulk-moderate/', {'uuids': uuids, 'action': 'approve'}, format='json'
+            )
+
+        benchmark(f'Bulk approve {len(uuids)} intel', approve)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Intel.objects.filter(status='approved', moderated_by=self.admin).count(), len(uuids))
@@ -1,11 +1,16 @@
 from django.contrib import admin
-from notification.models import FCMDeviceCustom, NotificationTemplate, NotificationLog
+from notification.models import (
+    FCMDeviceCustom, NotificationTemplate, NotificationLog,
+    ArchivedNotification, ArchivedNotificationLog
+)
 from notification.models.notifications import Notification
 
 
 admin.site.register(FCMDeviceCustom)
 admin.site.register(NotificationTemplate)
 admin.site.register(NotificationLog)
+admin.site.register(ArchivedNotification)
+admin.site.register(ArchivedNotificationLog)
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
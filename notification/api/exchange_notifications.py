@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 from django.contrib.auth import get_user_model
 from notification.api.utils import FCMNotificationService
+from notification.api.notification_bulk import PushMessage, create_notifications, enqueue_pushes
 from notification.models import Notification
 
 User = get_user_model()
@@ -149,6 +150,81 @@ class ExchangeNotificationService:
         except Exception as e:
             logger.error(f"Error sending exchange under review notification: {e}")
     
+    @staticmethod
+    def send_bulk_moderation_notifications(exchanges, approved, reason=None):
+        """
+        Notify the owners of many exchanges that they were approved or rejected.
+        
+        In-app notifications are inserted in bulk and pushes are sent in the background
+        after the transaction commits.
+        
+        Args:
+            exchanges: Iterable of (exchange_uuid, owner_id, business_name, seller_type) tuples
+            approved: True for approvals, False for rejections
+            reason: Rejection reason shared by all exchanges
+        """
+        notifications = []
+        pushes = []
+        for exchange_uuid, owner_id, business_name, seller_type in exchanges:
+            if not owner_id:
+                logger.warning(f"No user associated with exchange {exchange_uuid}")
+                continue
+            
+            if approved:
+                notification_type = 'EXCHANGE_APPROVED'
+                title = "Exchange Approved!"
+                message = f"Congratulations! Your exchange '{business_name}' has been approved and is now live."
+                push_title = "🎉 Exchange Approved!"
+                icon = 'approval_icon'
+                context = {'org_name': business_name, 'exchange_type': seller_type or 'Exchange'}
+            else:
+                notification_type = 'EXCHANGE_REJECTED'
+                title = "Exchange Rejected"
+                message = f"Your exchange '{business_name}' has been rejected."
+                if reason:
+                    message += f" Reason: {reason}"
+                push_title = "❌ Exchange Rejected"
+                icon = 'rejection_icon'
+                context = {'org_name': business_name, 'reason': reason or 'Not specified'}
+            
+            status_value = 'approved' if approved else 'rejected'
+            notifications.append(Notification(
+                recipient_id=owner_id,
+                sender=None,  # System notification
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                related_object_id=str(exchange_uuid),
+                related_object_type='exchange',
+                metadata={
+                    'exchange_uuid': str(exchange_uuid),
+                    'org_name': business_name,
+                    'exchange_type': seller_type,
+                    'status': status_value,
+                    'reason': reason,
+                }
+            ))
+            pushes.append(PushMessage(
+                user_id=owner_id,
+                template_name=notification_type,
+                context=context,
+                data={
+                    'type': f'exchange_{status_value}',
+                    'exchange_uuid': str(exchange_uuid),
+                    'org_name': business_name,
+                    'exchange_type': seller_type,
+                    'reason': reason,
+                },
+                fallback_title=push_title,
+                fallback_body=message,
+                icon=icon,
+                priority='high'
+            ))
+        
+        create_notifications(notifications)
+        enqueue_pushes(pushes)
+        logger.info(f"Created {len(notifications)} exchange {'approval' if approved else 'rejection'} notifications")
+    
     @staticmethod
     def _send_fcm_approval_notification(exchange):
         """
@@ -307,3 +383,8 @@ def send_exchange_rejection_notification(exchange, reason=None):
 def send_exchange_under_review_notification(exchange):
     """Convenience function for sending exchange under review notifications"""
     return ExchangeNotificationService.send_under_review_notification(exchange)
+
+
+def send_bulk_exchange_moderation_notifications(exchanges, approved, reason=None):
+    """Convenience function for sending approval or rejection notifications for many exchanges"""
+    return ExchangeNotificationService.send_bulk_moderation_notifications(exchanges, approved, reason)
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 from django.contrib.auth import get_user_model
 from notification.api.utils import FCMNotificationService
+from notification.api.notification_bulk import PushMessage, create_notifications, enqueue_pushes
 from notification.models import Notification
 
 User = get_user_model()
@@ -218,6 +219,54 @@ class IntelNotificationService:
         except Exception as e:
             logger.error(f"Error sending Intel status update notification: {e}")
     
+    @staticmethod
+    def send_bulk_status_update_notifications(updates):
+        """
+        Notify the authors of many intel posts about status changes at once.
+        
+        In-app notifications are inserted in bulk and pushes are sent in the background
+        after the transaction commits.
+        
+        Args:
+            updates: Iterable of (intel_uuid, author_id, old_status, new_status) tuples
+        """
+        notifications = []
+        pushes = []
+        for intel_uuid, author_id, old_status, new_status in updates:
+            message = f"Your intel report status changed from {old_status} to {new_status}"
+            notifications.append(Notification(
+                recipient_id=author_id,
+                sender=None,  # System notification
+                notification_type='INTEL_STATUS_UPDATE',
+                title="Intel status updated",
+                message=message,
+                related_object_id=str(intel_uuid),
+                related_object_type='intel',
+                metadata={
+                    'intel_uuid': str(intel_uuid),
+                    'old_status': old_status,
+                    'new_status': new_status,
+                }
+            ))
+            pushes.append(PushMessage(
+                user_id=author_id,
+                template_name='INTEL_STATUS_UPDATE',
+                context={'old_status': old_status, 'new_status': new_status},
+                data={
+                    'type': 'intel_status_update',
+                    'intel_uuid': str(intel_uuid),
+                    'old_status': old_status,
+                    'new_status': new_status,
+                },
+                fallback_title="📋 Intel Status Updated",
+                fallback_body=message,
+                icon='status_icon'
+            ))
+        
+        create_notifications(notifications)
+        enqueue_pushes(pushes)
+        logger.info(f"Created {len(notifications)} Intel status update notifications")
+    
     @staticmethod
     def _send_fcm_comment_notification(recipient, commenter, intel, comment):
         """
@@ -376,3 +425,8 @@ def send_intel_status_update_notification(intel, old_status, new_status):
 def send_comment_reply_notification(reply_comment, replier):
     """Send notification to parent comment owner when someone replies."""
     return IntelNotificationService.send_comment_reply_notification(reply_comment, replier)
+
+
+def send_bulk_intel_status_update_notifications(updates):
+    """Convenience function for sending status update notifications for many intel posts"""
+    return IntelNotificationService.send_bulk_status_update_notifications(updates)
@@ -0,0 +1,154 @@
+"""
+Bulk notification delivery
+Creates many in-app notifications with one INSERT and sends their push notifications
+from a background thread once the surrounding transaction has committed
+"""
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from django.db import connection, transaction
+from notification.models import Notification, FCMDeviceCustom
+from notification.api.notification_summary import invalidate_unread_count
+from notification.api.notification_stream import publish_notification_event
+from notification.api.notification_templates import get_template_registry
+from notification.api.utils import FCMNotificationService
+
+logger = logging.getLogger(__name__)
+
+BULK_CREATE_BATCH_SIZE = 500
+
+
+class PushMessage:
+    """
+    A push notification for one user, rendered from a template with a plain-text fallback
+    """
+
+    def __init__(
+        self,
+        user_id,
+        template_name: str,
+        context: Dict[str, Any],
+        data: Dict[str, Any],
+        fallback_title: str,
+        fallback_body: str,
+        icon: Optional[str] = None,
+        priority: str = 'normal'
+    ):
+        self.user_id = user_id
+        self.template_name = template_name
+        self.context = context
+        self.data = data
+        self.fallback_title = fallback_title
+        self.fallback_body = fallback_body
+        self.icon = icon
+        self.priority = priority
+
+
+class BulkNotificationService:
+    """
+    Service for delivering the same kind of notification to many users at once
+    """
+
+    @staticmethod
+    def create_notifications(notifications: List[Notification]) -> List[Notification]:
+        """
+        Insert unsaved Notification instances in bulk.
+
+        ``bulk_create`` skips model signals, so unread counters are invalidated and
+        live-stream events published here instead.
+        """
+        if not notifications:
+            return []
+
+        created = Notification.objects.bulk_create(notifications, batch_size=BULK_CREATE_BATCH_SIZE)
+        for recipient_id in {notification.recipient_id for notification in created}:
+            invalidate_unread_count(recipient_id)
+        for notification in created:
+            publish_notification_event(notification, True)
+        return created
+
+    @staticmethod
+    def enqueue_pushes(messages: List[PushMessage]):
+        """
+        Send push notifications in a background thread after the current transaction commits,
+        so the caller's request does not wait on FCM
+        """
+        if not messages:
+            return
+
+        def _start():
+            thread = threading.Thread(
+                target=BulkNotificationService._deliver_pushes,
+                args=(messages,),
+                name='notification-push-delivery',
+                daemon=True
+            )
+            thread.start()
+
+        transaction.on_commit(_start)
+
+    @staticmethod
+    def _deliver_pushes(messages: List[PushMessage]):
+        """
+        Deliver push messages, loading every recipient's devices in one query.
+
+        Templates are rendered through the registry, which memoizes the output, so
+        recipients sharing a context reuse one rendering.
+        """
+        sent = 0
+        try:
+            devices_by_user = defaultdict(list)
+            devices = FCMDeviceCustom.objects.filter(
+                user_id__in={message.user_id for message in messages}
+            ).select_related('user')
+            for device in devices:
+                devices_by_user[device.user_id].append(device)
+
+            registry = get_template_registry()
+            for message in messages:
+                user_devices = devices_by_user.get(message.user_id)
+                if not user_devices:
+                    continue
+                try:
+                    registered = registry.get(message.template_name)
+                    if registered is not None:
+                        title, body = registry.render(message.template_name, message.context)
+                        template = registered.template
+                        icon, sound, priority = template.icon, template.sound, template.priority
+                    else:
+                        title, body = message.fallback_title, message.fallback_body
+                        template = None
+                        icon, sound, priority = message.icon, 'default', message.priority
+
+                    for device in user_devices:
+                        FCMNotificationService._send_to_device(
+                            device=device,
+                            title=title,
+                            body=body,
+                            data=message.data,
+                            icon=icon,
+                            sound=sound,
+                            priority=priority,
+                            template=template
+                        )
+                        sent += 1
+                except Exception as e:
+                    logger.error(f"Failed to send push notification to user {message.user_id}: {e}")
+
+            logger.info(f"Delivered {sent} push notifications for {len(messages)} messages")
+        except Exception as e:
+            logger.error(f"Error delivering bulk push notifications: {e}", exc_info=True)
+        finally:
+            connection.close()
+
+
+# Convenience functions for external usage
+def create_notifications(notifications: List[Notification]) -> List[Notification]:
+    """Convenience function for bulk creating in-app notifications"""
+    return BulkNotificationService.create_notifications(notifications)
+
+
+def enqueue_pushes(messages: List[PushMessage]):
+    """Convenience function for sending push notifications after commit"""
+    return BulkNotificationService.enqueue_pushes(messages)
@@ -0,0 +1,174 @@
+"""
+Notification retention utilities
+Moves old notifications and notification logs into archive tables in throttled batches
+"""
+import time
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from core.api.bulk_delete_utils import delete_in_chunks
+from notification.models import (
+    Notification, NotificationLog, ArchivedNotification, ArchivedNotificationLog
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_SETTINGS = {
+    'NOTIFICATION_DAYS': 90,
+    'LOG_DAYS': 30,
+    'BATCH_SIZE': 1000,
+    'BATCH_SLEEP_SECONDS': 0.1,
+}
+
+
+def get_retention_settings() -> dict:
+    """Return retention settings merged over the defaults"""
+    return {**DEFAULT_RETENTION_SETTINGS, **getattr(settings, 'NOTIFICATION_RETENTION', {})}
+
+
+def _month_start(value):
+    return value.date().replace(day=1)
+
+
+class NotificationRetentionService:
+    """
+    Service for archiving and hard deleting old notification data
+    """
+
+    @staticmethod
+    def archivable_notifications(days: int):
+        """Read or soft deleted notifications created more than ``days`` ago"""
+        cutoff = timezone.now() - timedelta(days=days)
+        return Notification.objects.filter(
+            Q(is_read=True) | Q(is_deleted=True),
+            created_at__lt=cutoff
+        )
+
+    @staticmethod
+    def archivable_logs(days: int):
+        """Notification logs created more than ``days`` ago that are no longer pending"""
+        cutoff = timezone.now() - timedelta(days=days)
+        return NotificationLog.objects.filter(created_at__lt=cutoff).exclude(status='PENDING')
+
+    @staticmethod
+    def _to_archived_notification(notification):
+        return ArchivedNotification(
+            original_id=notification.pk,
+            uuid=notification.uuid,
+            recipient_id=notification.recipient_id,
+            sender_id=notification.sender_id,
+            notification_type=notification.notification_type,
+            title=notification.title,
+            message=notification.message,
+            related_object_id=notification.related_object_id,
+            related_object_type=notification.related_object_type,
+            is_read=notification.is_read,
+            is_deleted=notification.is_deleted,
+            created_at=notification.created_at,
+            read_at=notification.read_at,
+            deleted_at=notification.deleted_at,
+            metadata=notification.metadata,
+            archive_month=_month_start(notification.created_at)
+        )
+
+    @staticmethod
+    def _to_archived_log(log):
+        return ArchivedNotificationLog(
+            original_id=log.pk,
+            recipient_id=log.recipient_id,
+            device_id=log.device_id,
+            template_id=log.template_id,
+            title=log.title,
+            body=log.body,
+            data=log.data,
+            status=log.status,
+            firebase_message_id=log.firebase_message_id,
+            error_message=log.error_message,
+            sent_at=log.sent_at,
+            delivered_at=log.delivered_at,
+            clicked_at=log.clicked_at,
+            created_at=log.created_at,
+            archive_month=_month_start(log.created_at)
+        )
+
+    @staticmethod
+    def _move_in_batches(queryset, to_archive, archive_model, batch_size, sleep_seconds,
+                         archive=True, max_batches=None) -> int:
+        """
+        Copy rows into the archive table and hard delete them, one short transaction per batch.
+
+        Batching, ``SKIP LOCKED`` row locks and throttling come from ``delete_in_chunks``;
+        when archiving, each batch is copied inside the transaction that deletes it.
+        """
+        def copy_to_archive(pks):
+            rows = queryset.model._base_manager.filter(pk__in=pks).order_by('pk')
+            archive_model.objects.bulk_create([to_archive(row) for row in rows])
+
+        report = delete_in_chunks(
+            queryset,
+            batch_size=batch_size,
+            sleep_seconds=sleep_seconds,
+            max_batches=max_batches,
+            before_delete=copy_to_archive if archive else None
+        )
+        return report['deleted']
+
+    @staticmethod
+    def run(notification_days: int = None, log_days: int = None, batch_size: int = None,
+            sleep_seconds: float = None, archive: bool = True, dry_run: bool = False,
+            max_batches: int = None) -> dict:
+        """
+        Archive (or purge, when ``archive`` is False) old notifications and logs.
+
+        Returns metrics for the run including rows moved per second.
+        """
+        config = get_retention_settings()
+        notification_days = notification_days if notification_days is not None else config['NOTIFICATION_DAYS']
+        log_days = log_days if log_days is not None else config['LOG_DAYS']
+        batch_size = batch_size or config['BATCH_SIZE']
+        sleep_seconds = sleep_seconds if sleep_seconds is not None else config['BATCH_SLEEP_SECONDS']
+
+        notifications = NotificationRetentionService.archivable_notifications(notification_days)
+        logs = NotificationRetentionService.archivable_logs(log_days)
+
+        if dry_run:
+            return {
+                'dry_run': True,
+                'notifications_eligible': notifications.count(),
+                'logs_eligible': logs.count(),
+            }
+
+        started = time.monotonic()
+        notifications_moved = NotificationRetentionService._move_in_batches(
+            notifications,
+            NotificationRetentionService._to_archived_notification,
+            ArchivedNotification,
+            batch_size,
+            sleep_seconds,
+            archive=archive,
+            max_batches=max_batches
+        )
+        logs_moved = NotificationRetentionService._move_in_batches(
+            logs,
+            NotificationRetentionService._to_archived_log,
+            ArchivedNotificationLog,
+            batch_size,
+            sleep_seconds,
+            archive=archive,
+            max_batches=max_batches
+        )
+        elapsed = time.monotonic() - started
+        total_moved = notifications_moved + logs_moved
+
+        metrics = {
+            'dry_run': False,
+            'archived': archive,
+            'notifications_moved': notifications_moved,
+            'logs_moved': logs_moved,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(total_moved / elapsed, 1) if elapsed > 0 else float(total_moved),
+        }
+        logger.info(f"Notification retention run finished: {metrics}")
+        return metrics
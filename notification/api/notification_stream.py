@@ -0,0 +1,222 @@
+"""
+Live notification stream utilities
+Fans out notification events to connected server-sent event (SSE) clients
+"""
+import json
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_SETTINGS = {
+    # Dotted path of the broker class used to fan out events
+    'BROKER': 'notification.api.notification_stream.InProcessBroker',
+    # Seconds between keepalive comments sent to idle clients
+    'KEEPALIVE_SECONDS': 15,
+    # Seconds after which a stream is closed; EventSource clients reconnect automatically
+    'MAX_CONNECTION_SECONDS': 300,
+    # Reconnect delay advertised to clients, in milliseconds
+    'RETRY_MILLISECONDS': 3000,
+    # Events buffered per connection before the oldest ones are dropped
+    'QUEUE_SIZE': 100,
+    # PostgreSQL channel used by PostgresNotifyBroker
+    'CHANNEL': 'notification_events',
+}
+
+EVENT_NOTIFICATION = 'notification'
+EVENT_UNREAD_COUNT = 'unread_count'
+
+
+def get_stream_settings() -> dict:
+    """Return stream settings merged over the defaults"""
+    return {**DEFAULT_STREAM_SETTINGS, **getattr(settings, 'NOTIFICATION_STREAM', {})}
+
+
+class InProcessBroker:
+    """
+    Broker that delivers events to subscribers living in the current process.
+
+    Publishing is safe from synchronous code running in any thread; each subscriber
+    owns an ``asyncio.Queue`` bound to the event loop it was created on.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id):
+        """Register a new subscriber queue for a user and return it"""
+        queue = asyncio.Queue(maxsize=get_stream_settings()['QUEUE_SIZE'])
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[str(user_id)].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, user_id, subscriber):
+        """Remove a subscriber queue"""
+        with self._lock:
+            subscribers = self._subscribers.get(str(user_id))
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[str(user_id)]
+
+    def has_subscribers(self, user_id) -> bool:
+        return bool(self._subscribers.get(str(user_id)))
+
+    def should_publish(self, user_id) -> bool:
+        """Whether publishing for this user can reach anyone; lets callers skip serialization"""
+        return self.has_subscribers(user_id)
+
+    def publish(self, user_id, event: str, data: dict):
+        """Deliver an event to every subscriber of a user"""
+        self.dispatch(user_id, event, data)
+
+    def dispatch(self, user_id, event: str, data: dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(user_id), ()))
+        message = {'event': event, 'data': data}
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, queue, message)
+            except RuntimeError:
+                # Event loop already closed, the subscriber is going away
+                pass
+
+    @staticmethod
+    def _enqueue(queue, message):
+        if queue.full():
+            # Slow client: drop the oldest event rather than blocking publishers
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+
+class PostgresNotifyBroker(InProcessBroker):
+    """
+    Broker that fans out events across processes with PostgreSQL LISTEN/NOTIFY.
+
+    Events are published with ``pg_notify`` on the default connection. Each process runs a
+    single listener thread which forwards received events to its local subscribers.
+    """
+
+    # NOTIFY payloads are limited to 8000 bytes
+    MAX_PAYLOAD_BYTES = 7900
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+
+    def subscribe(self, user_id):
+        self._ensure_listener()
+        return super().subscribe(user_id)
+
+    def should_publish(self, user_id) -> bool:
+        # Subscribers may live in any process
+        return True
+
+    def publish(self, user_id, event: str, data: dict):
+        payload = json.dumps(
+            {'user_id': str(user_id), 'event': event, 'data': data},
+            cls=DjangoJSONEncoder
+        )
+        if len(payload.encode('utf-8')) > self.MAX_PAYLOAD_BYTES:
+            # Too large to notify; clients refetch the notification list on a bare event
+            payload = json.dumps({'user_id': str(user_id), 'event': event, 'data': {}})
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [get_stream_settings()['CHANNEL'], payload])
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='notification-listener', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        import select
+        import psycopg2
+
+        db = settings.DATABASES['default']
+        listen_connection = psycopg2.connect(
+            dbname=db.get('NAME'),
+            user=db.get('USER'),
+            password=db.get('PASSWORD'),
+            host=db.get('HOST'),
+            port=db.get('PORT')
+        )
+        listen_connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        try:
+            with listen_connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{get_stream_settings()["CHANNEL"]}"')
+            while True:
+                if select.select([listen_connection], [], [], 60) == ([], [], []):
+                    continue
+                listen_connection.poll()
+                while listen_connection.notifies:
+                    notify = listen_connection.notifies.pop(0)
+                    try:
+                        message = json.loads(notify.payload)
+                        self.dispatch(message['user_id'], message['event'], message['data'])
+                    except (ValueError, KeyError) as e:
+                        logger.error(f"Invalid notification event payload: {e}")
+        except Exception as e:
+            logger.error(f"Notification listener stopped: {e}")
+        finally:
+            listen_connection.close()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the process-wide broker configured in ``NOTIFICATION_STREAM['BROKER']``"""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(get_stream_settings()['BROKER'])()
+    return _broker
+
+
+def publish_notification_event(notification, created: bool):
+    """
+    Publish stream events for a saved notification once the surrounding transaction commits.
+
+    New notifications are pushed in full; every change also tells clients to refresh
+    their unread badge.
+    """
+    recipient_id = notification.recipient_id
+
+    def _publish():
+        try:
+            broker = get_broker()
+            if not broker.should_publish(recipient_id):
+                return
+            if created:
+                from notification.api.serializers import NotificationListSerializer
+                broker.publish(recipient_id, EVENT_NOTIFICATION, NotificationListSerializer(notification).data)
+            broker.publish(recipient_id, EVENT_UNREAD_COUNT, {})
+        except Exception as e:
+            logger.error(f"Error publishing notification event for user {recipient_id}: {e}")
+
+    transaction.on_commit(_publish)
+
+
+def publish_unread_count_changed(user_id):
+    """Tell a user's connected clients that their unread count changed (used after bulk updates)"""
+
+    def _publish():
+        try:
+            broker = get_broker()
+            if broker.should_publish(user_id):
+                broker.publish(user_id, EVENT_UNREAD_COUNT, {})
+        except Exception as e:
+            logger.error(f"Error publishing unread count event for user {user_id}: {e}")
+
+    transaction.on_commit(_publish)
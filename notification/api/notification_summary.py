@@ -0,0 +1,109 @@
+"""
+Notification summary utilities
+Aggregates per-user notification counts and caches the unread badge counter
+"""
+import logging
+from django.core.cache import cache
+from django.db.models import Count, Q
+from core.api.cache_utils import invalidated_timeout
+from notification.models import Notification
+
+logger = logging.getLogger(__name__)
+
+UNREAD_COUNT_CACHE_KEY = 'notification:unread_count:{user_id}'
+UNREAD_COUNT_CACHE_TIMEOUT = 60 * 60
+
+
+class NotificationSummaryService:
+    """
+    Service for computing notification counters with as few queries as possible
+    """
+
+    @staticmethod
+    def _unread_count_key(user_id) -> str:
+        return UNREAD_COUNT_CACHE_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def get_summary(user) -> dict:
+        """
+        Build totals and per-type total/unread counts for a user.
+
+        Runs a single ``GROUP BY notification_type`` query with conditional
+        aggregates instead of two COUNT queries per notification type.
+        """
+        rows = (
+            Notification.objects
+            .filter(recipient=user, is_deleted=False)
+            .values('notification_type')
+            .annotate(
+                total=Count('id'),
+                unread=Count('id', filter=Q(is_read=False))
+            )
+            .order_by()
+        )
+
+        type_counts = {
+            notification_type: {'total': 0, 'unread': 0}
+            for notification_type, _ in Notification.NOTIFICATION_TYPES
+        }
+        total_count = 0
+        unread_count = 0
+        for row in rows:
+            if row['notification_type'] in type_counts:
+                type_counts[row['notification_type']] = {
+                    'total': row['total'],
+                    'unread': row['unread']
+                }
+            total_count += row['total']
+            unread_count += row['unread']
+
+        # The summary already knows the unread total, so refresh the badge counter for free
+        cache.set(
+            NotificationSummaryService._unread_count_key(user.pk),
+            unread_count,
+            invalidated_timeout(UNREAD_COUNT_CACHE_TIMEOUT)
+        )
+
+        return {
+            'total_count': total_count,
+            'unread_count': unread_count,
+            'type_counts': type_counts
+        }
+
+    @staticmethod
+    def get_unread_count(user) -> int:
+        """
+        Return the unread notification count for a user, served from cache when possible
+        """
+        key = NotificationSummaryService._unread_count_key(user.pk)
+        unread_count = cache.get(key)
+        if unread_count is None:
+            unread_count = Notification.objects.filter(
+                recipient=user,
+                is_read=False,
+                is_deleted=False
+            ).count()
+            cache.set(key, unread_count, invalidated_timeout(UNREAD_COUNT_CACHE_TIMEOUT))
+        return unread_count
+
+    @staticmethod
+    def invalidate_unread_count(user_id):
+        """
+        Drop the cached unread counter for a user.
+
+        Called from model signals and after bulk ``update()`` calls, which bypass signals.
+        """
+        try:
+            cache.delete(NotificationSummaryService._unread_count_key(user_id))
+        except Exception as e:
+            logger.error(f"Error invalidating unread count cache for user {user_id}: {e}")
+
+
+def get_unread_count(user) -> int:
+    """Convenience function for the cached unread counter"""
+    return NotificationSummaryService.get_unread_count(user)
+
+
+def invalidate_unread_count(user_id):
+    """Convenience function for dropping the cached unread counter"""
+    return NotificationSummaryService.invalidate_unread_count(user_id)
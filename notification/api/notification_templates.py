@@ -0,0 +1,165 @@
+"""
+Notification template registry
+Loads active notification templates once, precompiles them and caches rendered output
+"""
+import logging
+import threading
+import time
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Optional, Tuple
+from django.core.cache import cache
+from django.db.models import Count, Max
+from notification.models import NotificationTemplate
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_VERSION_CACHE_KEY = 'notification:template_registry_version'
+RENDER_CACHE_SIZE = 1024
+# How often each process compares its templates with the database, which catches
+# changes whose cache version bump did not reach it (e.g. without a shared cache)
+REGISTRY_RECHECK_SECONDS = 30
+
+
+class CompiledTemplate:
+    """
+    A ``str.format`` template parsed once into literal and placeholder segments
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.segments = [
+            (literal, field_name, conversion, format_spec)
+            for literal, field_name, format_spec, conversion in Formatter().parse(source)
+        ]
+        self.placeholders = frozenset(
+            field_name for _, field_name, _, _ in self.segments if field_name is not None
+        )
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """
+        Render the template; raises ``KeyError`` for a missing placeholder like ``str.format``
+        """
+        parts = []
+        for literal, field_name, conversion, format_spec in self.segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value = context[field_name]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 's':
+                value = str(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            parts.append(format(value, format_spec or ''))
+        return ''.join(parts)
+
+
+class RegisteredTemplate:
+    """
+    An active notification template with precompiled title and body
+    """
+
+    def __init__(self, template: NotificationTemplate):
+        self.template = template
+        self.title = CompiledTemplate(template.title_template)
+        self.body = CompiledTemplate(template.body_template)
+
+    def render(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        return self.title.render(context), self.body.render(context)
+
+
+class NotificationTemplateRegistry:
+    """
+    Process-wide registry of active notification templates.
+
+    Templates are loaded in one query and reloaded when the shared registry version
+    in the cache changes, which happens whenever a template is saved or deleted. Every
+    ``REGISTRY_RECHECK_SECONDS`` the newest ``updated_at`` and count of templates are
+    also compared with the database, so a process whose cache missed the version bump
+    still picks up changes.
+    Rendered output is memoized per (template, context), so bulk deliveries render
+    each distinct context once however many recipients share it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates: Optional[Dict[str, RegisteredTemplate]] = None
+        self._version = None
+        self._db_state = None
+        self._recheck_at = 0.0
+        self._render_cached = lru_cache(maxsize=RENDER_CACHE_SIZE)(self._render)
+
+    @staticmethod
+    def invalidate():
+        """Bump the shared registry version so every process reloads its templates"""
+        try:
+            cache.incr(REGISTRY_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(REGISTRY_VERSION_CACHE_KEY, 1, None)
+
+    @staticmethod
+    def _read_db_state():
+        return tuple(NotificationTemplate.objects.aggregate(
+            updated_at=Max('updated_at'), count=Count('pk')
+        ).values())
+
+    def _load(self, version):
+        self._db_state = self._read_db_state()
+        templates = {
+            template.name: RegisteredTemplate(template)
+            for template in NotificationTemplate.objects.filter(is_active=True)
+        }
+        self._templates = templates
+        self._version = version
+        self._recheck_at = time.monotonic() + REGISTRY_RECHECK_SECONDS
+        self._render_cached.cache_clear()
+        logger.info(f"Loaded {len(templates)} notification templates")
+
+    def _is_stale(self, version) -> bool:
+        return self._templates is None or version != self._version
+
+    def _get_templates(self) -> Dict[str, RegisteredTemplate]:
+        version = cache.get(REGISTRY_VERSION_CACHE_KEY, 0)
+        if self._is_stale(version) or time.monotonic() >= self._recheck_at:
+            with self._lock:
+                if self._is_stale(version):
+                    self._load(version)
+                elif time.monotonic() >= self._recheck_at:
+                    if self._read_db_state() != self._db_state:
+                        self._load(version)
+                    else:
+                        self._recheck_at = time.monotonic() + REGISTRY_RECHECK_SECONDS
+        return self._templates
+
+    def get(self, name: str) -> Optional[RegisteredTemplate]:
+        """Return the active template with the given name, or None"""
+        return self._get_templates().get(name)
+
+    def _render(self, name: str, version, context_items: tuple) -> Tuple[str, str]:
+        return self._templates[name].render(dict(context_items))
+
+    def render(self, name: str, context: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """
+        Render a template's title and body.
+
+        Raises ``KeyError`` if the template does not exist or a placeholder is missing.
+        """
+        registered = self._get_templates()[name]
+        context = context or {}
+        try:
+            context_items = tuple(sorted(context.items()))
+            hash(context_items)
+        except TypeError:
+            # Unhashable or unorderable context values cannot be memoized
+            return registered.render(context)
+        return self._render_cached(name, self._version, context_items)
+
+
+_registry = NotificationTemplateRegistry()
+
+
+def get_template_registry() -> NotificationTemplateRegistry:
+    """Return the process-wide notification template registry"""
+    return _registry
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from notification.models import Notification
+from notification.api.notification_summary import NotificationSummaryService
 from typing import Optional, Dict, Any
 
 User = get_user_model()
@@ -320,10 +321,6 @@ class NotificationService:
         """Get count of unread notifications for a user"""
         try:
             user = User.objects.get(uuid=user_uuid)
-            return Notification.objects.filter(
-                recipient=user,
-                is_read=False,
-                is_deleted=False
-            ).count()
+            return NotificationSummaryService.get_unread_count(user)
         except User.DoesNotExist:
             return 0
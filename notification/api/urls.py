@@ -4,6 +4,7 @@ from .views.fcm import (
     NotificationTemplateViewSet, NotificationStatsViewSet, NotificationManagementViewSet
 )
 from .views.notifications import NotificationViewSet
+from .views.stream import notification_stream
 
 from django.urls import path, include
 
@@ -13,6 +14,9 @@ router.register("api/templates", NotificationTemplateViewSet, basename="template
 router.register("api/notifications", NotificationViewSet, basename="notifications")
 
 urlpatterns = [
+    # Live notification stream (server-sent events) - must precede the router's detail route
+    path('api/notifications/stream/', notification_stream, name='notification_stream'),
+
     # Router URLs - includes standard CRUD operations
     path("", include(router.urls)),
     
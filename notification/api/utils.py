@@ -7,6 +7,7 @@ from rest_framework.pagination import PageNumberPagination
 from firebase_admin import messaging
 from firebase_admin.exceptions import FirebaseError
 from notification.models import FCMDeviceCustom, NotificationTemplate, NotificationLog
+from notification.api.notification_templates import get_template_registry
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -155,16 +156,15 @@ class FCMNotificationService:
         """
         Send notification using a predefined template
         """
-        try:
-            template = NotificationTemplate.objects.get(name=template_name, is_active=True)
-        except NotificationTemplate.DoesNotExist:
+        registry = get_template_registry()
+        registered = registry.get(template_name)
+        if registered is None:
             logger.error(f"Notification template '{template_name}' not found")
             return []
         
-        # Replace template variables
-        context = context or {}
-        title = template.title_template.format(**context)
-        body = template.body_template.format(**context)
+        # Replace template variables (precompiled and cached by the registry)
+        title, body = registry.render(template_name, context)
+        template = registered.template
         
         return FCMNotificationService.send_notification_to_user(
             user=user,
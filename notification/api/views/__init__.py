@@ -2,4 +2,5 @@ from .fcm import (
     FCMDeviceViewSet, NotificationViewSet,
     NotificationTemplateViewSet, NotificationStatsViewSet, NotificationManagementViewSet
 )
-from .notifications import NotificationViewSet
\ No newline at end of file
+from .notifications import NotificationViewSet
+from .stream import notification_stream
@@ -13,6 +13,8 @@ from notification.api.serializers import (
     MarkAsReadSerializer,
     CreateNotificationSerializer
 )
+from notification.api.notification_summary import NotificationSummaryService
+from notification.api.notification_stream import publish_unread_count_changed
 import django_filters
 
 
@@ -166,6 +168,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
             is_read=True,
             read_at=timezone.now()
         )
+        NotificationSummaryService.invalidate_unread_count(request.user.pk)
+        publish_unread_count_changed(request.user.pk)
         
         response = {
             "success": True,
@@ -223,6 +227,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
             is_deleted=True,
             deleted_at=timezone.now()
         )
+        NotificationSummaryService.invalidate_unread_count(request.user.pk)
+        publish_unread_count_changed(request.user.pk)
         
         response = {
             "success": True,
@@ -236,11 +242,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         """
         Get count of unread notifications for the current user
         """
-        unread_count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False,
-            is_deleted=False
-        ).count()
+        unread_count = NotificationSummaryService.get_unread_count(request.user)
         
         response = {
             "success": True,
@@ -256,38 +258,12 @@ class NotificationViewSet(viewsets.ModelViewSet):
         """
         Get notification summary with counts by type
         """
-        notifications = Notification.objects.filter(
-            recipient=request.user,
-            is_deleted=False
-        )
-        
-        total_count = notifications.count()
-        unread_count = notifications.filter(is_read=False).count()
-        
-        # Count by type
-        type_counts = {}
-        for notification_type, _ in Notification.NOTIFICATION_TYPES:
-            type_count = notifications.filter(
-                notification_type=notification_type
-            ).count()
-            unread_type_count = notifications.filter(
-                notification_type=notification_type,
-                is_read=False
-            ).count()
-            
-            type_counts[notification_type] = {
-                'total': type_count,
-                'unread': unread_type_count
-            }
+        summary = NotificationSummaryService.get_summary(request.user)
         
         response = {
             "success": True,
             "message": "Notification summary retrieved successfully.",
-            "data": {
-                "total_count": total_count,
-                "unread_count": unread_count,
-                "type_counts": type_counts
-            }
+            "data": summary
         }
         return Response(response, status=status.HTTP_200_OK)
     
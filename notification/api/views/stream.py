@@ -0,0 +1,106 @@
+import json
+import asyncio
+import logging
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework.exceptions import AuthenticationFailed
+from notification.api.notification_summary import NotificationSummaryService
+from notification.api.notification_stream import (
+    get_broker, get_stream_settings, EVENT_UNREAD_COUNT
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _authenticate(request):
+    """
+    Authenticate with the usual ``Authorization: Bearer`` header, or with a ``token``
+    query parameter since browser EventSource clients cannot set headers.
+    """
+    authentication = JWTAuthentication()
+    try:
+        result = authentication.authenticate(request)
+        if result is not None:
+            return result[0]
+        raw_token = request.GET.get('token')
+        if raw_token:
+            validated_token = authentication.get_validated_token(raw_token)
+            return authentication.get_user(validated_token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return None
+
+
+def _format_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def _event_stream(user, broker):
+    config = get_stream_settings()
+    get_unread_count = sync_to_async(NotificationSummaryService.get_unread_count)
+
+    # Subscribing here rather than in the view ties the subscription to this generator:
+    # a response that is never streamed never subscribes, and the finally below releases it
+    subscriber = broker.subscribe(user.pk)
+    loop, queue = subscriber
+    deadline = loop.time() + config['MAX_CONNECTION_SECONDS']
+    try:
+        yield f"retry: {config['RETRY_MILLISECONDS']}\n\n"
+        yield _format_event(EVENT_UNREAD_COUNT, {'unread_count': await get_unread_count(user)})
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(),
+                    timeout=min(config['KEEPALIVE_SECONDS'], remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            messages = [message]
+            while not queue.empty():
+                messages.append(queue.get_nowait())
+
+            # Collapse bursts of badge updates (e.g. mark all as read) into a single count
+            unread_count_changed = False
+            for message in messages:
+                if message['event'] == EVENT_UNREAD_COUNT:
+                    unread_count_changed = True
+                else:
+                    yield _format_event(message['event'], message['data'])
+            if unread_count_changed:
+                yield _format_event(EVENT_UNREAD_COUNT, {'unread_count': await get_unread_count(user)})
+    finally:
+        broker.unsubscribe(user.pk, subscriber)
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    Server-sent event stream of new notifications and unread count changes for the current user.
+
+    Requires the ASGI application (``core.asgi``); under WSGI each open stream would hold
+    a worker for its whole lifetime.
+    """
+    user = await sync_to_async(_authenticate)(request)
+    if user is None:
+        return JsonResponse({
+            "success": False,
+            "message": "Authentication credentials were not provided or are invalid."
+        }, status=401)
+
+    response = StreamingHttpResponse(
+        _event_stream(user, get_broker()),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
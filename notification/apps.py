@@ -12,3 +12,6 @@ class NotificationConfig(AppConfig):
         """
         from .firebase_config import initialize_firebase
         initialize_firebase()
+
+        # Register signal handlers
+        from . import signals  # noqa: F401
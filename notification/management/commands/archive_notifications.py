@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from notification.api.notification_retention import NotificationRetentionService
+
+
+class Command(BaseCommand):
+    help = 'Archive old read/deleted notifications and notification logs in throttled batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Archive read or deleted notifications older than this many days')
+        parser.add_argument('--log-days', type=int, default=None,
+                            help='Archive notification logs older than this many days')
+        parser.add_argument('--batch-size', type=int, default=None, help='Rows moved per transaction')
+        parser.add_argument('--sleep', type=float, default=None, help='Seconds to pause between batches')
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help='Stop after this many batches per table (default: run until done)')
+        parser.add_argument('--purge', action='store_true',
+                            help='Hard delete eligible rows without copying them to the archive tables')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows are eligible')
+
+    def handle(self, *args, **options):
+        metrics = NotificationRetentionService.run(
+            notification_days=options['days'],
+            log_days=options['log_days'],
+            batch_size=options['batch_size'],
+            sleep_seconds=options['sleep'],
+            archive=not options['purge'],
+            dry_run=options['dry_run'],
+            max_batches=options['max_batches']
+        )
+
+        if metrics['dry_run']:
+            self.stdout.write(
+                f"Dry run: {metrics['notifications_eligible']} notifications and "
+                f"{metrics['logs_eligible']} logs are eligible for archiving"
+            )
+            return
+
+        action = 'Archived' if metrics['archived'] else 'Purged'
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {metrics['notifications_moved']} notifications and {metrics['logs_moved']} logs "
+            f"in {metrics['elapsed_seconds']}s ({metrics['rows_per_second']} rows/s)"
+        ))
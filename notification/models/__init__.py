@@ -1,2 +1,3 @@
 from .fcm import FCMDeviceCustom, NotificationTemplate, NotificationLog
 from .notifications import Notification
+from .archive import ArchivedNotification, ArchivedNotificationLog
@@ -0,0 +1,90 @@
+import uuid
+from django.db import models
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+class ArchivedNotification(models.Model):
+    """
+    Cold storage for read or deleted notifications moved out of the hot notification table.
+    Rows are grouped by ``archive_month`` so a whole month can be queried or purged at once.
+    """
+    original_id = models.BigIntegerField(help_text="Primary key of the notification before archiving")
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    recipient = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications'
+    )
+    sender = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='archived_sent_notifications',
+        null=True,
+        blank=True
+    )
+    notification_type = models.CharField(max_length=30)
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    related_object_id = models.CharField(max_length=255, null=True, blank=True)
+    related_object_type = models.CharField(max_length=50, null=True, blank=True)
+    is_read = models.BooleanField(default=False)
+    is_deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+    read_at = models.DateTimeField(null=True, blank=True)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+
+    archive_month = models.DateField(help_text="First day of the month the notification was created in")
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Archived Notification"
+        verbose_name_plural = "Archived Notifications"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['archive_month']),
+            models.Index(fields=['recipient', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.title} - {self.archive_month:%Y-%m}"
+
+
+class ArchivedNotificationLog(models.Model):
+    """
+    Cold storage for notification logs moved out of the hot notification log table
+    """
+    original_id = models.BigIntegerField(help_text="Primary key of the log before archiving")
+    recipient = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_notification_logs'
+    )
+    device_id = models.BigIntegerField(null=True, blank=True)
+    template_id = models.BigIntegerField(null=True, blank=True)
+    title = models.CharField(max_length=200)
+    body = models.TextField()
+    data = models.JSONField(null=True, blank=True)
+    status = models.CharField(max_length=10)
+    firebase_message_id = models.CharField(max_length=200, null=True, blank=True)
+    error_message = models.TextField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    clicked_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+
+    archive_month = models.DateField(help_text="First day of the month the log was created in")
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Archived Notification Log"
+        verbose_name_plural = "Archived Notification Logs"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['archive_month']),
+        ]
+
+    def __str__(self):
+        return f"{self.title} - {self.status} - {self.archive_month:%Y-%m}"
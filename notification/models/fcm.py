@@ -1,4 +1,6 @@
 import uuid
+from string import Formatter
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth import get_user_model
 from fcm_django.models import FCMDevice
@@ -34,6 +36,27 @@ class FCMDeviceCustom(FCMDevice):
         self.save(update_fields=['active', 'updated_at'])
 
 
+def validate_template_placeholders(value):
+    """
+    Validate that a notification template is well-formed ``str.format`` syntax and only
+    uses named placeholders, e.g. ``{commenter_first_name}``
+    """
+    try:
+        parsed = list(Formatter().parse(value))
+    except ValueError as e:
+        raise ValidationError(f"Invalid template syntax: {e}")
+
+    for _, field_name, format_spec, _ in parsed:
+        if field_name is None:
+            continue
+        if not field_name.isidentifier():
+            raise ValidationError(
+                f"Invalid placeholder '{{{field_name}}}'. Use named placeholders such as {{user_name}}."
+            )
+        if format_spec and '{' in format_spec:
+            raise ValidationError(f"Nested placeholders are not supported in '{{{field_name}}}'.")
+
+
 class NotificationTemplate(models.Model):
     """
     Model to store notification templates for different notification types in the Vanguard app
@@ -57,8 +80,15 @@ class NotificationTemplate(models.Model):
 
     name = models.CharField(max_length=100, unique=True)
     notification_type = models.CharField(max_length=30, choices=NOTIFICATION_TYPES)
-    title_template = models.CharField(max_length=200, help_text="Template for notification title")
-    body_template = models.TextField(help_text="Template for notification body")
+    title_template = models.CharField(
+        max_length=200,
+        validators=[validate_template_placeholders],
+        help_text="Template for notification title"
+    )
+    body_template = models.TextField(
+        validators=[validate_template_placeholders],
+        help_text="Template for notification body"
+    )
     icon = models.CharField(max_length=200, null=True, blank=True, help_text="Icon URL or name")
     sound = models.CharField(max_length=100, default='default', help_text="Sound for notification")
     priority = models.CharField(
@@ -77,6 +107,12 @@ class NotificationTemplate(models.Model):
     def __str__(self):
         return f"{self.name} - {self.notification_type}"
 
+    def save(self, *args, **kwargs):
+        # Reject broken templates up front instead of failing on every send
+        validate_template_placeholders(self.title_template)
+        validate_template_placeholders(self.body_template)
+        super().save(*args, **kwargs)
+
 
 class NotificationLog(models.Model):
     """
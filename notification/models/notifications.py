@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -111,7 +112,22 @@ class Notification(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['recipient', 'is_read', 'is_deleted']),
+            # Partial indexes matching the user-facing queries: every lookup filters
+            # recipient + is_deleted=False and orders by -created_at, so the list
+            # endpoint reads rows in index order without a sort. The INCLUDE columns
+            # let the summary run as an index-only scan; unread_count only needs the
+            # second (unread) index.
+            models.Index(
+                fields=['recipient', '-created_at'],
+                include=['id', 'notification_type', 'is_read'],
+                condition=Q(is_deleted=False),
+                name='notif_recipient_active_idx'
+            ),
+            models.Index(
+                fields=['recipient', '-created_at'],
+                condition=Q(is_deleted=False, is_read=False),
+                name='notif_recipient_unread_idx'
+            ),
             models.Index(fields=['notification_type']),
             models.Index(fields=['created_at']),
         ]
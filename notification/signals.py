@@ -0,0 +1,36 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from notification.models import Notification, NotificationTemplate
+from notification.api.notification_summary import invalidate_unread_count
+from notification.api.notification_stream import publish_notification_event, publish_unread_count_changed
+from notification.api.notification_templates import NotificationTemplateRegistry
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, **kwargs):
+    """
+    Invalidate the recipient's unread counter when a notification is created,
+    read, soft deleted or restored, and push the change to live streams
+    """
+    invalidate_unread_count(instance.recipient_id)
+    publish_notification_event(instance, created)
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, **kwargs):
+    """
+    Invalidate the recipient's unread counter when an unread notification is hard deleted.
+    Archiving only removes read or soft deleted rows, so it never touches the counter.
+    """
+    if not instance.is_read and not instance.is_deleted:
+        invalidate_unread_count(instance.recipient_id)
+        publish_unread_count_changed(instance.recipient_id)
+
+
+@receiver(post_save, sender=NotificationTemplate)
+@receiver(post_delete, sender=NotificationTemplate)
+def notification_template_changed(sender, instance, **kwargs):
+    """
+    Reload the template registry in every process when a template changes
+    """
+    NotificationTemplateRegistry.invalidate()
@@ -1,3 +1,65 @@
+from unittest import skipUnless
+from django.db import connection
+from django.db.models import Count, Q
 from django.test import TestCase
+from accounts.models import User
+from notification.models import Notification
 
-# Create your tests here.
+
+@skipUnless(connection.vendor == 'postgresql', 'Partial indexes are checked with PostgreSQL EXPLAIN')
+class NotificationIndexTests(TestCase):
+    """
+    The user-facing notification queries are answered from the partial indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create(username=f'user{i}', email=f'user{i}@example.com')
+            for i in range(20)
+        ]
+        Notification.objects.bulk_create([
+            Notification(
+                recipient=user,
+                notification_type='SYSTEM_UPDATES',
+                title='Title',
+                message='Message',
+                is_read=n % 3 != 0,
+                is_deleted=n % 5 == 0,
+            )
+            for user in cls.users
+            for n in range(200)
+        ])
+
+    def setUp(self):
+        self.user = self.users[0]
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Notification._meta.db_table}')
+            # The test table is small; make the planner show which index it would use
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+
+    def test_list_uses_active_index(self):
+        queryset = (
+            Notification.objects
+            .filter(recipient=self.user, is_deleted=False)
+            .order_by('-created_at')[:20]
+        )
+        self.assertUsesIndex(queryset, 'notif_recipient_active_idx')
+
+    def test_unread_count_uses_unread_index(self):
+        queryset = Notification.objects.filter(recipient=self.user, is_read=False, is_deleted=False)
+        self.assertUsesIndex(queryset, 'notif_recipient_unread_idx')
+
+    def test_summary_uses_active_index(self):
+        queryset = (
+            Notification.objects
+            .filter(recipient=self.user, is_deleted=False)
+            .values('notification_type')
+            .annotate(total=Count('id'), unread=Count('id', filter=Q(is_read=False)))
+            .order_by()
+        )
+        self.assertUsesIndex(queryset, 'notif_recipient_active_idx')